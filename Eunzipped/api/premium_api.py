@@ -14,11 +14,14 @@ import os
 import sys
 
 sys.path.append('..')
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+from core.migrations import run_migrations
+from core.leaderboard import get_leaderboard as leaderboard_service
 
 api_bp = Blueprint('api', __name__)
 
 DB_FILE = '../taylor_62.db'
-LEADERBOARD_FILE = '../leaderboard/data/all_time_tusg.json'
 
 TEAM_PACE = {
     'ATL': 101.8, 'BOS': 99.3, 'BKN': 100.5, 'CHA': 99.8, 'CHI': 98.5, 'CLE': 97.2,
@@ -35,7 +38,7 @@ RATE_LIMITS = {
 
 def init_api_database():
     """Initialize API-specific database tables"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -69,11 +72,12 @@ def init_api_database():
     ''')
     
     conn.commit()
+    run_migrations(conn, 'premium_api')
     conn.close()
 
 def get_db_connection():
     """Get database connection"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -237,10 +241,9 @@ def calculate_player_pvr(player_stats):
     return round(pvr, 2)
 
 def load_leaderboard_data():
-    """Load historical leaderboard data"""
+    """Historical leaderboard rows (the shared in-memory copy, do not mutate)"""
     try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            return json.load(f)
+        return leaderboard_service().rows()
     except Exception as e:
         return []
 
@@ -256,11 +259,7 @@ def get_player(player_name):
         
         player_name_lower = player_name.lower().replace('_', ' ').replace('-', ' ')
         
-        player_data = None
-        for player in leaderboard:
-            if player['player'].lower() == player_name_lower:
-                player_data = player
-                break
+        player_data = leaderboard_service().find(player_name_lower) if leaderboard else None
         
         if not player_data:
             return jsonify({
@@ -314,13 +313,7 @@ def get_leaderboard():
                 'message': 'Metric must be either "tusg" or "pvr"'
             }), 400
         
-        leaderboard = load_leaderboard_data()
-        
-        sorted_leaderboard = sorted(
-            leaderboard, 
-            key=lambda x: x[metric], 
-            reverse=True
-        )[:limit]
+        sorted_leaderboard = leaderboard_service().top(metric, limit) if load_leaderboard_data() else []
         
         return jsonify({
             'metric': metric,
@@ -412,16 +405,13 @@ def compare_players():
                 'message': 'Both p1 and p2 parameters are required'
             }), 400
         
-        leaderboard = load_leaderboard_data()
-        
         player1_data = None
         player2_data = None
         
-        for player in leaderboard:
-            if player['player'].lower() == player1_name:
-                player1_data = player
-            if player['player'].lower() == player2_name:
-                player2_data = player
+        if load_leaderboard_data():
+            # A player's last listed season, as the old full scan picked
+            player1_data = next(reversed(leaderboard_service().player_rows(player1_name)), None)
+            player2_data = next(reversed(leaderboard_service().player_rows(player2_name)), None)
         
         if not player1_data:
             return jsonify({
@@ -492,18 +482,12 @@ def get_historical(player_name, season):
         
         leaderboard = load_leaderboard_data()
         
-        player_data = None
-        for player in leaderboard:
-            if (player['player'].lower() == player_name_lower and 
-                player['season'] == season):
-                player_data = player
-                break
+        player_data = leaderboard_service().find(player_name_lower, season) if leaderboard else None
         
         if not player_data:
             matching_seasons = [
-                p['season'] for p in leaderboard 
-                if p['player'].lower() == player_name_lower
-            ]
+                p['season'] for p in leaderboard_service().player_rows(player_name_lower)
+            ] if leaderboard else []
             
             return jsonify({
                 'error': 'Data not found',
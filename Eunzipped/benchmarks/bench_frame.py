@@ -0,0 +1,115 @@
+"""
+TAYLOR VECTOR TERMINAL - PlayerFrame Benchmark
+Memory per snapshot and filter/sort/metrics time of a columnar PlayerFrame versus
+the list of per-player stat dicts it replaces
+
+Usage: python benchmarks/bench_frame.py [--sizes 540 54000 540000]
+
+Memory is what each form keeps alive after it is built (tracemalloc), both from the
+same parsed playertotals rows, so shared strings are counted once for each form.
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.metrics import MIN_MINUTES, TEAM_PACE, calculate_player_tusg, calculate_player_pvr
+from core.minutes import parse_minutes
+from core.player_frame import PlayerFrame
+from fake_upstream import build_players
+
+
+def stat_records(size):
+    """Per-game stat dicts shaped like main.parse_player_totals output"""
+    players = build_players(size)
+    minutes, _ = parse_minutes([player['minutesPg'] for player in players])
+    records = []
+    for player, mpg in zip(players, minutes.tolist()):
+        games = player['games']
+        records.append({
+            'player_id': player['slug'],
+            'player_name': player['playerName'],
+            'team': player['team'],
+            'games_played': games,
+            'min': mpg,
+            'pts': player['points'] / games,
+            'ast': player['assists'] / games,
+            'tov': player['turnovers'] / games,
+            'fga': player['fieldAttempts'] / games,
+            'fta': player['ftAttempts'] / games
+        })
+    return records
+
+
+def retained_bytes(build):
+    """Bytes still allocated once build() returns (its result kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def time_it(func, repeat=5):
+    """Best of `repeat` runs, in milliseconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def dict_workload(records):
+    qualified = [p for p in records if p.get('min', 0) >= MIN_MINUTES]
+    ranked = sorted(qualified, key=lambda p: p['pts'], reverse=True)
+    return [(calculate_player_tusg(p, TEAM_PACE.get(p['team'], 99.5)), calculate_player_pvr(p)) for p in ranked]
+
+
+def frame_workload(frame):
+    ranked = frame.filter(frame['min'] >= MIN_MINUTES).sort_by('pts', descending=True)
+    metrics = ranked.metrics()
+    return metrics['tusg'], metrics['pvr']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[540, 54_000, 540_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'dicts B/row':>12} {'frame B/row':>12} {'memory':>8} "
+          f"{'dicts ms':>10} {'frame ms':>10} {'speedup':>8}")
+    for size in args.sizes:
+        # Both forms are measured from a private copy of the parsed rows so neither
+        # gets the other's strings for free
+        dict_bytes, records = retained_bytes(lambda: stat_records(size))
+        frame_bytes, frame = retained_bytes(lambda: PlayerFrame.from_records(stat_records(size)))
+
+        expected = dict_workload(records)
+        tusg, pvr = frame_workload(frame)
+        assert [t for t, _ in expected] == tusg.tolist(), 'TUSG% mismatch'
+        assert [p for _, p in expected] == pvr.tolist(), 'PVR mismatch'
+
+        dict_ms = time_it(lambda: dict_workload(records))
+        # A fresh frame each run so the cached metrics are recomputed
+        frame_ms = time_it(lambda: frame_workload(PlayerFrame(dict(frame.columns), frame.numeric)))
+
+        print(f"{size:>9,} {dict_bytes / size:>12,.0f} {frame_bytes / size:>12,.0f} "
+              f"{dict_bytes / frame_bytes:>7.1f}x {dict_ms:>10.2f} {frame_ms:>10.2f} {dict_ms / frame_ms:>7.1f}x")
+        del records, frame
+    print(f"(workload: filter min >= {MIN_MINUTES}, sort by points, TUSG%/PVR for every remaining player)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""
+TAYLOR VECTOR TERMINAL - Season Stats Ingestion Benchmark
+Compares sequential vs concurrent playertotals ingestion against the local fake upstream
+
+Usage: python benchmarks/bench_ingest.py [--players 540] [--latency 0.25] [--runs 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from fake_upstream import FakeUpstream, load_fixtures, start_fake_upstream, upstream_env
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--players', type=int, default=540)
+    parser.add_argument('--latency', type=float, default=0.25, help='fake upstream latency per request (seconds)')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    server = start_fake_upstream(FakeUpstream(load_fixtures(players=args.players), latency=args.latency))
+    os.environ.update(upstream_env(server))
+    os.environ.setdefault('STATS_RATE_LIMIT', '0')
+
+    import logging
+    import main as terminal
+    logging.getLogger().setLevel(logging.WARNING)
+
+    print(f"Fake upstream: {args.players} players, {args.latency * 1000:.0f}ms latency, "
+          f"{terminal.STATS_MAX_WORKERS} workers")
+
+    results = {}
+    for mode in ('sequential', 'concurrent'):
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            stats = terminal.get_player_season_averages(2025, mode=mode)
+            timings.append(time.perf_counter() - start)
+        results[mode] = (min(timings), stats)
+        print(f"{mode:>11}: best {min(timings):.3f}s over {args.runs} runs ({len(stats)} players)")
+
+    assert results['sequential'][1] == results['concurrent'][1], 'modes returned different stats'
+    print(f"    speedup: {results['sequential'][0] / results['concurrent'][0]:.1f}x")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+TAYLOR VECTOR TERMINAL - Metrics Engine Benchmark
+Throughput of scalar vs vectorized TUSG%/PVR at 500, 50k and 5M player-seasons
+
+Usage: python benchmarks/bench_metrics.py [--sizes 500 50000 5000000]
+
+Scalar timings above --scalar-limit rows are extrapolated from a sample, and every
+size checks that the vectorized results are bit-for-bit identical to the scalar ones.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.metrics import TEAM_PACE, calculate_player_tusg, calculate_player_pvr
+from core.metrics_engine import compute_player_metrics
+
+
+def synthetic_columns(size, seed=62):
+    """Random per-game stat lines with the edge cases the formulas guard against"""
+    rng = np.random.default_rng(seed)
+    columns = {
+        'min': rng.uniform(0, 42, size),
+        'pts': rng.uniform(0, 35, size),
+        'ast': rng.uniform(0, 12, size),
+        'tov': rng.uniform(0, 5, size),
+        'fga': rng.uniform(0, 25, size),
+        'fta': rng.uniform(0, 10, size)
+    }
+    columns['min'][rng.random(size) < 0.02] = 0.0
+    columns['tov'][rng.random(size) < 0.05] = 0.0
+    columns['ast'][rng.random(size) < 0.05] = 0.0
+    pace = rng.choice(np.array(list(TEAM_PACE.values())), size)
+    return columns, pace
+
+
+def scalar_metrics(columns, pace, rows):
+    """Run the scalar formulas player by player over the given rows"""
+    keys = list(columns)
+    tusg_values, pvr_values = [], []
+    for i in rows:
+        player = {key: float(columns[key][i]) for key in keys}
+        tusg_values.append(calculate_player_tusg(player, float(pace[i])))
+        pvr_values.append(calculate_player_pvr(player))
+    return tusg_values, pvr_values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 50_000, 5_000_000])
+    parser.add_argument('--scalar-limit', type=int, default=50_000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'scalar rows/s':>15} {'vector rows/s':>15} {'speedup':>9}")
+    for size in args.sizes:
+        columns, pace = synthetic_columns(size)
+
+        start = time.perf_counter()
+        metrics = compute_player_metrics(columns, pace)
+        vector_time = time.perf_counter() - start
+
+        rows = np.arange(size) if size <= args.scalar_limit else \
+            np.random.default_rng(0).choice(size, args.scalar_limit, replace=False)
+        start = time.perf_counter()
+        tusg_values, pvr_values = scalar_metrics(columns, pace, rows)
+        scalar_time = (time.perf_counter() - start) * size / len(rows)
+
+        assert metrics['tusg'][rows].tolist() == tusg_values, 'TUSG% mismatch'
+        assert metrics['pvr'][rows].tolist() == pvr_values, 'PVR mismatch'
+
+        estimated = '' if len(rows) == size else ' (scalar est.)'
+        print(f"{size:>10,} {size / scalar_time:>15,.0f} {size / vector_time:>15,.0f} "
+              f"{scalar_time / vector_time:>8.0f}x{estimated}")
+
+
+if __name__ == '__main__':
+    main()
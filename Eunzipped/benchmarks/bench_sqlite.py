@@ -0,0 +1,136 @@
+"""
+TAYLOR VECTOR TERMINAL - SQLite Concurrency Benchmark
+One terminal-style writer upserting picks while dashboard-style reader processes run
+the /api/stats and /api/picks queries, with a fresh sqlite3.connect per operation
+(rollback journal) versus pooled WAL connections from core.db
+
+Usage: python benchmarks/bench_sqlite.py [--readers 4] [--seconds 3] [--batch 50]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.db import get_connection
+
+SCHEMA = '''
+    CREATE TABLE picks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        game TEXT, pick TEXT, edge REAL, spread REAL, market TEXT DEFAULT 'spreads',
+        pick_side TEXT, pick_date TEXT,
+        UNIQUE(game, market, pick_side, pick_date)
+    )
+'''
+READ_QUERIES = (
+    'SELECT COUNT(*) FROM picks',
+    'SELECT AVG(edge) FROM picks',
+    'SELECT MAX(edge) FROM picks',
+    'SELECT * FROM picks ORDER BY timestamp DESC LIMIT 1',
+    'SELECT * FROM picks ORDER BY timestamp DESC LIMIT 50'
+)
+
+
+def connect(mode, path):
+    return get_connection(path) if mode == 'pooled' else sqlite3.connect(path)
+
+
+def reader(mode, path, seconds, results):
+    latencies, errors = [], 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            conn = connect(mode, path)
+            for query in READ_QUERIES:
+                conn.execute(query).fetchall()
+            conn.close()
+            latencies.append(time.perf_counter() - start)
+        except sqlite3.OperationalError:
+            errors += 1
+    results.put(('reader', latencies, errors))
+
+
+def writer(mode, path, seconds, batch, results):
+    """A cycle's worth of pick upserts per transaction, with a little work between writes"""
+    latencies, errors, cycle = [], 0, 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            conn = connect(mode, path)
+            for game in range(batch):
+                conn.execute('''
+                    INSERT INTO picks (game, pick, edge, spread, pick_side, pick_date) VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(game, market, pick_side, pick_date) DO UPDATE SET edge = excluded.edge
+                ''', (f'game {game}', 'Home -3.5', 60 + (cycle + game) % 30, -3.5, 'home', f'day {cycle // 20}'))
+                time.sleep(0.0002)
+            conn.commit()
+            conn.close()
+            latencies.append(time.perf_counter() - start)
+        except sqlite3.OperationalError:
+            errors += 1
+        cycle += 1
+    results.put(('writer', latencies, errors))
+
+
+def percentile(values, p):
+    if not values:
+        return float('nan')
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def run(mode, readers, seconds, batch):
+    path = os.path.join(tempfile.mkdtemp(), f'{mode}.db')
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    conn.commit()
+    conn.close()
+
+    results = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=writer, args=(mode, path, seconds, batch, results))]
+    procs += [multiprocessing.Process(target=reader, args=(mode, path, seconds, results)) for _ in range(readers)]
+    for proc in procs:
+        proc.start()
+    collected = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+
+    read_latencies = [value for kind, values, _ in collected if kind == 'reader' for value in values]
+    write_latencies = [value for kind, values, _ in collected if kind == 'writer' for value in values]
+    return {
+        'reads/s': len(read_latencies) / seconds,
+        'read p99 ms': percentile(read_latencies, 99) * 1000,
+        'read max ms': max(read_latencies, default=float('nan')) * 1000,
+        'writes/s': len(write_latencies) / seconds,
+        'write p99 ms': percentile(write_latencies, 99) * 1000,
+        'locked errors': sum(errors for _, _, errors in collected)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--readers', type=int, default=4, help='reader processes (gunicorn workers)')
+    parser.add_argument('--seconds', type=float, default=3.0)
+    parser.add_argument('--batch', type=int, default=50, help='pick upserts per writer transaction')
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers + 1 writer ({args.batch} upserts/transaction), {args.seconds:.0f}s per mode")
+    results = {mode: run(mode, args.readers, args.seconds, args.batch) for mode in ('connect', 'pooled')}
+    print(f"{'':>14} {'connect':>10} {'pooled':>10}")
+    for metric in results['connect']:
+        print(f"{metric:>14} {results['connect'][metric]:>10,.1f} {results['pooled'][metric]:>10,.1f}")
+    print(f"  read speedup: {results['pooled']['reads/s'] / max(results['connect']['reads/s'], 1e-9):.1f}x, "
+          f"write speedup: {results['pooled']['writes/s'] / max(results['connect']['writes/s'], 1e-9):.1f}x")
+
+
+if __name__ == '__main__':
+    main()
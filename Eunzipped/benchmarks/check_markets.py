@@ -0,0 +1,69 @@
+"""
+TAYLOR VECTOR TERMINAL - Market Picks Check
+Runs one analyze() cycle against the local fake upstream on a scratch database and
+fails unless every expected market produced at least one pick
+
+Usage: python benchmarks/check_markets.py [--games 30] [--expect spreads,totals]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from fake_upstream import FakeUpstream, load_fixtures, start_fake_upstream, upstream_env
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=30, help='games on the generated slate')
+    parser.add_argument('--expect', default='totals', help='markets that must produce a pick')
+    args = parser.parse_args()
+
+    server = start_fake_upstream(FakeUpstream(load_fixtures(games=args.games)))
+    os.environ.update(upstream_env(server))
+    os.environ.setdefault('STATS_RATE_LIMIT', '0')
+
+    import main as terminal
+    from core.line_store import LineStore
+    from core.profiler import CycleProfiler
+    from core.scheduler import PollScheduler
+    logging.getLogger().setLevel(logging.WARNING)
+
+    # Everything the cycle writes goes to the scratch dir, never the live terminal's cache/
+    scratch = tempfile.mkdtemp(prefix='tvt_check_')
+    terminal.DB_FILE = os.path.join(scratch, 'check.db')
+    terminal.line_store = LineStore(terminal.DB_FILE)
+    terminal.poll_scheduler = PollScheduler(terminal.ODDS_DAILY_BUDGET, status_path=os.path.join(scratch, 'scheduler.json'),
+                                            poll_cost=len(terminal.ODDS_MARKETS.split(',')))
+    terminal.cycle_profiler = CycleProfiler(metrics_path=os.path.join(scratch, 'cycle_metrics.json'))
+    terminal.season_stats_cache.cache_dir = None
+    terminal.init_database()
+    terminal.analyze()
+
+    conn = terminal.get_connection(terminal.DB_FILE)
+    rows = conn.execute('SELECT market, pick, round(edge, 1) FROM picks ORDER BY market, edge DESC').fetchall()
+    conn.close()
+    server.shutdown()
+
+    by_market = {}
+    for market, pick, edge in rows:
+        by_market.setdefault(market, []).append((pick, edge))
+    for market in terminal.ODDS_MARKETS.split(','):
+        picks = by_market.get(market, [])
+        best = f", best {picks[0][0]} at {picks[0][1]}%" if picks else ''
+        print(f"{market:>8}: {len(picks)} picks (threshold {terminal.MARKET_MIN_EDGE[market]}%{best})")
+
+    missing = [market for market in args.expect.split(',') if market and not by_market.get(market)]
+    if missing:
+        print(f"❌ No picks for: {', '.join(missing)}")
+        sys.exit(1)
+    print(f"✅ Picks for every expected market ({args.expect})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+TAYLOR VECTOR TERMINAL - Poll Scheduler Slate Check
+Simulates a full UTC day of odds polling against PollScheduler on a fake clock and
+fails unless the daily budget lasts until midnight and every game's fast window (tip-off
+minus NEAR_TIPOFF until it has been live for LIVE_WINDOW) is polled at the fast interval
+when the budget covers the day's demand, at the active interval when it covers that, and
+never slower than an even spread of the budget over the day
+
+Usage: python benchmarks/check_scheduler.py [--budget 500] [--markets 3]
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.scheduler import ACTIVE_INTERVAL, FAST_INTERVAL, MAX_INTERVAL, PollScheduler
+
+DAY = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+# name: (tip-offs as hours after 00:00 UTC, whether lines move on every poll)
+SLATES = {
+    'single late game': ([23.5], False),
+    'evening slate': ([23.0, 23.5, 23.5, 24.0, 26.0], False),
+    'evening, lines moving': ([23.0, 23.5, 23.5, 24.0, 26.0], True),
+    'afternoon and night': ([17.0, 19.5, 23.5], False),
+    'early tip-off': ([5.0], True),
+    'no games': ([], False),
+}
+
+
+def simulate(tipoffs, lines_moving, budget, markets):
+    """
+    Poll through DAY on a fake clock; returns the scheduler as it stood after the first poll
+    and [(time, interval, reason)] for every poll
+    """
+    clock = {'now': DAY.timestamp()}
+    scheduler = PollScheduler(budget, clock=lambda: clock['now'], poll_cost=markets)
+    games = [{'commence_time': (DAY + timedelta(hours=hours)).isoformat().replace('+00:00', 'Z')}
+             for hours in tipoffs]
+    day_end = (DAY + timedelta(days=1)).timestamp()
+
+    polls = []
+    first = None
+    while clock['now'] < day_end:
+        scheduler.record_request(cost=markets)
+        scheduler.observe(games, lines_moved=lines_moving)
+        if first is None:
+            first = (scheduler.fast_windows(), scheduler.demand(), scheduler.polls_left)
+        interval = scheduler.plan()
+        polls.append((clock['now'], interval, scheduler.reason))
+        clock['now'] += interval
+    return first, polls
+
+
+def check(name, tipoffs, lines_moving, budget, markets):
+    (windows, demand, polls_left), polls = simulate(tipoffs, lines_moving, budget, markets)
+    day_end = (DAY + timedelta(days=1)).timestamp()
+    problems = []
+
+    spent = len(polls) * markets
+    if spent > budget:
+        problems.append(f"spent {spent} credits of {budget}")
+    exhausted = [t for t, _, reason in polls if reason == 'daily budget exhausted' and day_end - t > FAST_INTERVAL]
+    if exhausted:
+        problems.append(f"budget exhausted at {datetime.fromtimestamp(exhausted[0], timezone.utc):%H:%M}")
+
+    windowed = sum(end - start for start, end in windows)
+    if demand <= polls_left:
+        limit = FAST_INTERVAL
+    elif windowed / ACTIVE_INTERVAL + (day_end - DAY.timestamp() - windowed) / MAX_INTERVAL <= polls_left:
+        limit = ACTIVE_INTERVAL
+    else:
+        limit = (day_end - DAY.timestamp()) / polls_left
+    slow = [(t, interval) for t, interval, _ in polls
+            if any(start <= t < end for start, end in windows) and round(interval) > limit]
+    if slow:
+        t, interval = slow[0]
+        problems.append(f"{interval:.0f}s interval at {datetime.fromtimestamp(t, timezone.utc):%H:%M:%S} "
+                        f"inside a fast window (limit {limit:.0f}s)")
+
+    fast = sum(1 for _, interval, _ in polls if round(interval) <= FAST_INTERVAL)
+    print(f"{name:>22}: {len(polls):>3} polls, {spent:>3}/{budget} credits, {fast:>3} at {FAST_INTERVAL}s"
+          f"{'' if not problems else ' ❌ ' + '; '.join(problems)}")
+    return not problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget', type=int, default=500, help='daily credit budget')
+    parser.add_argument('--markets', type=int, default=3, help='credits billed per poll (one per market)')
+    args = parser.parse_args()
+
+    results = [check(name, tipoffs, lines_moving, args.budget, args.markets)
+               for name, (tipoffs, lines_moving) in SLATES.items()]
+    if not all(results):
+        sys.exit(1)
+    print("✅ Every slate stayed within budget")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,335 @@
+"""
+TAYLOR VECTOR TERMINAL - Fake Upstream Server
+Local stand-in for The Odds API, the nbaapi playertotals endpoint and balldontlie v1,
+so load tests and benchmarks can run entirely offline
+
+Usage: python benchmarks/fake_upstream.py [--port 8765] [--latency 0.05] [--error-rate 0.02]
+                                          [--page-size 100] [--fixtures DIR | --recording LOG]
+
+Point the terminal, web app and premium modules at it with the printed environment:
+    ODDS_API_BASE_URL=http://127.0.0.1:8765/v4
+    NBA_STATS_URL=http://127.0.0.1:8765/api/playertotals
+    BALLDONTLIE_BASE_URL=http://127.0.0.1:8765/api/v1
+
+Fixtures come from a directory of JSON files (odds.json, playertotals.json,
+bdl_players.json, bdl_season_averages.json), from a terminal recording made with
+TERMINAL_RECORD_PATH, or are generated deterministically when neither is given.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_ROOT)
+
+from core.metrics import TEAM_MAPPING
+
+TEAMS = sorted(TEAM_MAPPING.values())
+TEAM_NAMES = {abbr: name for name, abbr in TEAM_MAPPING.items()}
+BOOKMAKERS = ('fanduel', 'draftkings', 'betmgm', 'caesars')
+FIXTURE_FILES = ('odds', 'playertotals', 'bdl_players', 'bdl_season_averages')
+
+ODDS_PATH = '/v4/sports/basketball_nba/odds/'
+PLAYERTOTALS_PATH = '/api/playertotals'
+BDL_PLAYERS_PATH = '/api/v1/players'
+BDL_SEASON_AVERAGES_PATH = '/api/v1/season_averages'
+
+
+def build_players(count):
+    """Deterministic nbaapi playertotals rows"""
+    players = []
+    for i in range(count):
+        games = 10 + i % 60
+        players.append({
+            'slug': f'player{i:04d}',
+            'playerName': f'Player {i}',
+            'team': TEAMS[i % len(TEAMS)],
+            'games': games,
+            'minutesPg': f"{12 + i % 24}:{i % 60:02d}",
+            'points': games * (5 + i % 25),
+            'assists': games * (1 + i % 9),
+            'turnovers': games * (1 + i % 4),
+            'fieldAttempts': games * (4 + i % 18),
+            'ftAttempts': games * (1 + i % 7)
+        })
+    return players
+
+
+def build_odds(games, seed=62):
+    """A slate of Odds API events with spreads, totals and h2h from every bookmaker"""
+    rng = random.Random(seed)
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(hours=2)
+    events = []
+    for i in range(games):
+        home, away = TEAMS[(2 * i) % len(TEAMS)], TEAMS[(2 * i + 1) % len(TEAMS)]
+        home_team, away_team = TEAM_NAMES[home], TEAM_NAMES[away]
+        spread = rng.choice([-9.5, -7.5, -5.5, -3.5, -1.5, 1.5, 3.5, 5.5])
+        total = rng.choice([216.5, 221.5, 226.5, 231.5, 236.5])
+        bookmakers = []
+        for book in BOOKMAKERS:
+            point = spread + rng.choice([-0.5, 0, 0, 0.5])
+            home_ml = -110 - int(abs(point) * 20) if point < 0 else 100 + int(point * 18)
+            away_ml = 100 + int(abs(point) * 18) if point < 0 else -110 - int(point * 20)
+            line = total + rng.choice([-0.5, 0, 0.5])
+            bookmakers.append({'key': book, 'title': book.title(), 'markets': [
+                {'key': 'spreads', 'outcomes': [{'name': home_team, 'price': -110, 'point': point},
+                                                {'name': away_team, 'price': -110, 'point': -point}]},
+                {'key': 'totals', 'outcomes': [{'name': 'Over', 'price': -110, 'point': line},
+                                               {'name': 'Under', 'price': -110, 'point': line}]},
+                {'key': 'h2h', 'outcomes': [{'name': home_team, 'price': home_ml},
+                                            {'name': away_team, 'price': away_ml}]}
+            ]})
+        events.append({
+            'id': f'fake{i:04d}',
+            'sport_key': 'basketball_nba',
+            'commence_time': (start + timedelta(minutes=30 * (i // 3))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'home_team': home_team,
+            'away_team': away_team,
+            'bookmakers': bookmakers
+        })
+    return events
+
+
+def bdl_from_playertotals(players):
+    """balldontlie players and season averages mirroring a playertotals fixture"""
+    bdl_players, averages = [], []
+    for i, player in enumerate(players, start=1):
+        first, _, last = (player.get('playerName') or f'Player {i}').partition(' ')
+        team = player.get('team')
+        bdl_players.append({
+            'id': i,
+            'first_name': first,
+            'last_name': last,
+            'team': {'abbreviation': team, 'full_name': TEAM_NAMES.get(team, team)}
+        })
+        games = player.get('games') or 1
+        averages.append({
+            'player_id': i,
+            'games_played': games,
+            'min': player.get('minutesPg', '0:00'),
+            'pts': player.get('points', 0) / games,
+            'ast': player.get('assists', 0) / games,
+            'turnovers': player.get('turnovers', 0) / games,
+            'fga': player.get('fieldAttempts', 0) / games,
+            'fta': player.get('ftAttempts', 0) / games
+        })
+    return bdl_players, averages
+
+
+def fixtures_from_recording(path):
+    """Odds payload and playertotals rows captured by the terminal's recorder"""
+    from core.replay import read_log
+
+    _, cycles = read_log(path)
+    odds, pages = None, {}
+    for _, responses in cycles:
+        for event in responses:
+            if event['status'] != 200:
+                continue
+            parts = urlsplit(event['url'])
+            if parts.path.endswith('/odds/'):
+                odds = json.loads(event['body'])
+            elif parts.path.endswith('/playertotals'):
+                page = int(parse_qs(parts.query).get('page', ['1'])[0])
+                pages.setdefault(page, json.loads(event['body']).get('data', []))
+    players = [row for page in sorted(pages) for row in pages[page]]
+    return {'odds': odds, 'playertotals': players or None}
+
+
+def load_fixtures(fixtures_dir=None, recording=None, players=540, games=10, seed=62):
+    """Fixture set from a directory or recording, generating whatever is missing"""
+    fixtures = dict.fromkeys(FIXTURE_FILES)
+    if recording:
+        fixtures.update(fixtures_from_recording(recording))
+    if fixtures_dir:
+        for name in FIXTURE_FILES:
+            path = os.path.join(fixtures_dir, f'{name}.json')
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    fixtures[name] = json.load(f)
+
+    if fixtures['odds'] is None:
+        fixtures['odds'] = build_odds(games, seed)
+    if fixtures['playertotals'] is None:
+        fixtures['playertotals'] = build_players(players)
+    if fixtures['bdl_players'] is None or fixtures['bdl_season_averages'] is None:
+        bdl_players, averages = bdl_from_playertotals(fixtures['playertotals'])
+        fixtures['bdl_players'] = fixtures['bdl_players'] or bdl_players
+        fixtures['bdl_season_averages'] = fixtures['bdl_season_averages'] or averages
+    return fixtures
+
+
+class FakeUpstream:
+    """Request handling shared by every fake endpoint: latency, injected errors, pagination"""
+
+    def __init__(self, fixtures, latency=0.0, jitter=0.0, error_rate=0.0, throttle_rate=0.0,
+                 page_size=None, odds_quota=500, seed=62):
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.page_size = page_size
+        self.odds_remaining = odds_quota
+        self.requests = Counter()
+        self.errors = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._averages = {row['player_id']: row for row in fixtures['bdl_season_averages']}
+
+    def _page(self, rows, page, size):
+        size = max(1, min(size, self.page_size or size))
+        return rows[(page - 1) * size:page * size], size
+
+    def handle(self, path, query):
+        """(status, headers, body) for one GET"""
+        if path == '/_stats':
+            return 200, {}, {'requests': dict(self.requests), 'errors': dict(self.errors),
+                             'odds_remaining': self.odds_remaining}
+
+        with self._lock:
+            self.requests[path] += 1
+            roll = self._rng.random()
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+        time.sleep(delay)
+
+        if roll < self.throttle_rate:
+            self.errors[path] += 1
+            return 429, {'Retry-After': '1'}, {'message': 'Too many requests'}
+        if roll < self.throttle_rate + self.error_rate:
+            self.errors[path] += 1
+            return 500, {}, {'message': 'Injected upstream error'}
+
+        if path == ODDS_PATH:
+            markets = set((query.get('markets', ['spreads'])[0]).split(','))
+            with self._lock:
+                self.odds_remaining = max(0, self.odds_remaining - len(markets))
+                remaining = self.odds_remaining
+            games = [
+                {**game, 'bookmakers': [
+                    {**book, 'markets': [m for m in book['markets'] if m['key'] in markets]}
+                    for book in game['bookmakers']
+                ]}
+                for game in self.fixtures['odds']
+            ]
+            return 200, {'x-requests-remaining': str(remaining)}, games
+
+        if path == PLAYERTOTALS_PATH:
+            page = int(query.get('page', ['1'])[0])
+            size = int(query.get('pageSize', ['100'])[0])
+            rows, _ = self._page(self.fixtures['playertotals'], page, size)
+            return 200, {}, {'data': rows}
+
+        if path == BDL_PLAYERS_PATH:
+            players = self.fixtures['bdl_players']
+            page = int(query.get('page', ['1'])[0])
+            rows, size = self._page(players, page, int(query.get('per_page', ['25'])[0]))
+            total_pages = (len(players) + size - 1) // size
+            return 200, {}, {'data': rows, 'meta': {
+                'total_pages': total_pages,
+                'current_page': page,
+                'next_page': page + 1 if page < total_pages else None,
+                'per_page': size,
+                'total_count': len(players)
+            }}
+
+        if path == BDL_SEASON_AVERAGES_PATH:
+            ids = [int(x) for x in query.get('player_ids[]', []) if x.isdigit()]
+            return 200, {}, {'data': [self._averages[i] for i in ids if i in self._averages]}
+
+        return 404, {}, {'message': f'No fake endpoint for {path}'}
+
+
+def start_fake_upstream(upstream, host='127.0.0.1', port=0):
+    """Serve a FakeUpstream on a background thread; returns the server"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            status, headers, payload = upstream.handle(parts.path, parse_qs(parts.query))
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def upstream_env(server):
+    """Environment variables that point every module at a running fake upstream"""
+    base = f"http://{server.server_address[0]}:{server.server_port}"
+    return {
+        'ODDS_API_BASE_URL': f'{base}/v4',
+        'NBA_STATS_URL': f'{base}{PLAYERTOTALS_PATH}',
+        'BALLDONTLIE_BASE_URL': f'{base}/api/v1'
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='± seconds of random latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of requests answered with 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='fraction answered with 429')
+    parser.add_argument('--page-size', type=int, help='server-side cap on pageSize/per_page')
+    parser.add_argument('--odds-quota', type=int, default=500, help='starting x-requests-remaining')
+    parser.add_argument('--players', type=int, default=540, help='generated players when no fixture is given')
+    parser.add_argument('--games', type=int, default=10, help='generated games when no fixture is given')
+    parser.add_argument('--seed', type=int, default=62)
+    parser.add_argument('--fixtures', help='directory of odds/playertotals/bdl_*.json fixtures')
+    parser.add_argument('--recording', help='terminal recording (TERMINAL_RECORD_PATH) to serve from')
+    parser.add_argument('--dump-fixtures', help='write the fixture set to this directory and exit')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures, args.recording, args.players, args.games, args.seed)
+    if args.dump_fixtures:
+        os.makedirs(args.dump_fixtures, exist_ok=True)
+        for name, data in fixtures.items():
+            with open(os.path.join(args.dump_fixtures, f'{name}.json'), 'w') as f:
+                json.dump(data, f, indent=1)
+        print(f"Wrote {len(fixtures)} fixtures to {args.dump_fixtures}")
+        return
+
+    upstream = FakeUpstream(fixtures, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                            throttle_rate=args.throttle_rate, page_size=args.page_size,
+                            odds_quota=args.odds_quota, seed=args.seed)
+    server = start_fake_upstream(upstream, args.host, args.port)
+    print(f"Fake upstream on http://{args.host}:{server.server_port} "
+          f"({len(fixtures['odds'])} games, {len(fixtures['playertotals'])} players)")
+    for key, value in upstream_env(server).items():
+        print(f"export {key}={value}")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"Served {sum(upstream.requests.values())} requests "
+              f"({sum(upstream.errors.values())} injected errors)")
+
+
+if __name__ == '__main__':
+    main()
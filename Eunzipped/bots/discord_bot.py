@@ -10,15 +10,19 @@ Requires Discord Bot Token:
 import discord
 from discord import app_commands
 from discord.ext import tasks
-import sqlite3
 import json
 import os
 import logging
-import requests
+import sys
 import time
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+from core.leaderboard import get_leaderboard
+from core.warehouse import get_warehouse
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -26,7 +30,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 DB_FILE = 'taylor_62.db'
-LEADERBOARD_FILE = 'leaderboard/data/all_time_tusg.json'
 POSTED_PICKS_FILE = 'bots/discord_posted_picks.json'
 MIN_EDGE_FOR_ALERT = 65.0
 
@@ -97,7 +100,7 @@ class TaylorVectorBot(discord.Client):
     def _get_system_status(self) -> tuple[str, str]:
         """Check if system is LIVE or OFFLINE based on last DB update"""
         try:
-            conn = sqlite3.connect(DB_FILE)
+            conn = get_connection(DB_FILE)
             cursor = conn.cursor()
             cursor.execute('SELECT MAX(timestamp) FROM picks')
             result = cursor.fetchone()
@@ -118,16 +121,9 @@ class TaylorVectorBot(discord.Client):
             return "⚠️ UNKNOWN", "Database error"
     
     def _fetch_player_stats(self, player_name: str, season: int = 2025) -> Optional[Dict]:
-        """Fetch player stats from nbaStats API"""
+        """Look up player stats in the local player warehouse"""
         try:
-            url = f"https://api.server.nbaapi.com/api/playertotals?season={season}"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            players = data.get('data', [])
+            players = get_warehouse().season(season, min_games=1)
             
             player_name_lower = player_name.lower()
             
@@ -135,16 +131,13 @@ class TaylorVectorBot(discord.Client):
                 full_name = player.get('playerName', '').lower()
                 if player_name_lower in full_name or full_name in player_name_lower:
                     games = player.get('games', 0)
-                    if games == 0:
-                        continue
-                    
                     team_abbr = player.get('team', 'UNK')
                     
                     return {
                         'player_name': player.get('playerName'),
                         'team': team_abbr,
                         'games_played': games,
-                        'min': player.get('minutesPg', 0),
+                        'min': player.get('minutes', 0),
                         'pts': player.get('points', 0) / games,
                         'ast': player.get('assists', 0) / games,
                         'tov': player.get('turnovers', 0) / games,
@@ -420,7 +413,7 @@ class TaylorVectorBot(discord.Client):
             await interaction.response.defer()
             
             try:
-                conn = sqlite3.connect(DB_FILE)
+                conn = get_connection(DB_FILE)
                 cursor = conn.cursor()
                 
                 cursor.execute('''
@@ -494,10 +487,7 @@ class TaylorVectorBot(discord.Client):
             await interaction.response.defer()
             
             try:
-                with open(LEADERBOARD_FILE, 'r') as f:
-                    leaderboard = json.load(f)
-                
-                top_10 = leaderboard[:10]
+                top_10 = get_leaderboard().rows()[:10]
                 
                 status_emoji, status_text = self._get_system_status()
                 
@@ -572,7 +562,7 @@ class TaylorVectorBot(discord.Client):
             return
         
         try:
-            conn = sqlite3.connect(DB_FILE)
+            conn = get_connection(DB_FILE)
             cursor = conn.cursor()
             
             cursor.execute('''
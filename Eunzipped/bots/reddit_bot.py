@@ -11,14 +11,18 @@ Requires Reddit API credentials:
 """
 
 import praw
-import sqlite3
 import json
 import time
 import os
+import sys
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+from core.leaderboard import get_leaderboard
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -26,7 +30,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 DB_FILE = 'taylor_62.db'
-LEADERBOARD_FILE = 'leaderboard/data/all_time_tusg.json'
 RATE_LIMIT_FILE = 'bots/reddit_posts_today.json'
 SUBREDDIT = 'NBATalk'
 MAX_POSTS_PER_DAY = 3
@@ -106,7 +109,7 @@ class RedditBot:
     def get_high_edge_picks(self) -> List[Dict]:
         """Get picks with edge ≥70% from database"""
         try:
-            conn = sqlite3.connect(DB_FILE)
+            conn = get_connection(DB_FILE)
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -210,8 +213,7 @@ class RedditBot:
     def generate_leaderboard_body(self) -> str:
         """Generate engaging leaderboard post from historical data"""
         try:
-            with open(LEADERBOARD_FILE, 'r') as f:
-                leaderboard = json.load(f)
+            leaderboard = get_leaderboard().rows()
         except Exception as e:
             logger.error(f"Error loading leaderboard: {e}")
             return "Error loading leaderboard data"
@@ -0,0 +1,92 @@
+"""
+TAYLOR VECTOR TERMINAL - Multi-Bookmaker Consensus Lines
+Median/mean line, dispersion and the best available number on each side for
+every game in one odds payload, computed over all bookmakers at once with NumPy.
+Moneylines are aggregated as implied probabilities: American odds jump from -100
+to +100, so their raw median, mean and spread are meaningless.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Quote field summarized per market (core/markets.py records)
+CONSENSUS_FIELDS = {
+    'spreads': 'home_point',
+    'totals': 'point',
+    'h2h': 'home_price'
+}
+
+
+def american_to_probability(prices):
+    """Implied win probability of American odds (scalar or array): -150 -> 0.6, +150 -> 0.4"""
+    prices = np.asarray(prices, dtype=np.float64)
+    return np.where(prices < 0, -prices, 100) / (np.abs(prices) + 100)
+
+
+def probability_to_american(probability: float) -> int:
+    """American odds quoting an implied probability (the inverse of american_to_probability)"""
+    if probability > 0.5:
+        return int(round(-100 * probability / (1 - probability)))
+    return int(round(100 * (1 - probability) / probability))
+
+
+def summarize(events: Sequence[str], values: Sequence[float], books: Sequence[str]) -> Dict[str, Dict]:
+    """
+    {event: summary} over flat (event, value, bookmaker) rows.
+
+    Each summary holds the median and mean value, the standard deviation across
+    books, the highest and lowest value with the bookmaker quoting each, and the
+    number of books.
+    """
+    if len(events) == 0:
+        return {}
+    keys, group = np.unique(np.asarray(events, dtype=object), return_inverse=True)
+    values = np.asarray(values, dtype=np.float64)
+    books = np.asarray(books, dtype=object)
+
+    # Sort by game, then value, so every game is one contiguous, ordered run
+    order = np.lexsort((values, group))
+    group, values, books = group[order], values[order], books[order]
+
+    starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+    counts = np.diff(np.r_[starts, group.size])
+    ends = starts + counts - 1
+
+    median = (values[starts + (counts - 1) // 2] + values[starts + counts // 2]) / 2
+    mean = np.add.reduceat(values, starts) / counts
+    deviation = values - np.repeat(mean, counts)
+    stdev = np.sqrt(np.add.reduceat(deviation * deviation, starts) / counts)
+
+    return {
+        keys[group[start]]: {
+            'median': float(median[i]),
+            'mean': round(float(mean[i]), 3),
+            'stdev': round(float(stdev[i]), 3),
+            'high': float(values[ends[i]]),
+            'high_book': books[ends[i]],
+            'low': float(values[start]),
+            'low_book': books[start],
+            'books': int(counts[i])
+        }
+        for i, start in enumerate(starts.tolist())
+    }
+
+
+def consensus_by_market(quotes: Dict[str, List]) -> Dict[str, Dict[str, Dict]]:
+    """
+    {market: {event: summary}} for every market parsed from the payload. h2h summaries
+    are in implied probability of the home side, so their 'low' is the best home price.
+    """
+    consensus = {}
+    for market, rows in quotes.items():
+        field = CONSENSUS_FIELDS[market]
+        values = [getattr(row, field) for row in rows]
+        if market == 'h2h':
+            values = american_to_probability(values)
+        consensus[market] = summarize(
+            [row.event for row in rows],
+            values,
+            [row.bookmaker for row in rows]
+        )
+    return consensus
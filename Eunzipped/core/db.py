@@ -0,0 +1,117 @@
+"""
+TAYLOR VECTOR TERMINAL - SQLite Connection Manager
+Reusable per-thread connections in WAL mode with tuned pragmas, so the terminal's
+writes never block dashboard/bot readers and prepared statements survive between calls
+"""
+
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+
+BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+CACHED_STATEMENTS = int(os.getenv('SQLITE_CACHED_STATEMENTS', '256'))
+CACHE_SIZE_KB = int(os.getenv('SQLITE_CACHE_SIZE_KB', '16384'))
+MAX_IDLE_PER_THREAD = 4  # idle connections kept per (thread, database file)
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    A connection that belongs to one thread's pool. close() ends the caller's use: anything
+    left uncommitted is rolled back (as a real close would) and the connection, with its
+    prepared-statement cache, goes back to the pool for the thread's next get_connection().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.idle_list: Optional[List['PooledConnection']] = None
+        self.in_use = False
+
+    def close(self):
+        if not self.in_use:
+            return
+        self.in_use = False
+        if self.in_transaction:
+            self.rollback()
+        if self.idle_list is not None and len(self.idle_list) < MAX_IDLE_PER_THREAD:
+            self.idle_list.append(self)
+        else:
+            super().close()
+
+    def really_close(self):
+        self.in_use = False
+        super().close()
+
+
+def _open(path: str) -> PooledConnection:
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000, factory=PooledConnection,
+                           cached_statements=CACHED_STATEMENTS)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+    conn.execute(f'PRAGMA mmap_size={MMAP_SIZE}')
+    conn.execute(f'PRAGMA cache_size=-{CACHE_SIZE_KB}')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    return conn
+
+
+class ConnectionPool:
+    """
+    Idle connections per (thread, database file). A nested get_connection() while the
+    thread already holds one gets a second connection, so one caller's close() or
+    rollback never touches another caller's transaction.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self.stats = {'opened': 0, 'reused': 0}
+
+    def _idle(self, key: str) -> List[PooledConnection]:
+        if self._pid != os.getpid():
+            # Forked child: never reuse the parent's sqlite handles
+            self._local = threading.local()
+            self._pid = os.getpid()
+        if not hasattr(self._local, 'idle'):
+            self._local.idle = {}
+        return self._local.idle.setdefault(key, [])
+
+    def get(self, path: str, row_factory=None) -> PooledConnection:
+        """An idle connection of this thread to `path` (or a new one), with `row_factory` set"""
+        idle = self._idle(path if path == ':memory:' else os.path.abspath(path))
+        if idle:
+            conn = idle.pop()
+            self.stats['reused'] += 1
+        else:
+            conn = _open(path)
+            conn.idle_list = None if path == ':memory:' else idle
+            self.stats['opened'] += 1
+        conn.in_use = True
+        conn.row_factory = row_factory
+        return conn
+
+    def close_thread(self):
+        """Close this thread's idle connections (e.g. before a worker thread exits)"""
+        for idle in getattr(self._local, 'idle', {}).values():
+            while idle:
+                idle.pop().really_close()
+
+
+_pool: Optional[ConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """The process-wide pool (created on first use)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def get_connection(path: str, row_factory=None) -> PooledConnection:
+    """Pooled replacement for sqlite3.connect(path); callers may still close() it when done"""
+    return get_pool().get(path, row_factory)
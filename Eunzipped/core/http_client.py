@@ -0,0 +1,207 @@
+"""
+TAYLOR VECTOR TERMINAL - Shared HTTP Client
+One pooled keep-alive session for every upstream fetch, with exponential backoff,
+per-host concurrency limits and an optional on-disk response cache with per-endpoint TTLs
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from core.snapshot_cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_DIR = os.getenv('HTTP_CACHE_DIR', os.path.join(CACHE_DIR, 'http'))
+MAX_PER_HOST = int(os.getenv('HTTP_MAX_PER_HOST', '8'))
+MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '3'))
+BACKOFF_BASE = float(os.getenv('HTTP_BACKOFF_BASE', '0.5'))  # seconds, doubled per retry
+BACKOFF_MAX = 30.0
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Query parameters that never reach a cache key, cache file or recording
+REDACTED_PARAMS = {'apiKey', 'api_key', 'key', 'token'}
+
+# Disk cache TTL (seconds) by URL path suffix; unlisted endpoints and odds are never cached
+ENDPOINT_TTLS = {
+    '/api/playertotals': 900,
+    '/api/v1/players': 24 * 3600,
+    '/api/v1/season_averages': 3600
+}
+
+
+def normalize_url(url: str, params=None) -> str:
+    """URL with secrets removed and query parameters merged and sorted"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += list(params.items()) if isinstance(params, dict) else list(params)
+    query = sorted((k, str(v)) for k, v in query if k not in REDACTED_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+
+class StoredResponse:
+    """Minimal stand-in for requests.Response built from a stored one (cache entry or recording)"""
+
+    def __init__(self, event: Dict):
+        self.status_code = event['status']
+        self.headers = CaseInsensitiveDict(event.get('headers', {}))
+        self.text = event['body']
+        self.url = event['url']
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def endpoint_ttl(url: str) -> float:
+    """Cache TTL configured for a URL's endpoint (0 = don't cache)"""
+    path = urlsplit(url).path.rstrip('/')
+    for suffix, ttl in ENDPOINT_TTLS.items():
+        if path.endswith(suffix):
+            return ttl
+    return 0
+
+
+class HttpClient:
+    """Thread-safe GET client shared by the terminal, web app and premium modules"""
+
+    def __init__(self, max_per_host: int = MAX_PER_HOST, max_retries: int = MAX_RETRIES,
+                 backoff_base: float = BACKOFF_BASE, cache_dir: Optional[str] = HTTP_CACHE_DIR):
+        self.max_per_host = max_per_host
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.cache_dir = cache_dir
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(max_per_host, 10))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'cache_hits': 0}
+
+    def _slots(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_slots[host]
+
+    def _cache_path(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.json')
+
+    def _read_cache(self, key: str, ttl: float):
+        path = self._cache_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+            if time.time() - entry['fetched_at'] >= ttl:
+                return None
+            return StoredResponse(entry)
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable HTTP cache entry {path}: {e}")
+            return None
+
+    def _write_cache(self, key: str, response):
+        path = self._cache_path(key)
+        if not path:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'url': key,
+                    'fetched_at': time.time(),
+                    'status': response.status_code,
+                    'headers': {k.lower(): v for k, v in response.headers.items()
+                                if k.lower() in ('content-type', 'etag', 'last-modified')},
+                    'body': response.text
+                }, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write HTTP cache entry {path}: {e}")
+
+    def _backoff(self, attempt: int, response=None) -> float:
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return min(BACKOFF_MAX, float(retry_after))
+            except ValueError:
+                pass
+        delay = min(BACKOFF_MAX, self.backoff_base * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    def get(self, url: str, params=None, timeout: float = 10, ttl: Optional[float] = None, **kwargs):
+        """
+        GET through the pooled session. Connection errors, 429s and 5xx responses are
+        retried with exponential backoff; the last response (or error) is returned/raised.
+        `ttl` overrides the endpoint's disk-cache TTL (0 disables caching for this call).
+        """
+        ttl = endpoint_ttl(url) if ttl is None else ttl
+        key = normalize_url(url, params)
+        if ttl > 0:
+            cached = self._read_cache(key, ttl)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                return cached
+
+        slots = self._slots(url)
+        attempt = 0
+        while True:
+            response = None
+            try:
+                with slots:
+                    self.stats['requests'] += 1
+                    response = self.session.get(url, params=params, timeout=timeout, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    break
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+            delay = self._backoff(attempt, response)
+            attempt += 1
+            self.stats['retries'] += 1
+            logger.warning(f"⚠️ {urlsplit(url).netloc} "
+                           f"{response.status_code if response is not None else 'connection error'}, "
+                           f"retry {attempt}/{self.max_retries} in {delay:.1f}s")
+            time.sleep(delay)
+
+        if ttl > 0 and response.status_code == 200:
+            self._write_cache(key, response)
+        return response
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HttpClient:
+    """The process-wide client (created on first use)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def http_get(url: str, **kwargs):
+    """GET through the shared client"""
+    return get_client().get(url, **kwargs)
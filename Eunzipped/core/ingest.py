@@ -0,0 +1,92 @@
+"""
+TAYLOR VECTOR TERMINAL - Concurrent Page Ingestion
+Fetches paginated upstream endpoints in bounded parallel waves instead of one page at a time,
+and fixed batches of ids (e.g. balldontlie season_averages) through a worker pool
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from core.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+def _fetch_limited(fetch_page: Callable, limiter: Optional[RateLimiter], page):
+    """Run a single page (or batch) fetch once the rate limiter grants a slot"""
+    if limiter:
+        limiter.acquire()
+    return fetch_page(page)
+
+
+def fetch_pages_concurrent(fetch_page: Callable[[int], list], page_size: int, max_workers: int = 8,
+                           limiter: Optional[RateLimiter] = None, strict: bool = False) -> List:
+    """
+    Fetch pages 1..N concurrently and return their items in page order.
+
+    `fetch_page(page)` returns the list of items on that page and raises on failure.
+    Pages are requested in waves of `max_workers`; pagination ends at the first
+    empty, short or failed page, exactly like the sequential walk. With `strict`
+    a failed page re-raises instead of returning the pages before it.
+    """
+    max_workers = max(1, int(max_workers))
+    items = []
+    next_page = 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            pages = list(range(next_page, next_page + max_workers))
+            futures = [pool.submit(_fetch_limited, fetch_page, limiter, page) for page in pages]
+
+            for page, future in zip(pages, futures):
+                try:
+                    page_items = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Page {page} failed: {e}")
+                    if strict:
+                        raise
+                    return items
+
+                if not page_items:
+                    return items
+
+                items.extend(page_items)
+                if len(page_items) < page_size:
+                    return items
+
+            next_page += max_workers
+
+
+def fetch_batches_concurrent(fetch_batch: Callable[[Sequence], list], batches: Sequence[Sequence],
+                             max_workers: int = 8, limiter: Optional[RateLimiter] = None,
+                             retries: int = 2) -> Tuple[List, List[int]]:
+    """
+    Fetch every batch through a pool of `max_workers` threads.
+
+    `fetch_batch(batch)` returns that batch's items and raises on failure. Failed
+    batches are retried in up to `retries` further rounds once the others finish.
+    Returns (items of every successful batch in batch order, indices of the batches
+    that still failed).
+    """
+    results = {}
+    pending = list(range(len(batches)))
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers))) as pool:
+        for attempt in range(retries + 1):
+            if not pending:
+                break
+            futures = {index: pool.submit(_fetch_limited, fetch_batch, limiter, batches[index]) for index in pending}
+            pending = []
+            for index, future in futures.items():
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.warning(f"⚠️ Batch {index + 1}/{len(batches)} failed "
+                                   f"(attempt {attempt + 1}/{retries + 1}): {e}")
+                    pending.append(index)
+
+    items = []
+    for index in sorted(results):
+        items.extend(results[index])
+    return items, pending
@@ -0,0 +1,148 @@
+"""
+TAYLOR VECTOR TERMINAL - Leaderboard Data Service
+The all-time TUSG%/PVR leaderboard loaded once per process into typed records and
+prebuilt indexes, reloaded only when the JSON file's mtime changes
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LEADERBOARD_FILE = os.getenv('LEADERBOARD_FILE',
+                             os.path.join(PROJECT_ROOT, 'leaderboard', 'data', 'all_time_tusg.json'))
+CHECK_INTERVAL = float(os.getenv('LEADERBOARD_CHECK_INTERVAL', '5'))  # seconds between mtime checks
+
+SORT_METRICS = ('tusg', 'pvr')
+
+
+class LeaderboardEntry(NamedTuple):
+    rank: int
+    player: str
+    season: str
+    tusg: float
+    pvr: float
+    mpg: float
+    ppg: float
+    apg: float
+    era_pace: float = 100.0
+
+
+def name_key(name: str) -> str:
+    return (name or '').strip().lower()
+
+
+class LeaderboardSnapshot:
+    """One immutable load of the file: records, their JSON rows and the lookup indexes"""
+
+    __slots__ = ('mtime', 'rows', 'entries', 'by_name', 'by_season', 'by_name_season', 'sorted_by')
+
+    def __init__(self, rows: List[Dict], mtime: Optional[float] = None):
+        self.mtime = mtime
+        self.rows = rows
+        self.entries = [LeaderboardEntry(**{field: row[field] for field in LeaderboardEntry._fields if field in row})
+                        for row in rows]
+        by_name = defaultdict(list)
+        by_season = defaultdict(list)
+        for i, entry in enumerate(self.entries):
+            by_name[name_key(entry.player)].append(i)
+            by_season[entry.season].append(i)
+        self.by_name = dict(by_name)
+        self.by_season = dict(by_season)
+        self.by_name_season = {}
+        for i, entry in enumerate(self.entries):
+            self.by_name_season.setdefault((name_key(entry.player), entry.season), i)
+        # Row indices best-first per metric (stable, so ties keep file order)
+        self.sorted_by = {metric: sorted(range(len(rows)), key=lambda i: getattr(self.entries[i], metric), reverse=True)
+                          for metric in SORT_METRICS}
+
+
+class LeaderboardData:
+    """
+    Process-wide view of the leaderboard file. Reads never touch the disk except for
+    a stat() at most every `check_interval` seconds; a changed mtime swaps in a new
+    snapshot. Returned rows are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, path: str = LEADERBOARD_FILE, check_interval: float = CHECK_INTERVAL):
+        self.path = path
+        self.check_interval = check_interval
+        self._snapshot: Optional[LeaderboardSnapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> LeaderboardSnapshot:
+        """The current snapshot (raises if the file has never loaded)"""
+        now = time.monotonic()
+        if self._snapshot is None or now - self._checked_at >= self.check_interval:
+            with self._lock:
+                if self._snapshot is None or now - self._checked_at >= self.check_interval:
+                    self._reload_if_changed()
+                    self._checked_at = now
+        return self._snapshot
+
+    def _reload_if_changed(self):
+        try:
+            mtime = os.path.getmtime(self.path)
+            if self._snapshot is not None and mtime == self._snapshot.mtime:
+                return
+            with open(self.path, 'r') as f:
+                self._snapshot = LeaderboardSnapshot(json.load(f), mtime)
+            logger.info(f"📈 Leaderboard loaded: {len(self._snapshot.rows)} seasons from {self.path}")
+        except Exception as e:
+            if self._snapshot is None:
+                raise
+            logger.warning(f"⚠️ Keeping previous leaderboard, reload of {self.path} failed: {e}")
+
+    def rows(self) -> List[Dict]:
+        """Every season as its JSON dict, in file (rank) order"""
+        return self.snapshot().rows
+
+    def entries(self) -> List[LeaderboardEntry]:
+        """Every season as a typed record, in file (rank) order"""
+        return self.snapshot().entries
+
+    def find(self, player: str, season: Optional[str] = None) -> Optional[Dict]:
+        """First row for a player name (case-insensitive), optionally for one season"""
+        snapshot = self.snapshot()
+        if season is not None:
+            index = snapshot.by_name_season.get((name_key(player), season))
+        else:
+            index = next(iter(snapshot.by_name.get(name_key(player), ())), None)
+        return None if index is None else snapshot.rows[index]
+
+    def player_rows(self, player: str) -> List[Dict]:
+        """Every row for a player name (case-insensitive), in file order"""
+        snapshot = self.snapshot()
+        return [snapshot.rows[i] for i in snapshot.by_name.get(name_key(player), ())]
+
+    def season_rows(self, season: str) -> List[Dict]:
+        """Every row for one season label (e.g. '2016-17'), in file order"""
+        snapshot = self.snapshot()
+        return [snapshot.rows[i] for i in snapshot.by_season.get(season, ())]
+
+    def top(self, metric: str = 'tusg', limit: Optional[int] = None) -> List[Dict]:
+        """Rows sorted by `metric` ('tusg' or 'pvr'), highest first"""
+        snapshot = self.snapshot()
+        order = snapshot.sorted_by[metric]
+        return [snapshot.rows[i] for i in (order if limit is None else order[:limit])]
+
+
+_leaderboard = None
+_leaderboard_lock = threading.Lock()
+
+
+def get_leaderboard() -> LeaderboardData:
+    """The process-wide leaderboard service (created on first use)"""
+    global _leaderboard
+    if _leaderboard is None:
+        with _leaderboard_lock:
+            if _leaderboard is None:
+                _leaderboard = LeaderboardData()
+    return _leaderboard
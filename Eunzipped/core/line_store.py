@@ -0,0 +1,140 @@
+"""
+TAYLOR VECTOR TERMINAL - Line Movement Store
+Append-only time series of bookmaker lines per event, kept in taylor_62.db
+
+Only rows whose point or price moved since the previous snapshot of the same
+event/bookmaker/market are written, so a quiet night costs almost nothing while
+every movement stays queryable without calling the paid odds API again.
+"""
+
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core.db import get_connection
+
+SEED_WINDOW = 2 * 24 * 3600  # seconds of history used to seed the last-seen lines on startup
+
+SNAPSHOT_COLUMNS = ('event_id', 'bookmaker', 'market', 'captured_at', 'commence_time',
+                    'home_team', 'away_team', 'home_point', 'away_point', 'home_price', 'away_price')
+
+
+def parse_lines(game: Dict, markets: Iterable[str] = ('spreads',)) -> List[Tuple]:
+    """
+    (bookmaker, market, home_point, away_point, home_price, away_price) for one Odds API event.
+    Totals have no home/away side, so the Over is stored in the home columns and the Under in the away ones.
+    """
+    lines = []
+    for bookmaker in game.get('bookmakers', []):
+        for market in bookmaker.get('markets', []):
+            if market.get('key') not in markets:
+                continue
+            if market.get('key') == 'totals':
+                home_name, away_name = 'Over', 'Under'
+            else:
+                home_name, away_name = game.get('home_team'), game.get('away_team')
+            home = away = {}
+            for outcome in market.get('outcomes', []):
+                if outcome.get('name') == home_name:
+                    home = outcome
+                elif outcome.get('name') == away_name:
+                    away = outcome
+            lines.append((bookmaker.get('key'), market.get('key'), home.get('point'), away.get('point'),
+                          home.get('price'), away.get('price')))
+    return lines
+
+
+class LineStore:
+    """Writes and queries the line_snapshots table"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.last_seen: Dict[Tuple[str, str, str], Tuple] = {}
+
+    def _connect(self):
+        conn = get_connection(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def load_last_seen(self):
+        """Seed last-seen lines from recent history (line_snapshots is created by terminal migration v7)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute('''
+                SELECT event_id, bookmaker, market, home_point, away_point, home_price, away_price
+                FROM line_snapshots
+                WHERE id IN (
+                    SELECT MAX(id) FROM line_snapshots
+                    WHERE captured_at >= ?
+                    GROUP BY event_id, bookmaker, market
+                )
+            ''', (time.time() - SEED_WINDOW,)).fetchall()
+        finally:
+            conn.close()
+        self.last_seen = {(r[0], r[1], r[2]): tuple(r[3:]) for r in rows}
+
+    def record(self, games: List[Dict], captured_at: Optional[float] = None,
+               markets: Iterable[str] = ('spreads',)) -> int:
+        """
+        Append every line that moved since the last snapshot; returns rows written.
+        last_seen only advances once the rows are committed, so a failed write is
+        retried on the next cycle instead of being silently skipped.
+        """
+        captured_at = captured_at or time.time()
+        rows = []
+        moved = {}
+        for game in games:
+            event_id = game.get('id')
+            if not event_id:
+                continue
+            for bookmaker, market, *line in parse_lines(game, markets):
+                key = (event_id, bookmaker, market)
+                line = tuple(line)
+                if moved.get(key, self.last_seen.get(key)) == line:
+                    continue
+                moved[key] = line
+                rows.append((event_id, bookmaker, market, captured_at, game.get('commence_time'),
+                             game.get('home_team'), game.get('away_team'), *line))
+
+        if rows:
+            conn = self._connect()
+            try:
+                conn.executemany(f'''
+                    INSERT INTO line_snapshots ({', '.join(SNAPSHOT_COLUMNS)})
+                    VALUES ({', '.join('?' for _ in SNAPSHOT_COLUMNS)})
+                ''', rows)
+                conn.commit()
+            finally:
+                conn.close()
+            self.last_seen.update(moved)
+        return len(rows)
+
+    def _query(self, sql: str, params: Tuple) -> List[Dict]:
+        """Rows of a read as dicts; empty until the terminal has created line_snapshots"""
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(sql, params).fetchall()]
+        except sqlite3.OperationalError as e:
+            if 'no such table' not in str(e):
+                raise
+            return []
+        finally:
+            conn.close()
+
+    def movements_for_event(self, event_id: str, market: str = 'spreads') -> List[Dict]:
+        """Every recorded movement of one game, oldest first"""
+        return self._query('''
+            SELECT event_id, market, captured_at, bookmaker, home_point, away_point, home_price, away_price
+            FROM line_snapshots
+            WHERE event_id = ? AND market = ?
+            ORDER BY captured_at
+        ''', (event_id, market))
+
+    def latest_snapshots(self, limit: int = 100, since: Optional[float] = None) -> List[Dict]:
+        """Most recent movements league-wide, newest first"""
+        return self._query('''
+            SELECT * FROM line_snapshots
+            WHERE captured_at >= ?
+            ORDER BY captured_at DESC
+            LIMIT ?
+        ''', (since or 0, limit))
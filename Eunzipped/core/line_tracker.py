@@ -0,0 +1,88 @@
+"""
+TAYLOR VECTOR TERMINAL - Line Change Tracker
+Remembers the previous odds snapshot per event/bookmaker/market so a cycle only
+re-evaluates games whose lines or roster inputs actually moved
+"""
+
+from typing import Dict, Hashable, Iterable, Tuple
+
+
+def market_lines(game: Dict) -> Dict[Tuple[str, str], Tuple]:
+    """{(bookmaker, market): sorted ((outcome, point, price), ...)} for one Odds API event"""
+    lines = {}
+    for bookmaker in game.get('bookmakers', []):
+        for market in bookmaker.get('markets', []):
+            lines[(bookmaker.get('key'), market.get('key'))] = tuple(sorted(
+                (outcome.get('name'), outcome.get('point'), outcome.get('price'))
+                for outcome in market.get('outcomes', [])
+            ))
+    return lines
+
+
+def event_key(game: Dict) -> str:
+    """Odds API event id (falls back to the matchup when missing)"""
+    return game.get('id') or f"{game.get('away_team')} @ {game.get('home_team')}"
+
+
+class LineChangeTracker:
+    """Diffs each odds payload against the last one, keyed by event id and bookmaker"""
+
+    def __init__(self):
+        self.lines: Dict[str, Dict[Tuple[str, str], Tuple]] = {}
+        self.inputs: Dict[str, Hashable] = {}
+        self.games_skipped = 0
+        self.games_recomputed = 0
+        self.cycle_skipped = 0
+        self.cycle_recomputed = 0
+        self.cycle_moved = 0
+
+    def begin_cycle(self):
+        """Reset the per-cycle counters"""
+        self.cycle_skipped = 0
+        self.cycle_recomputed = 0
+        self.cycle_moved = 0
+
+    def has_changed(self, game: Dict, roster_inputs: Hashable = None) -> bool:
+        """Record the game's current lines and return True if they or the roster inputs moved"""
+        event_id = event_key(game)
+        current = market_lines(game)
+
+        if event_id in self.lines and self.lines[event_id] != current:
+            self.cycle_moved += 1
+
+        changed = (
+            event_id not in self.inputs
+            or self.inputs[event_id] != roster_inputs
+            or self.lines.get(event_id) != current
+        )
+        self.lines[event_id] = current
+        self.inputs[event_id] = roster_inputs
+
+        if changed:
+            self.games_recomputed += 1
+            self.cycle_recomputed += 1
+        else:
+            self.games_skipped += 1
+            self.cycle_skipped += 1
+        return changed
+
+    def invalidate(self, event_id: str):
+        """Force the event to be recomputed next cycle (e.g. after a failed write)"""
+        self.inputs.pop(event_id, None)
+
+    def prune(self, active_event_ids: Iterable[str]):
+        """Forget events that are no longer in the odds payload"""
+        active = set(active_event_ids)
+        self.lines = {eid: books for eid, books in self.lines.items() if eid in active}
+        self.inputs = {eid: value for eid, value in self.inputs.items() if eid in active}
+
+    def stats(self) -> Dict[str, int]:
+        """Skip/recompute counters for this cycle and since startup"""
+        return {
+            'cycle_skipped': self.cycle_skipped,
+            'cycle_recomputed': self.cycle_recomputed,
+            'cycle_moved': self.cycle_moved,
+            'games_skipped': self.games_skipped,
+            'games_recomputed': self.games_recomputed,
+            'events_tracked': len(self.inputs)
+        }
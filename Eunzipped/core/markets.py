@@ -0,0 +1,104 @@
+"""
+TAYLOR VECTOR TERMINAL - Odds Markets
+Typed per-market quotes parsed in one pass from a single Odds API payload that
+carries spreads, totals and moneylines (h2h) together
+"""
+
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.line_tracker import event_key
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_MARKETS = ('spreads', 'totals', 'h2h')
+
+
+def supported_markets(requested: str) -> Tuple[str, ...]:
+    """
+    The markets in a comma-separated ODDS_MARKETS value that the terminal can price,
+    in order and without duplicates. Unknown keys are dropped with a warning; if
+    nothing usable is left every supported market is used.
+    """
+    markets = []
+    for market in (key.strip().lower() for key in requested.split(',')):
+        if not market or market in markets:
+            continue
+        if market not in SUPPORTED_MARKETS:
+            logger.warning(f"⚠️ Ignoring unsupported odds market '{market}' "
+                           f"(supported: {', '.join(SUPPORTED_MARKETS)})")
+            continue
+        markets.append(market)
+    if not markets:
+        logger.warning(f"⚠️ No supported odds markets in '{requested}', using {','.join(SUPPORTED_MARKETS)}")
+        return SUPPORTED_MARKETS
+    return tuple(markets)
+
+
+class SpreadQuote(NamedTuple):
+    event: str
+    bookmaker: str
+    home_point: float
+    away_point: float
+    home_price: Optional[int]
+    away_price: Optional[int]
+
+
+class TotalQuote(NamedTuple):
+    event: str
+    bookmaker: str
+    point: float
+    over_price: Optional[int]
+    under_price: Optional[int]
+
+
+class MoneylineQuote(NamedTuple):
+    event: str
+    bookmaker: str
+    home_price: int
+    away_price: int
+
+
+def pick_side_from_text(pick):
+    """Side part of a pick string ('Boston Celtics -3.5' -> 'Boston Celtics', 'Over 221.5' -> 'Over')"""
+    parts = (pick or '').rsplit(' ', 1)
+    if len(parts) == 2:
+        try:
+            float(parts[1])
+            return parts[0]
+        except ValueError:
+            pass
+    return pick
+
+
+def parse_markets(games: List[Dict], markets: Iterable[str] = SUPPORTED_MARKETS) -> Dict[str, List]:
+    """{market: [quotes]} for every bookmaker quoting both sides of a market"""
+    markets = tuple(markets)
+    quotes = {market: [] for market in markets}
+    for game in games:
+        event = event_key(game)
+        home_team = game.get('home_team')
+        away_team = game.get('away_team')
+        for bookmaker in game.get('bookmakers', []):
+            book = bookmaker.get('key')
+            for market in bookmaker.get('markets', []):
+                key = market.get('key')
+                if key not in quotes:
+                    continue
+                outcomes = {outcome.get('name'): outcome for outcome in market.get('outcomes', [])}
+                home = outcomes.get(home_team)
+                away = outcomes.get(away_team)
+
+                if key == 'spreads' and home and away:
+                    quotes[key].append(SpreadQuote(event, book, home.get('point', 0), away.get('point', 0),
+                                                   home.get('price'), away.get('price')))
+                elif key == 'h2h' and home and away and home.get('price') is not None \
+                        and away.get('price') is not None:
+                    quotes[key].append(MoneylineQuote(event, book, home['price'], away['price']))
+                elif key == 'totals':
+                    over = outcomes.get('Over')
+                    under = outcomes.get('Under')
+                    if over and under and over.get('point') is not None:
+                        quotes[key].append(TotalQuote(event, book, over['point'],
+                                                      over.get('price'), under.get('price')))
+    return quotes
@@ -0,0 +1,108 @@
+"""
+TAYLOR VECTOR TERMINAL - Core Metrics
+Scalar TUSG% / PVR formulas and team reference data shared by the terminal modules
+"""
+
+import math
+
+# Players below this many minutes per game are excluded from team TUSG%/PVR
+MIN_MINUTES = 10
+
+# Totals model: league points per 100 possessions and the spread of final game totals around
+# the projection (NBA game totals land within about ±18 points of expectation one time in three)
+LEAGUE_OFFENSIVE_RATING = 114.5
+TOTAL_POINTS_STDEV = 18.0
+
+TEAM_MAPPING = {
+    'Atlanta Hawks': 'ATL', 'Boston Celtics': 'BOS', 'Brooklyn Nets': 'BKN',
+    'Charlotte Hornets': 'CHA', 'Chicago Bulls': 'CHI', 'Cleveland Cavaliers': 'CLE',
+    'Dallas Mavericks': 'DAL', 'Denver Nuggets': 'DEN', 'Detroit Pistons': 'DET',
+    'Golden State Warriors': 'GSW', 'Houston Rockets': 'HOU', 'Indiana Pacers': 'IND',
+    'LA Clippers': 'LAC', 'Los Angeles Lakers': 'LAL', 'Memphis Grizzlies': 'MEM',
+    'Miami Heat': 'MIA', 'Milwaukee Bucks': 'MIL', 'Minnesota Timberwolves': 'MIN',
+    'New Orleans Pelicans': 'NOP', 'New York Knicks': 'NYK', 'Oklahoma City Thunder': 'OKC',
+    'Orlando Magic': 'ORL', 'Philadelphia 76ers': 'PHI', 'Phoenix Suns': 'PHX',
+    'Portland Trail Blazers': 'POR', 'Sacramento Kings': 'SAC', 'San Antonio Spurs': 'SAS',
+    'Toronto Raptors': 'TOR', 'Utah Jazz': 'UTA', 'Washington Wizards': 'WAS'
+}
+
+TEAM_PACE = {
+    'ATL': 101.8, 'BOS': 99.3, 'BKN': 100.5, 'CHA': 99.8, 'CHI': 98.5, 'CLE': 97.2,
+    'DAL': 99.1, 'DEN': 98.8, 'DET': 100.2, 'GSW': 100.9, 'HOU': 101.2, 'IND': 100.6,
+    'LAC': 98.7, 'LAL': 99.4, 'MEM': 97.5, 'MIA': 98.3, 'MIL': 99.7, 'MIN': 99.5,
+    'NOP': 100.3, 'NYK': 96.8, 'OKC': 98.9, 'ORL': 99.2, 'PHI': 98.1, 'PHX': 100.4,
+    'POR': 99.6, 'SAC': 101.5, 'SAS': 99.0, 'TOR': 98.6, 'UTA': 98.4, 'WAS': 100.1
+}
+LEAGUE_PACE = sum(TEAM_PACE.values()) / len(TEAM_PACE)
+
+def calculate_player_tusg(player_stats, team_pace):
+    """
+    TUSG% = (FGA + TOV + (FTA × 0.44)) / ((MP/48) × TeamPace) × 100
+    """
+    mp = player_stats.get('min', 0)
+    fga = player_stats.get('fga', 0)
+    tov = player_stats.get('tov', 0)
+    fta = player_stats.get('fta', 0)
+    
+    if mp == 0 or team_pace == 0:
+        return 0.0
+    
+    numerator = fga + tov + (fta * 0.44)
+    denominator = (mp / 48) * team_pace
+    
+    if denominator == 0:
+        return 0.0
+    
+    tusg = (numerator / denominator) * 100
+    return tusg
+
+def calculate_player_pvr(player_stats):
+    """
+    PVR = [(PTS + (AST × Multiplier)) / (FGA + TOV + (0.44 × FTA) + AST) - 1.00] × 100
+    Multiplier: AST/TOV ≥ 1.8 → 2.3, else 1.8
+    """
+    pts = player_stats.get('pts', 0)
+    ast = player_stats.get('ast', 0)
+    fga = player_stats.get('fga', 0)
+    tov = player_stats.get('tov', 0)
+    fta = player_stats.get('fta', 0)
+    
+    if tov == 0:
+        ast_tov_ratio = ast if ast > 0 else 0
+    else:
+        ast_tov_ratio = ast / tov
+    
+    multiplier = 2.3 if ast_tov_ratio > 1.8 else 1.8
+    
+    numerator = pts + (ast * multiplier)
+    denominator = fga + tov + (0.44 * fta) + ast
+    
+    if denominator == 0:
+        return 0.0
+    
+    pvr = ((numerator / denominator) - 1.00) * 100
+    return pvr
+
+def calculate_side_edge(home_tusg, away_tusg, home_pvr, away_pvr):
+    """
+    Home-side edge = 50 + (Home TUSG% - Away TUSG%) + (Home PVR - Away PVR) × 0.5, clamped to 45-80
+    """
+    edge = 50 + (home_tusg - away_tusg) + (home_pvr - away_pvr) * 0.5
+    return max(min(edge, 80), 45)
+
+def projected_total(home_abbr, away_abbr):
+    """
+    Projected game points = 2 × League ORtg × ((Home Pace + Away Pace) / 2) / 100
+    """
+    home_pace = TEAM_PACE.get(home_abbr, LEAGUE_PACE)
+    away_pace = TEAM_PACE.get(away_abbr, LEAGUE_PACE)
+    return 2 * LEAGUE_OFFENSIVE_RATING * ((home_pace + away_pace) / 2) / 100
+
+def calculate_total_edge(home_abbr, away_abbr, line):
+    """
+    Over edge = P(game points > line) × 100 with points ~ Normal(projected total, TOTAL_POINTS_STDEV),
+    clamped to 20-80 (the Under edge at the same line is 100 minus this)
+    """
+    z = (projected_total(home_abbr, away_abbr) - line) / TOTAL_POINTS_STDEV
+    edge = 50 * (1 + math.erf(z / math.sqrt(2)))
+    return max(min(edge, 80), 20)
@@ -0,0 +1,85 @@
+"""
+TAYLOR VECTOR TERMINAL - Vectorized Metrics Engine
+Column-at-a-time TUSG%, PVR, AST/TOV and Westbrook multiplier over NumPy arrays
+
+Every function mirrors the scalar formulas in core/metrics.py operation for
+operation, so results are bit-for-bit identical to calling them per player.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from core.metrics import MIN_MINUTES, TEAM_PACE
+
+DEFAULT_PACE = 99.5
+STAT_COLUMNS = ('min', 'pts', 'ast', 'tov', 'fga', 'fta')
+
+
+def pace_for_teams(teams: Iterable[str], default: float = DEFAULT_PACE) -> np.ndarray:
+    """Team pace for each player's team abbreviation"""
+    return np.array([TEAM_PACE.get(team, default) for team in teams], dtype=np.float64)
+
+
+def tusg(mp, fga, tov, fta, pace) -> np.ndarray:
+    """TUSG% = (FGA + TOV + (FTA × 0.44)) / ((MP/48) × TeamPace) × 100 (0 where undefined)"""
+    mp, fga, tov, fta, pace = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (mp, fga, tov, fta, pace)))
+    numerator = fga + tov + (fta * 0.44)
+    denominator = (mp / 48) * pace
+    valid = (mp != 0) & (pace != 0) & (denominator != 0)
+    out = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=valid)
+    out *= 100
+    return out
+
+
+def ast_tov_ratio(ast, tov) -> np.ndarray:
+    """AST/TOV, falling back to AST (or 0) when a player has no turnovers"""
+    ast, tov = np.broadcast_arrays(np.asarray(ast, dtype=np.float64), np.asarray(tov, dtype=np.float64))
+    out = np.where(ast > 0, ast, 0.0)
+    np.divide(ast, tov, out=out, where=tov != 0)
+    return out
+
+
+def westbrook_multiplier(ratio) -> np.ndarray:
+    """PVR assist multiplier: 2.3 when AST/TOV > 1.8, else 1.8"""
+    return np.where(np.asarray(ratio, dtype=np.float64) > 1.8, 2.3, 1.8)
+
+
+def pvr(pts, ast, fga, tov, fta) -> np.ndarray:
+    """PVR = [(PTS + (AST × Multiplier)) / (FGA + TOV + (0.44 × FTA) + AST) - 1.00] × 100"""
+    pts, ast, fga, tov, fta = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in (pts, ast, fga, tov, fta)))
+    multiplier = westbrook_multiplier(ast_tov_ratio(ast, tov))
+    numerator = pts + (ast * multiplier)
+    denominator = fga + tov + (0.44 * fta) + ast
+    out = np.zeros(numerator.shape, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    out -= 1.00
+    out *= 100
+    out[denominator == 0] = 0.0
+    return out
+
+
+def compute_player_metrics(columns: Dict[str, np.ndarray], pace) -> Dict[str, np.ndarray]:
+    """All per-player metrics for a set of stat columns in one pass"""
+    ratio = ast_tov_ratio(columns['ast'], columns['tov'])
+    return {
+        'tusg': tusg(columns['min'], columns['fga'], columns['tov'], columns['fta'], pace),
+        'pvr': pvr(columns['pts'], columns['ast'], columns['fga'], columns['tov'], columns['fta']),
+        'ast_tov': ratio,
+        'multiplier': westbrook_multiplier(ratio)
+    }
+
+
+def team_average(values: np.ndarray, mask: Optional[np.ndarray] = None, default: float = 0.0) -> float:
+    """Mean of the selected values, summed left to right like a plain Python sum()"""
+    selected = values if mask is None else values[mask]
+    if selected.size == 0:
+        return default
+    return sum(selected.tolist()) / selected.size
+
+
+def qualified_mask(minutes: np.ndarray) -> np.ndarray:
+    """Players who count toward team TUSG%/PVR (min >= MIN_MINUTES)"""
+    return np.asarray(minutes, dtype=np.float64) >= MIN_MINUTES
+
@@ -0,0 +1,500 @@
+"""
+TAYLOR VECTOR TERMINAL - Schema Migrations
+Versioned, append-only schema changes per component, recorded in each database's
+schema_migrations table. A step is SQL or, for data backfills, a function of the
+connection; steps that may meet databases altered before they were versioned
+check the schema first. Plus an EXPLAIN QUERY PLAN check that every hot query is
+served by an index instead of a full table scan
+
+Usage: python -m core.migrations [--db taylor_62.db] [--component terminal] [--check]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.db import get_connection
+from core.markets import pick_side_from_text
+from core.minutes import parse_minutes
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+Statement = Union[str, Callable]  # SQL, or a function taking the connection
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    statements: Tuple[Statement, ...]
+
+
+class HotQuery(NamedTuple):
+    name: str
+    sql: str
+    params: Tuple = ()
+    ordered: bool = False  # the index must also deliver the ORDER BY (no temp b-tree sort)
+    search: bool = False  # the WHERE must be an index range lookup, not a walk of a whole index
+
+
+# Columns added to picks after the original schema
+PICK_COLUMNS = {
+    'home_tusg': 'REAL',
+    'away_tusg': 'REAL',
+    'home_pvr': 'REAL',
+    'away_pvr': 'REAL',
+    'spread': 'REAL',
+    'pick_side': 'TEXT',
+    'pick_date': 'TEXT',
+    'updated_at': 'DATETIME',
+    'consensus_spread': 'REAL',
+    'mean_spread': 'REAL',
+    'spread_stdev': 'REAL',
+    'best_spread': 'REAL',
+    'best_book': 'TEXT',
+    'book_count': 'INTEGER',
+    'market': 'TEXT',
+    'price': 'INTEGER'
+}
+
+# Very early databases used tusg_home/pvr_home style column names
+LEGACY_PICK_COLUMNS = {
+    'tusg_home': 'home_tusg',
+    'tusg_away': 'away_tusg',
+    'pvr_home': 'home_pvr',
+    'pvr_away': 'away_pvr'
+}
+
+
+def table_columns(conn, table: str) -> set:
+    return {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
+
+
+def add_pick_columns(conn):
+    """Add whichever PICK_COLUMNS an older picks table lacks and carry legacy columns over"""
+    existing = table_columns(conn, 'picks')
+    for column, column_type in PICK_COLUMNS.items():
+        if column not in existing:
+            conn.execute(f'ALTER TABLE picks ADD COLUMN {column} {column_type}')
+    for legacy, column in LEGACY_PICK_COLUMNS.items():
+        if legacy in existing:
+            conn.execute(f'UPDATE picks SET {column} = {legacy} WHERE {column} IS NULL')
+    # Picks written before totals/moneylines were analyzed are all spreads
+    conn.execute("UPDATE picks SET market = 'spreads' WHERE market IS NULL")
+
+
+def collapse_duplicate_picks(conn):
+    """
+    Backfill the natural key (game, pick_side, pick_date) and collapse the near-duplicate
+    rows older terminals wrote every cycle into one row per key. Each distinct edge/spread
+    seen along the way is preserved in pick_history. Databases that already have a
+    natural-key index were collapsed before this was a migration.
+    """
+    if conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name IN ('idx_picks_natural_key', 'idx_picks_market_key')"
+    ).fetchone():
+        return
+    rows = conn.execute('SELECT id, timestamp, game, pick, edge, spread FROM picks ORDER BY id').fetchall()
+
+    groups = {}
+    for row in rows:
+        pick_id, timestamp, game, pick, edge, spread = row
+        key = (game, pick_side_from_text(pick), (timestamp or '')[:10] or None)
+        groups.setdefault(key, []).append(row)
+
+    conn.executemany(
+        'UPDATE picks SET pick_side = ?, pick_date = ? WHERE id = ?',
+        [(key[1], key[2], row[0]) for key, group in groups.items() for row in group]
+    )
+
+    history = []
+    duplicates = []
+    for group in groups.values():
+        keep_id = group[-1][0]
+        last_seen = None
+        for pick_id, timestamp, game, pick, edge, spread in group:
+            seen = (round(edge, 2) if edge is not None else None, spread)
+            if seen != last_seen:
+                history.append((keep_id, timestamp, pick, edge, spread))
+                last_seen = seen
+            if pick_id != keep_id:
+                duplicates.append((pick_id,))
+        conn.execute(
+            'UPDATE picks SET timestamp = ?, updated_at = ? WHERE id = ?',
+            (group[0][1], group[-1][1], keep_id)
+        )
+
+    conn.executemany(
+        'INSERT INTO pick_history (pick_id, recorded_at, pick, edge, spread) VALUES (?, ?, ?, ?, ?)',
+        history
+    )
+    conn.executemany('DELETE FROM picks WHERE id = ?', duplicates)
+
+    if duplicates:
+        logger.info(f"🧹 Collapsed {len(duplicates)} duplicate picks into {len(groups)} rows")
+
+
+def add_warehouse_minutes(conn):
+    """Warehouses built before minutes were parsed at ingestion get the columns and a backfill"""
+    if 'minutes' in table_columns(conn, 'player_seasons'):
+        return
+    conn.execute('ALTER TABLE player_seasons ADD COLUMN minutes REAL')
+    conn.execute('ALTER TABLE player_seasons ADD COLUMN minutes_malformed INTEGER NOT NULL DEFAULT 0')
+    stored = conn.execute('SELECT season, ordinal, data FROM player_seasons').fetchall()
+    minutes, malformed = parse_minutes([json.loads(row[2]).get('minutesPg') for row in stored])
+    conn.executemany('UPDATE player_seasons SET minutes = ?, minutes_malformed = ? WHERE season = ? AND ordinal = ?',
+                     [(value, int(bad), row[0], row[1])
+                      for row, value, bad in zip(stored, minutes.tolist(), malformed.tolist())])
+
+
+# Never edit or reorder a released migration: add a new version instead
+MIGRATIONS: Dict[str, List[Migration]] = {
+    'terminal': [
+        Migration(1, 'picks timestamp and edge indexes', (
+            'CREATE INDEX IF NOT EXISTS idx_picks_timestamp ON picks(timestamp, edge)',
+            'CREATE INDEX IF NOT EXISTS idx_picks_edge ON picks(edge, timestamp)',
+        )),
+        # One row of running totals so /api/stats and /api/live never aggregate picks. The
+        # triggers only fall back to MAX() (an index probe via v1) when the current max
+        # or latest row is deleted or lowered.
+        Migration(2, 'pick_summary maintained by triggers', (
+            '''CREATE TABLE IF NOT EXISTS pick_summary (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                pick_count INTEGER NOT NULL DEFAULT 0,
+                edge_count INTEGER NOT NULL DEFAULT 0,
+                edge_sum REAL NOT NULL DEFAULT 0,
+                max_edge REAL,
+                last_timestamp DATETIME
+            )''',
+            '''INSERT OR REPLACE INTO pick_summary (id, pick_count, edge_count, edge_sum, max_edge, last_timestamp)
+               SELECT 1, COUNT(*), COUNT(edge), COALESCE(SUM(edge), 0), MAX(edge), MAX(timestamp) FROM picks''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_pick_summary_insert AFTER INSERT ON picks BEGIN
+                UPDATE pick_summary SET
+                    pick_count = pick_count + 1,
+                    edge_count = edge_count + (NEW.edge IS NOT NULL),
+                    edge_sum = edge_sum + COALESCE(NEW.edge, 0),
+                    max_edge = CASE WHEN max_edge IS NULL OR NEW.edge > max_edge THEN NEW.edge ELSE max_edge END,
+                    last_timestamp = CASE WHEN last_timestamp IS NULL OR NEW.timestamp > last_timestamp
+                                          THEN NEW.timestamp ELSE last_timestamp END
+                WHERE id = 1;
+            END''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_pick_summary_update AFTER UPDATE OF edge, timestamp ON picks BEGIN
+                UPDATE pick_summary SET
+                    edge_count = edge_count + (NEW.edge IS NOT NULL) - (OLD.edge IS NOT NULL),
+                    edge_sum = edge_sum + COALESCE(NEW.edge, 0) - COALESCE(OLD.edge, 0),
+                    max_edge = CASE WHEN OLD.edge >= max_edge THEN (SELECT MAX(edge) FROM picks)
+                                    WHEN max_edge IS NULL OR NEW.edge > max_edge THEN NEW.edge
+                                    ELSE max_edge END,
+                    last_timestamp = CASE WHEN OLD.timestamp >= last_timestamp THEN (SELECT MAX(timestamp) FROM picks)
+                                          WHEN last_timestamp IS NULL OR NEW.timestamp > last_timestamp THEN NEW.timestamp
+                                          ELSE last_timestamp END
+                WHERE id = 1;
+            END''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_pick_summary_delete AFTER DELETE ON picks BEGIN
+                UPDATE pick_summary SET
+                    pick_count = pick_count - 1,
+                    edge_count = edge_count - (OLD.edge IS NOT NULL),
+                    edge_sum = edge_sum - COALESCE(OLD.edge, 0),
+                    max_edge = CASE WHEN OLD.edge >= max_edge THEN (SELECT MAX(edge) FROM picks) ELSE max_edge END,
+                    last_timestamp = CASE WHEN OLD.timestamp >= last_timestamp THEN (SELECT MAX(timestamp) FROM picks)
+                                          ELSE last_timestamp END
+                WHERE id = 1;
+            END''',
+        )),
+        # Append-only log of pick changes for the dashboard's event stream (core/pick_stream.py).
+        # AUTOINCREMENT keeps ids increasing after pruning so they work as SSE Last-Event-IDs;
+        # only the newest 5000 events are kept, older resumes get a full snapshot instead.
+        Migration(3, 'pick_events change log', (
+            '''CREATE TABLE IF NOT EXISTS pick_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                pick_id INTEGER NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_pick_events_insert AFTER INSERT ON picks BEGIN
+                INSERT INTO pick_events (kind, pick_id) VALUES ('pick', NEW.id);
+            END''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_pick_events_update AFTER UPDATE ON picks BEGIN
+                INSERT INTO pick_events (kind, pick_id) VALUES ('pick', NEW.id);
+            END''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_pick_events_delete AFTER DELETE ON picks BEGIN
+                INSERT INTO pick_events (kind, pick_id) VALUES ('delete', OLD.id);
+            END''',
+            '''CREATE TRIGGER IF NOT EXISTS trg_pick_events_prune AFTER INSERT ON pick_events BEGIN
+                DELETE FROM pick_events WHERE id <= NEW.id - 5000;
+            END''',
+        )),
+        # The terminal stamps pick_summary after every cycle, picks or not, with the time of
+        # its next cycle: liveness no longer depends on a new pick having been written
+        Migration(4, 'terminal heartbeat on pick_summary', (
+            'ALTER TABLE pick_summary ADD COLUMN heartbeat_at DATETIME',
+            'ALTER TABLE pick_summary ADD COLUMN next_cycle_at DATETIME',
+        )),
+        # v5-v7 were applied by the terminal's startup code before they were versioned, so
+        # they check the schema and are no-ops on databases that already have them
+        Migration(5, 'picks columns added after the original schema', (
+            add_pick_columns,
+        )),
+        # The natural key gained the market so a game can hold a spread, total and moneyline pick
+        Migration(6, 'one pick per game, market, side and date', (
+            collapse_duplicate_picks,
+            'DROP INDEX IF EXISTS idx_picks_natural_key',
+            'CREATE UNIQUE INDEX IF NOT EXISTS idx_picks_market_key ON picks(game, market, pick_side, pick_date)',
+        )),
+        # Line movement time series (core/line_store.py); the event index covers
+        # "all movements for this game" without touching the table
+        Migration(7, 'line_snapshots movement log', (
+            '''CREATE TABLE IF NOT EXISTS line_snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id TEXT NOT NULL,
+                bookmaker TEXT NOT NULL,
+                market TEXT NOT NULL DEFAULT 'spreads',
+                captured_at REAL NOT NULL,
+                commence_time TEXT,
+                home_team TEXT,
+                away_team TEXT,
+                home_point REAL,
+                away_point REAL,
+                home_price INTEGER,
+                away_price INTEGER
+            )''',
+            '''CREATE INDEX IF NOT EXISTS idx_line_snapshots_event
+               ON line_snapshots(event_id, market, captured_at, bookmaker,
+                                 home_point, away_point, home_price, away_price)''',
+            'CREATE INDEX IF NOT EXISTS idx_line_snapshots_captured ON line_snapshots(captured_at)',
+        )),
+    ],
+    'premium_api': [
+        Migration(1, 'api_usage endpoint breakdown index', (
+            'CREATE INDEX IF NOT EXISTS idx_api_usage_timestamp ON api_usage(api_key, timestamp)',
+            'CREATE INDEX IF NOT EXISTS idx_api_usage_endpoint ON api_usage(api_key, endpoint, response_time)',
+        )),
+    ],
+    'partnerships': [
+        Migration(1, 'partner analytics and webhook log indexes', (
+            'CREATE INDEX IF NOT EXISTS idx_partner_analytics_partner ON partner_analytics(partner_id, timestamp)',
+            'CREATE INDEX IF NOT EXISTS idx_webhook_logs_partner ON webhook_logs(partner_id, timestamp)',
+        )),
+    ],
+    'consulting': [
+        Migration(1, 'group feed indexes', (
+            'CREATE INDEX IF NOT EXISTS idx_group_picks_group ON group_picks(group_id, timestamp)',
+            'CREATE INDEX IF NOT EXISTS idx_group_chat_group ON group_chat(group_id, timestamp)',
+        )),
+    ],
+    'newsletter': [
+        Migration(1, 'email log per-subscriber index', (
+            'CREATE INDEX IF NOT EXISTS idx_email_log_subscriber ON email_log(subscriber_id, sent_at)',
+        )),
+    ],
+    'warehouse': [
+        Migration(1, 'player_seasons parsed minutes', (
+            add_warehouse_minutes,
+        )),
+    ],
+}
+
+# The queries the dashboard, API, bots, notifier and reports run on every request or cycle
+HOT_QUERIES: Dict[str, List[HotQuery]] = {
+    'terminal': [
+        HotQuery('/api/picks', 'SELECT * FROM picks ORDER BY timestamp DESC LIMIT 50', ordered=True),
+        HotQuery('/api/stats and /api/live', 'SELECT * FROM pick_summary WHERE id = 1', search=True),
+        HotQuery('summary max edge recompute', 'SELECT MAX(edge) FROM picks', search=True),
+        HotQuery('summary last timestamp recompute, discord', 'SELECT MAX(timestamp) FROM picks', search=True),
+        HotQuery('event stream poll', 'SELECT id, kind, pick_id FROM pick_events WHERE id > ? ORDER BY id LIMIT 500',
+                 (0,), ordered=True, search=True),
+        HotQuery('event stream picks', 'SELECT * FROM picks WHERE id IN (?, ?, ?)', (1, 2, 3), search=True),
+        HotQuery('bots and notifier', 'SELECT * FROM picks WHERE edge >= ? ORDER BY timestamp DESC LIMIT 10',
+                 (65,), ordered=True),
+        HotQuery('/v1/edges', 'SELECT * FROM picks WHERE edge >= ? AND timestamp > ? ORDER BY edge DESC LIMIT 50',
+                 (65, '2000-01-01 00:00:00'), search=True),
+        HotQuery('daily report range', 'SELECT * FROM picks WHERE timestamp BETWEEN ? AND ? ORDER BY edge DESC',
+                 ('2000-01-01', '2000-01-02'), search=True),
+        HotQuery('daily report last 24h',
+                 "SELECT * FROM picks WHERE timestamp >= datetime('now', '-24 hours') ORDER BY +edge DESC",
+                 search=True),
+        HotQuery('daily report 24h stats', "SELECT COUNT(*) FROM picks WHERE timestamp >= datetime('now', '-24 hours')",
+                 search=True),
+    ],
+    'premium_api': [
+        HotQuery('rate limit', 'SELECT COUNT(*) FROM api_usage WHERE api_key = ? AND timestamp > ?',
+                 ('key', '2000-01-01 00:00:00'), search=True),
+        HotQuery('usage by endpoint', '''
+            SELECT endpoint, COUNT(*), AVG(response_time) FROM api_usage
+            WHERE api_key = ? GROUP BY endpoint
+        ''', ('key',), search=True),
+    ],
+    'partnerships': [
+        HotQuery('partner analytics', '''
+            SELECT event_type, widget_type, COUNT(*), DATE(timestamp) FROM partner_analytics
+            WHERE partner_id = ? AND timestamp >= ? GROUP BY event_type, widget_type, DATE(timestamp)
+        ''', ('partner', '2000-01-01'), search=True),
+        HotQuery('webhook logs', 'SELECT * FROM webhook_logs WHERE partner_id = ? ORDER BY timestamp DESC LIMIT 50',
+                 ('partner',), ordered=True, search=True),
+    ],
+    'consulting': [
+        HotQuery('group picks', '''
+            SELECT p.*, m.username FROM group_picks p LEFT JOIN members m ON p.posted_by = m.id
+            WHERE p.group_id = ? ORDER BY p.timestamp DESC LIMIT 50
+        ''', ('group',), ordered=True, search=True),
+        HotQuery('group chat', '''
+            SELECT c.*, m.username, m.role FROM group_chat c JOIN members m ON c.member_id = m.id
+            WHERE c.group_id = ? ORDER BY c.timestamp DESC LIMIT 100
+        ''', ('group',), ordered=True, search=True),
+        HotQuery('group stats', 'SELECT COUNT(*), AVG(edge) FROM group_picks WHERE group_id = ?', ('group',),
+                 search=True),
+    ],
+    'newsletter': [
+        HotQuery('subscriber email history',
+                 'SELECT * FROM email_log WHERE subscriber_id = ? ORDER BY sent_at DESC LIMIT 20',
+                 (1,), ordered=True, search=True),
+    ],
+}
+
+# Tables each component's init function creates (its migrations build on them)
+COMPONENT_TABLES: Dict[str, Tuple[str, ...]] = {
+    'terminal': ('picks', 'pick_history'),
+    'premium_api': ('api_usage',),
+    'partnerships': ('partner_analytics', 'webhook_logs'),
+    'consulting': ('group_picks', 'group_chat', 'members'),
+    'newsletter': ('email_log',),
+    'warehouse': ('player_seasons',),
+}
+
+# Where each component's tables live when the CLI is run without --db
+DEFAULT_DATABASES: Dict[str, str] = {
+    'terminal': os.path.join(PROJECT_ROOT, 'taylor_62.db'),
+    'premium_api': os.path.join(PROJECT_ROOT, 'taylor_62.db'),
+    'partnerships': os.path.join(PROJECT_ROOT, 'taylor_62.db'),
+    'consulting': os.path.join(PROJECT_ROOT, 'premium', 'consulting_groups.db'),
+    'newsletter': os.path.join(PROJECT_ROOT, 'premium', 'newsletter.db'),
+    'warehouse': os.getenv('PLAYER_WAREHOUSE_DB', os.path.join(PROJECT_ROOT, 'player_warehouse.db')),
+}
+
+
+def ensure_migrations_table(conn):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            component TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            applied_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (component, version)
+        )
+    ''')
+
+
+def schema_version(conn, component: str) -> int:
+    """Highest migration version applied for `component` (0 if none)"""
+    ensure_migrations_table(conn)
+    row = conn.execute('SELECT MAX(version) FROM schema_migrations WHERE component = ?', (component,)).fetchone()
+    return row[0] or 0
+
+
+def run_migrations(conn, component: str) -> int:
+    """
+    Apply every pending migration for `component`, each in its own transaction
+    together with its schema_migrations row. Call after the component's CREATE TABLEs;
+    safe to call on every startup. Returns the resulting schema version.
+    """
+    if conn.in_transaction:
+        conn.commit()
+    current = schema_version(conn, component)
+    for migration in MIGRATIONS[component]:
+        if migration.version <= current:
+            continue
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # Another process may have applied it while we waited for the write lock
+            if conn.execute('SELECT 1 FROM schema_migrations WHERE component = ? AND version = ?',
+                            (component, migration.version)).fetchone():
+                conn.rollback()
+                continue
+            for statement in migration.statements:
+                if callable(statement):
+                    statement(conn)
+                else:
+                    conn.execute(statement)
+            conn.execute('INSERT INTO schema_migrations (component, version, name) VALUES (?, ?, ?)',
+                         (component, migration.version, migration.name))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            logger.error(f"❌ Migration {component} v{migration.version} ({migration.name}) failed")
+            raise
+        logger.info(f"✅ Applied migration {component} v{migration.version}: {migration.name}")
+        current = migration.version
+    return current
+
+
+def query_plan(conn, sql: str, params: Tuple = ()) -> List[str]:
+    """EXPLAIN QUERY PLAN detail lines for a query"""
+    return [row[-1] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()]
+
+
+def plan_problems(plan: List[str], ordered: bool = False, search: bool = False) -> List[str]:
+    """Full table scans (and, for ordered queries, sorts; for search queries, any scan) in a query plan"""
+    problems = [step for step in plan if step.startswith('SCAN ') and (search or ' USING ' not in step)]
+    if ordered:
+        problems += [step for step in plan if 'TEMP B-TREE FOR ORDER BY' in step]
+    return problems
+
+
+def tables_exist(conn, component: str) -> bool:
+    """Whether the component's own tables exist in this database"""
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return set(COMPONENT_TABLES[component]) <= tables
+
+
+def check_query_plans(conn, component: str) -> Dict[str, List[str]]:
+    """Hot queries of `component` that are not served by an index, with the offending plan steps"""
+    failures = {}
+    for query in HOT_QUERIES.get(component, []):
+        problems = plan_problems(query_plan(conn, query.sql, query.params), query.ordered, query.search)
+        if problems:
+            failures[query.name] = problems
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--db', help='database file (default: each component\'s own database)')
+    parser.add_argument('--component', choices=sorted(MIGRATIONS), action='append',
+                        help='component to migrate (repeatable, default: all)')
+    parser.add_argument('--check', action='store_true', help='fail if a hot query does not use an index')
+    args = parser.parse_args(argv)
+
+    failed = False
+    for component in args.component or sorted(MIGRATIONS):
+        path = args.db or DEFAULT_DATABASES[component]
+        if not os.path.exists(path):
+            print(f"⚠️ {component}: {path} does not exist, skipping")
+            continue
+        conn = get_connection(path)
+        if not tables_exist(conn, component):
+            print(f"⚠️ {component}: tables not created in {path} yet, skipping")
+            conn.close()
+            continue
+        version = run_migrations(conn, component)
+        print(f"✅ {component}: schema version {version} ({path})")
+        if args.check:
+            failures = check_query_plans(conn, component)
+            for name, problems in failures.items():
+                print(f"   ❌ {name}: {'; '.join(problems)}")
+            failed = failed or bool(failures)
+            if not failures:
+                print(f"   ✅ {len(HOT_QUERIES.get(component, []))} hot queries use an index")
+        conn.close()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+TAYLOR VECTOR TERMINAL - Minutes Parser
+Normalizes a whole column of upstream minutes values ("MM:SS", "MM:SS:hundredths",
+"HH:MM:SS" or numeric) to float minutes in one pass and flags the malformed rows
+
+Run once at ingestion so downstream metric code only ever sees numbers. Results are
+bit-for-bit what the old per-player string splitting produced.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+MAX_PARTS = 3
+_ZERO, _NINE, _COLON = ord('0'), ord('9'), ord(':')
+MAX_WIDTH = 15  # longest string batched, so int64 field values stay exact
+
+
+def combine_parts(parts: Sequence[float]) -> float:
+    """Minutes from 1-3 ':'-separated numbers (three parts are HH:MM:SS only when the first exceeds 59)"""
+    if len(parts) == 1:
+        return parts[0]
+    if len(parts) == 2:  # MM:SS
+        return parts[0] + parts[1] / 60
+    if parts[0] > 59:  # HH:MM:SS
+        return parts[0] * 60 + parts[1] + parts[2] / 60
+    return parts[0] + parts[1] / 60 + parts[2] / 3600  # MM:SS:hundredths, e.g. "28:43:00"
+
+
+def parse_minutes_value(value) -> Tuple[float, bool]:
+    """(minutes, malformed) for one raw value; the path for anything the column parser can't batch"""
+    if not isinstance(value, str):
+        try:
+            return (float(value) if value else 0.0), False
+        except (TypeError, ValueError):
+            return 0.0, True
+    if not value.strip():
+        return 0.0, False
+    parts = value.split(':')
+    if len(parts) > MAX_PARTS:
+        return 0.0, True
+    try:
+        return combine_parts([float(part) for part in parts]), False
+    except ValueError:
+        return 0.0, True
+
+
+def _parse_digit_strings(codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized parse of ASCII rows made only of digits and ':' (uint8 matrix, NUL padded).
+    Returns (minutes, ok); rows with an empty field or too many ':' are not ok.
+    """
+    # Character positions as rows so every step below works on contiguous vectors
+    chars = np.ascontiguousarray(codes.T)
+    is_colon = chars == _COLON
+    colons = is_colon.sum(axis=0)
+    field = np.cumsum(is_colon, axis=0, dtype=np.int8)
+    is_digit = (chars >= _ZERO) & (chars <= _NINE)
+    digit = chars.astype(np.int64) - _ZERO
+
+    # Left to right over the (few) character positions, accumulating each field's integer value
+    values = np.zeros((MAX_PARTS, chars.shape[1]), dtype=np.int64)
+    digits = np.zeros((MAX_PARTS, chars.shape[1]), dtype=np.int8)
+    for position in range(chars.shape[0]):
+        for part in range(MAX_PARTS):
+            hit = is_digit[position] & (field[position] == part)
+            np.copyto(values[part], values[part] * 10 + digit[position], where=hit)
+            digits[part] += hit
+    values, digits = values.T, digits.T
+
+    used = np.arange(MAX_PARTS) <= colons[:, None]
+    ok = (colons < MAX_PARTS) & np.all(~used | (digits > 0), axis=1)
+    first, second, third = (values[:, i].astype(np.float64) for i in range(MAX_PARTS))
+
+    # Same operation order as combine_parts so results are bit-for-bit identical
+    minutes = np.where(colons == 0, first, first + second / 60)
+    hours = first * 60 + second + third / 60
+    hundredths = first + second / 60 + third / 3600
+    minutes = np.where(colons == 2, np.where(first > 59, hours, hundredths), minutes)
+    return np.where(ok, minutes, 0.0), ok
+
+
+def _byte_matrix(texts: List[str]) -> Optional[np.ndarray]:
+    """(rows, width) uint8 view of ASCII strings, NUL padded (None if any is non-ASCII)"""
+    try:
+        raw = np.array(texts, dtype=bytes)
+    except UnicodeEncodeError:
+        return None
+    return raw.view(np.uint8).reshape(len(texts), raw.itemsize)
+
+
+def parse_minutes(values: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (minutes, malformed) float64/bool arrays for a column of raw minutes values.
+
+    Numbers pass through, empty values (None, '', 0) are 0.0 and not malformed.
+    Strings of digits and ':' (virtually every upstream row) are parsed together
+    as one byte matrix; anything else falls back to the scalar parser. Unparseable
+    values (text, empty parts, more than three parts) are 0.0 and flagged.
+    """
+    values = values if isinstance(values, list) else list(values)
+    size = len(values)
+    minutes = np.zeros(size, dtype=np.float64)
+    malformed = np.zeros(size, dtype=bool)
+    if size == 0:
+        return minutes, malformed
+
+    # Common case: an all-ASCII string column goes straight into the byte matrix
+    codes = _byte_matrix(values) if set(map(type, values)) == {str} else None
+    if codes is not None:
+        rows = np.arange(size)
+    else:
+        batch = []
+        for row, value in enumerate(values):
+            if isinstance(value, str) and value.isascii():
+                batch.append(row)
+            else:
+                minutes[row], malformed[row] = parse_minutes_value(value)
+        if not batch:
+            return minutes, malformed
+        rows = np.asarray(batch, dtype=np.intp)
+        codes = _byte_matrix([values[row] for row in batch])
+
+    blank = ~codes.any(axis=1)
+    simple = ~blank & np.all(((codes >= _ZERO) & (codes <= _NINE)) | (codes == _COLON) | (codes == 0), axis=1)
+    if codes.shape[1] > MAX_WIDTH:
+        simple &= ~codes[:, MAX_WIDTH:].any(axis=1)
+
+    parsed, ok = _parse_digit_strings(codes[simple, :MAX_WIDTH])
+    minutes[rows[simple]] = parsed
+    malformed[rows[simple]] = ~ok
+
+    # Spaces, decimals, words... go through the scalar parser
+    for row in rows[~simple & ~blank].tolist():
+        minutes[row], malformed[row] = parse_minutes_value(values[row])
+    return minutes, malformed
+
+
+def normalize_minutes(rows: List[Dict], source: str = 'minutesPg', target: str = 'minutes') -> np.ndarray:
+    """Parse every row's `source` value in one pass, store the float under `target` and return the malformed mask"""
+    minutes, malformed = parse_minutes([row.get(source) for row in rows])
+    for row, value in zip(rows, minutes.tolist()):
+        row[target] = value
+    return malformed
+
+
+def malformed_summary(rows: List[Dict], malformed: np.ndarray, source: str = 'minutesPg', limit: int = 3) -> str:
+    """Count plus a few name=value examples of malformed rows, for a log line"""
+    examples = [f"{rows[i].get('playerName') or rows[i].get('player_name')}={rows[i].get(source)!r}"
+                for i in np.flatnonzero(malformed)[:limit].tolist()]
+    return f"{int(malformed.sum())} rows (e.g. {', '.join(examples)})"
@@ -0,0 +1,275 @@
+"""
+TAYLOR VECTOR TERMINAL - Live Pick Stream
+Server-Sent Events for the dashboard. One thread per web process tails the
+pick_events log the terminal's writes fill (core/migrations.py) and formats each
+change once for every connected client, so database load no longer grows with
+the number of open tabs. Event ids are pick_events ids: a reconnecting client's
+Last-Event-ID replays exactly what it missed.
+"""
+
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from core.db import get_connection
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = float(os.getenv('STREAM_POLL_INTERVAL', '1'))  # seconds between pick_events reads
+HEARTBEAT_INTERVAL = float(os.getenv('STREAM_HEARTBEAT', '15'))  # seconds between live-status events
+MAX_STREAM_AGE = float(os.getenv('STREAM_MAX_AGE', '300'))  # seconds before a client is asked to reconnect
+RECENT_PICKS = 50
+EVENT_BATCH = 500
+QUEUE_SIZE = 1000  # messages buffered per client before it is dropped (it resumes via Last-Event-ID)
+LIVE_WINDOW = 120  # seconds past its announced next cycle before the terminal counts as down
+
+# Each open stream holds one gthread worker thread for up to MAX_STREAM_AGE: past this many,
+# new streams are refused so /api/stats and the other routes keep threads to run on
+WEB_THREADS = int(os.getenv('WEB_THREADS', '32'))  # gunicorn --threads (see Procfile)
+STREAM_THREAD_SHARE = float(os.getenv('STREAM_THREAD_SHARE', '0.75'))
+MAX_SUBSCRIBERS = max(1, int(os.getenv('STREAM_MAX_SUBSCRIBERS', int(WEB_THREADS * STREAM_THREAD_SHARE))))
+
+
+def read_pick_summary(conn):
+    """
+    The one-row pick totals kept current by triggers on picks (core/migrations.py), or
+    None until the terminal has migrated this database. Readers never migrate: schema
+    changes are the terminal's job, and a web request shouldn't take the write lock.
+    """
+    try:
+        return conn.execute('SELECT * FROM pick_summary WHERE id = 1').fetchone()
+    except sqlite3.OperationalError:
+        return None
+
+
+def summary_stats(summary) -> Dict:
+    """/api/stats payload from a pick_summary row (all zeros without one)"""
+    if summary is None:
+        return {'total_picks': 0, 'avg_edge': 0, 'highest_edge': 0, 'last_updated': None, 'status': 'OFFLINE'}
+    avg_edge = summary['edge_sum'] / summary['edge_count'] if summary['edge_count'] else 0
+    highest_edge = summary['max_edge']
+    return {
+        'total_picks': summary['pick_count'],
+        'avg_edge': round(avg_edge, 2) if avg_edge else 0,
+        'highest_edge': round(highest_edge, 2) if highest_edge else 0,
+        'last_updated': summary['last_timestamp'],
+        'status': 'LIVE' if is_live(summary) else 'OFFLINE'
+    }
+
+
+def is_live(summary) -> bool:
+    """
+    Whether the terminal is running. It heartbeats pick_summary after every cycle with
+    the time of its next one (main.record_heartbeat) and stays live until LIVE_WINDOW
+    seconds past that, however long the poll scheduler sleeps between cycles.
+    """
+    if summary is None or 'heartbeat_at' not in summary.keys() or not summary['heartbeat_at']:
+        return False
+    deadline = datetime.strptime(summary['next_cycle_at'] or summary['heartbeat_at'], '%Y-%m-%d %H:%M:%S')
+    # CURRENT_TIMESTAMP is UTC
+    return datetime.utcnow() < deadline + timedelta(seconds=LIVE_WINDOW)
+
+
+def recent_picks(conn, limit: int = RECENT_PICKS) -> List[Dict]:
+    """Newest picks first (the /api/picks payload); empty before the terminal's first run"""
+    try:
+        rows = conn.execute('SELECT * FROM picks ORDER BY timestamp DESC LIMIT ?', (limit,)).fetchall()
+    except sqlite3.OperationalError:
+        return []
+    return [dict(row) for row in rows]
+
+
+def sse_message(event: str, data, event_id: Optional[int] = None) -> str:
+    """One Server-Sent Events frame (json.dumps never emits raw newlines)"""
+    head = f"id: {event_id}\n" if event_id is not None else ''
+    return f"{head}event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class Subscription:
+    """One connected client: a bounded queue of preformatted SSE frames"""
+
+    def __init__(self, stream: 'PickStream'):
+        self.stream = stream
+        self.queue: queue.Queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self.dropped = False
+
+    def put(self, message: str):
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            # Too slow to keep up: end the stream, the browser reconnects and replays
+            self.dropped = True
+
+    def get(self, timeout: float) -> Optional[str]:
+        """Next frame, or None after `timeout` seconds without one"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.stream.unsubscribe(self)
+
+
+class PickStream:
+    """Tails pick_events for this process and fans each change out to every subscriber"""
+
+    def __init__(self, db_file: str, poll: float = POLL_INTERVAL, max_subscribers: int = MAX_SUBSCRIBERS):
+        self.db_file = db_file
+        self.poll = poll
+        self.max_subscribers = max_subscribers
+        self.head = 0  # newest pick_events id already broadcast
+        self.summary = None
+
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _connect(self):
+        return get_connection(self.db_file, row_factory=sqlite3.Row)
+
+    def start(self) -> 'PickStream':
+        """Start the tailing thread (once per process)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='pick-stream', daemon=True)
+                self._thread.start()
+        return self
+
+    def live(self) -> bool:
+        return is_live(self.summary)
+
+    def subscribe(self, last_event_id: Optional[int] = None) -> Optional[Subscription]:
+        """
+        Register a client. A resume (`last_event_id`) gets every change since that id;
+        a new client, or one whose id has been pruned from the log, gets a snapshot.
+        Returns None once max_subscribers streams are open (the client should poll).
+        """
+        self.start()
+        subscription = Subscription(self)
+        conn = self._connect()
+        try:
+            with self._lock:
+                if len(self._subscribers) >= self.max_subscribers:
+                    return None
+                if not self._subscribers:
+                    # Nobody was listening, so the tail is idle: catch up to the log's end
+                    self.head = self._log_end(conn)
+                    self.summary = read_pick_summary(conn)
+                oldest = self._log_start(conn)
+                # Another worker's tail may be a poll ahead of ours: ids up to the log's end are
+                # valid, and anything past our head reaches this client through the next poll
+                resumable = (last_event_id is not None and last_event_id <= self._log_end(conn)
+                             and (oldest is None or last_event_id >= oldest - 1))
+                if resumable:
+                    for message in self._messages(conn, last_event_id, self.head)[0]:
+                        subscription.put(message)
+                else:
+                    summary = read_pick_summary(conn)
+                    subscription.put(sse_message('snapshot', {
+                        'picks': recent_picks(conn),
+                        'stats': summary_stats(summary),
+                        'live': is_live(summary)
+                    }, self.head))
+                self._subscribers.append(subscription)
+        finally:
+            conn.close()
+        return subscription
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    # Until the terminal creates pick_events the log reads as empty: clients get an empty
+    # snapshot and the tail keeps polling from id 0, picking up the first events it writes
+
+    def _log_start(self, conn) -> Optional[int]:
+        try:
+            return conn.execute('SELECT MIN(id) FROM pick_events').fetchone()[0]
+        except sqlite3.OperationalError:
+            return None
+
+    def _log_end(self, conn) -> int:
+        try:
+            return conn.execute('SELECT MAX(id) FROM pick_events').fetchone()[0] or 0
+        except sqlite3.OperationalError:
+            return 0
+
+    def _messages(self, conn, after_id: int, up_to: Optional[int] = None) -> Tuple[List[str], int]:
+        """
+        SSE frames for pick_events after `after_id` (up to `up_to`): one per changed pick,
+        then the stats. Returns them with the id of the last event they cover.
+        """
+        events = []
+        while True:
+            try:
+                batch = conn.execute(
+                    'SELECT id, kind, pick_id FROM pick_events WHERE id > ? ORDER BY id LIMIT ?',
+                    (events[-1]['id'] if events else after_id, EVENT_BATCH)
+                ).fetchall()
+            except sqlite3.OperationalError:
+                return [], after_id
+            events += [event for event in batch if up_to is None or event['id'] <= up_to]
+            if len(batch) < EVENT_BATCH or (up_to is not None and batch[-1]['id'] >= up_to):
+                break
+        if not events:
+            return [], after_id
+
+        # Several writes to one pick collapse into its latest state
+        latest = {}
+        for event in events:
+            latest.pop(event['pick_id'], None)
+            latest[event['pick_id']] = event
+        ids = [pick_id for pick_id, event in latest.items() if event['kind'] != 'delete']
+        rows = {}
+        for i in range(0, len(ids), EVENT_BATCH):
+            chunk = ids[i:i + EVENT_BATCH]
+            placeholders = ', '.join('?' for _ in chunk)
+            rows.update((row['id'], dict(row)) for row in
+                        conn.execute(f'SELECT * FROM picks WHERE id IN ({placeholders})', chunk).fetchall())
+
+        messages = []
+        for pick_id, event in latest.items():
+            if pick_id in rows:
+                messages.append(sse_message('pick', rows[pick_id], event['id']))
+            else:
+                messages.append(sse_message('delete', {'id': pick_id}, event['id']))
+        self.summary = read_pick_summary(conn)
+        stats = {**summary_stats(self.summary), 'live': self.live()}
+        messages.append(sse_message('stats', stats, events[-1]['id']))
+        return messages, events[-1]['id']
+
+    def _run(self):
+        while True:
+            try:
+                self._tick()
+            except Exception as e:
+                logger.error(f"❌ Pick stream poll failed: {e}")
+            time.sleep(self.poll)
+
+    def _tick(self):
+        if not self._subscribers:
+            return
+        conn = self._connect()
+        try:
+            with self._lock:
+                messages, self.head = self._messages(conn, self.head)
+                if not messages:
+                    # Keep the heartbeat current for the 'live' events between changes
+                    self.summary = read_pick_summary(conn)
+                for subscription in self._subscribers:
+                    for message in messages:
+                        subscription.put(message)
+        finally:
+            conn.close()
@@ -0,0 +1,189 @@
+"""
+TAYLOR VECTOR TERMINAL - Player Frame
+Columnar, slotted container for a league of per-player stats: one NumPy array per
+stat plus an O(1) player_id index, with zero-copy row views that read like the
+stat dicts the rest of the code expects
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from core.metrics_engine import STAT_COLUMNS, compute_player_metrics, pace_for_teams
+
+TEXT_COLUMNS = ('player_id', 'player_name', 'team')
+NUMERIC_COLUMNS = ('games_played',) + STAT_COLUMNS
+
+
+class PlayerRow:
+    """Read-only view of one player in a PlayerFrame; supports row['pts'] and row.get('pts', 0)"""
+
+    __slots__ = ('frame', 'index')
+
+    def __init__(self, frame: 'PlayerFrame', index: int):
+        self.frame = frame
+        self.index = index
+
+    def __getitem__(self, key: str):
+        return self.frame.columns[key][self.index].item() if key in self.frame.numeric \
+            else self.frame.columns[key][self.index]
+
+    def get(self, key: str, default=None):
+        if key not in self.frame.columns:
+            return default
+        return self[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.frame.columns
+
+    def keys(self):
+        return self.frame.columns.keys()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.frame.columns)
+
+    def __len__(self) -> int:
+        return len(self.frame.columns)
+
+    def items(self):
+        return ((key, self[key]) for key in self.frame.columns)
+
+    def to_dict(self) -> Dict:
+        """A standalone stat dict (copies the values)"""
+        return dict(self.items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PlayerRow):
+            return self.to_dict() == other.to_dict()
+        return isinstance(other, dict) and self.to_dict() == other
+
+    def __repr__(self) -> str:
+        return f"PlayerRow({self.to_dict()!r})"
+
+
+class PlayerFrame:
+    """
+    Immutable table of players. Numeric stats are float64 columns (so whole-league
+    filters, sorts and metrics are single NumPy operations); text columns are object
+    arrays. take/filter/sort_by return new frames and never modify this one.
+    """
+
+    __slots__ = ('columns', 'numeric', '_index', '_metrics')
+
+    def __init__(self, columns: Dict[str, np.ndarray], numeric: Iterable[str]):
+        self.columns = columns
+        self.numeric = frozenset(numeric)
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"PlayerFrame columns differ in length: {sorted(lengths)}")
+        self._index: Optional[Dict[str, int]] = None
+        self._metrics: Optional[Dict[str, np.ndarray]] = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict], numeric: Sequence[str] = NUMERIC_COLUMNS,
+                     text: Sequence[str] = TEXT_COLUMNS) -> 'PlayerFrame':
+        """Build from per-player stat dicts (missing numeric values -> 0, missing text -> None)"""
+        records = records if isinstance(records, list) else list(records)
+        columns = {}
+        for key in text:
+            column = np.empty(len(records), dtype=object)
+            column[:] = [record.get(key) for record in records]
+            columns[key] = column
+        for key in numeric:
+            columns[key] = np.fromiter((record.get(key, 0) or 0 for record in records),
+                                       dtype=np.float64, count=len(records))
+        return cls(columns, numeric)
+
+    @classmethod
+    def from_columns(cls, data: Dict) -> 'PlayerFrame':
+        """Rebuild from to_columns() output"""
+        columns = {}
+        for key, values in data['text'].items():
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            columns[key] = column
+        for key, values in data['numeric'].items():
+            columns[key] = np.asarray(values, dtype=np.float64)
+        return cls(columns, data['numeric'].keys())
+
+    @classmethod
+    def from_snapshot(cls, data) -> 'PlayerFrame':
+        """Accept a frame, its to_columns() form or a legacy list of stat dicts"""
+        if isinstance(data, PlayerFrame):
+            return data
+        if isinstance(data, dict):
+            return cls.from_columns(data)
+        return cls.from_records(data or [])
+
+    def to_columns(self) -> Dict:
+        """JSON-serializable column lists (used for snapshot hashing and disk persistence)"""
+        return {
+            'text': {key: column.tolist() for key, column in self.columns.items() if key not in self.numeric},
+            'numeric': {key: column.tolist() for key, column in self.columns.items() if key in self.numeric}
+        }
+
+    def to_records(self) -> List[Dict]:
+        """Materialize the list-of-dicts form (for JSON responses and legacy callers)"""
+        return [row.to_dict() for row in self]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __iter__(self) -> Iterator[PlayerRow]:
+        return (PlayerRow(self, i) for i in range(len(self)))
+
+    def __getitem__(self, key):
+        """frame['pts'] -> column array; frame[3] -> row view"""
+        if isinstance(key, str):
+            return self.columns[key]
+        index = int(key)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(key)
+        return PlayerRow(self, index)
+
+    def row(self, index: int) -> PlayerRow:
+        return self[index]
+
+    def lookup(self, player_id: str) -> Optional[PlayerRow]:
+        """Row view for a player_id (slug), built into a dict index on first use"""
+        if self._index is None:
+            ids = self.columns.get('player_id')
+            self._index = {} if ids is None else {pid: i for i, pid in enumerate(ids.tolist())}
+        index = self._index.get(player_id)
+        return None if index is None else PlayerRow(self, index)
+
+    def take(self, indices) -> 'PlayerFrame':
+        """New frame holding the given rows, in that order"""
+        indices = np.asarray(indices, dtype=np.intp)
+        return PlayerFrame({key: column[indices] for key, column in self.columns.items()}, self.numeric)
+
+    def filter(self, mask) -> 'PlayerFrame':
+        """New frame with the rows where `mask` is true"""
+        return self.take(np.flatnonzero(mask))
+
+    def sort_by(self, key: str, descending: bool = False) -> 'PlayerFrame':
+        """New frame ordered by one column (stable, ties keep their current order)"""
+        values = self.columns[key]
+        order = np.argsort(-values if descending else values, kind='stable') if key in self.numeric \
+            else np.array(sorted(range(len(self)), key=values.__getitem__, reverse=descending), dtype=np.intp)
+        return self.take(order)
+
+    def group_indices(self, key: str = 'team') -> Dict[str, np.ndarray]:
+        """{value: row indices} for a text column, groups and rows in frame order"""
+        groups = defaultdict(list)
+        for i, value in enumerate(self.columns[key].tolist()):
+            groups[value].append(i)
+        return {value: np.array(rows, dtype=np.intp) for value, rows in groups.items()}
+
+    def metrics(self) -> Dict[str, np.ndarray]:
+        """Per-player TUSG%/PVR/AST-TOV/multiplier at each player's team pace (computed once)"""
+        if self._metrics is None:
+            self._metrics = compute_player_metrics(self.columns, pace_for_teams(self.columns['team'].tolist()))
+        return self._metrics
+
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (object columns count their pointers only)"""
+        return sum(column.nbytes for column in self.columns.values())
@@ -0,0 +1,44 @@
+"""
+TAYLOR VECTOR TERMINAL - Player Store
+Team-indexed view of a season stats snapshot with precomputed team TUSG%/PVR
+"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+from core.metrics import TEAM_MAPPING
+from core.metrics_engine import qualified_mask, team_average
+from core.player_frame import PlayerFrame
+
+DEFAULT_TEAM_TUSG = 50.0
+DEFAULT_TEAM_PVR = 0.0
+
+
+class PlayerStore:
+    """Team TUSG%/PVR by team abbreviation, built once per stats snapshot"""
+
+    def __init__(self, player_stats: Union[PlayerFrame, List[Dict]], version: Optional[int] = None):
+        self.version = version
+        self.frame = PlayerFrame.from_snapshot(player_stats)
+        team_rows = self.frame.group_indices('team')
+
+        # Whole-league metrics in one vectorized pass, then sliced per team
+        metrics = self.frame.metrics()
+        qualified = qualified_mask(self.frame['min'])
+        self.team_tusg: Dict[str, float] = {}
+        self.team_pvr: Dict[str, float] = {}
+        for team_abbr, rows in team_rows.items():
+            team_qualified = qualified[rows]
+            team_tusg = metrics['tusg'][rows]
+            self.team_tusg[team_abbr] = team_average(team_tusg, team_qualified & (team_tusg > 0), DEFAULT_TEAM_TUSG)
+            self.team_pvr[team_abbr] = team_average(metrics['pvr'][rows], team_qualified, DEFAULT_TEAM_PVR)
+
+    def __len__(self):
+        return len(self.frame)
+
+    def team_metrics(self, team_name: str) -> Tuple[float, float]:
+        """(team TUSG%, team PVR) for a full team name, with neutral defaults for unknown teams"""
+        team_abbr = TEAM_MAPPING.get(team_name)
+        return (
+            self.team_tusg.get(team_abbr, DEFAULT_TEAM_TUSG),
+            self.team_pvr.get(team_abbr, DEFAULT_TEAM_PVR)
+        )
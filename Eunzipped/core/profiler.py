@@ -0,0 +1,126 @@
+"""
+TAYLOR VECTOR TERMINAL - Cycle Profiler
+Wall time per analyze() stage with rolling p50/p95/p99, plus per-cycle counters,
+written to a JSON metrics file the web dashboard charts
+"""
+
+import json
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SIZE = 120  # recent cycles kept verbatim for time-series charts
+
+
+class CycleProfiler:
+    """
+    Times named stages inside a cycle. Nested stages are exclusive: time spent in
+    an inner stage (e.g. persist inside evaluate) is not counted again by the outer one.
+    """
+
+    def __init__(self, window: int = 500, metrics_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.window = window
+        self.metrics_path = metrics_path
+        self.clock = clock
+
+        self.samples: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.window))
+        self.totals: Dict[str, int] = defaultdict(int)
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self.cycles = 0
+
+        self._cycle_start = None
+        self._stages: Dict[str, float] = defaultdict(float)
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._stack = []
+
+    def begin_cycle(self):
+        self._cycle_start = self.clock()
+        self._stages = defaultdict(float)
+        self._counters = defaultdict(int)
+        self._stack = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block as `name` for this cycle"""
+        start = self.clock()
+        self._stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            nested = self._stack.pop()
+            self._stages[name] += elapsed - nested
+            if self._stack:
+                self._stack[-1] += elapsed
+
+    def count(self, name: str, n: int = 1):
+        """Add to a per-cycle counter (games processed, rows written, ...)"""
+        self._counters[name] += n
+
+    def end_cycle(self) -> Dict:
+        """Close the cycle, fold it into the rolling window and write the metrics file"""
+        if self._cycle_start is None:
+            return {}
+        stages = {name: seconds * 1000 for name, seconds in self._stages.items()}
+        stages['total'] = (self.clock() - self._cycle_start) * 1000
+        self._cycle_start = None
+
+        for name, ms in stages.items():
+            self.samples[name].append(ms)
+        for name, n in self._counters.items():
+            self.totals[name] += n
+        self.cycles += 1
+
+        cycle = {
+            't': time.time(),
+            'stages_ms': {name: round(ms, 3) for name, ms in stages.items()},
+            'counters': dict(self._counters)
+        }
+        self.history.append(cycle)
+        self._save()
+        return cycle
+
+    def summary(self) -> Dict:
+        """Rolling percentiles per stage (ms) and counter totals"""
+        stages = {}
+        for name, values in self.samples.items():
+            p50, p95, p99 = np.percentile(np.fromiter(values, dtype=np.float64), [50, 95, 99])
+            stages[name] = {
+                'p50': round(float(p50), 3),
+                'p95': round(float(p95), 3),
+                'p99': round(float(p99), 3),
+                'max': round(max(values), 3),
+                'samples': len(values)
+            }
+        return {
+            'updated_at': time.time(),
+            'cycles': self.cycles,
+            'window': self.window,
+            'stages': stages,
+            'counters': dict(self.totals),
+            'last': self.history[-1] if self.history else None,
+            'history': list(self.history)
+        }
+
+    def _save(self):
+        """Atomically write summary() for the web dashboard"""
+        if not self.metrics_path:
+            return
+        try:
+            directory = os.path.dirname(self.metrics_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.metrics_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.summary(), f)
+            os.replace(tmp_path, self.metrics_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write cycle metrics {self.metrics_path}: {e}")
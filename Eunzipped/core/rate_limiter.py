@@ -0,0 +1,48 @@
+"""
+TAYLOR VECTOR TERMINAL - Rate Limiter
+Thread-safe token bucket used to keep concurrent upstream fetches inside a request budget
+"""
+
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second with bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request slot is available (no-op when rate <= 0)"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_host_limiters: Dict[str, RateLimiter] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def host_limiter(url: str, rate: float, burst: int = 1) -> RateLimiter:
+    """The process-wide limiter for a URL's host, created with `rate`/`burst` on first use"""
+    host = urlsplit(url).netloc
+    with _host_limiters_lock:
+        if host not in _host_limiters:
+            _host_limiters[host] = RateLimiter(rate, burst)
+        return _host_limiters[host]
@@ -0,0 +1,145 @@
+"""
+TAYLOR VECTOR TERMINAL - Background Refresher
+Keeps a SnapshotCache current from a daemon thread so request handlers only ever
+read the last snapshot. Processes sharing the cache dir (gunicorn workers) take a
+file lock so one of them runs the loader and the others pick its result up from disk.
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from core.snapshot_cache import SnapshotCache
+
+try:
+    import fcntl
+except ImportError:  # Windows dev boxes: no cross-process lock, every process refreshes
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = float(os.getenv('REFRESHER_POLL_INTERVAL', '15'))  # seconds between staleness checks
+# Manual refreshes within this many seconds of the last refresh (or request) are ignored
+MANUAL_REFRESH_COOLDOWN = float(os.getenv('REFRESHER_MANUAL_COOLDOWN', '300'))
+
+
+def iso_timestamp(epoch: Optional[float]) -> Optional[str]:
+    """UTC ISO-8601 form of an epoch timestamp (None stays None)"""
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat() if epoch else None
+
+
+class BackgroundRefresher:
+    """Refreshes `cache` every `interval` seconds (the cache TTL by default) off the request path"""
+
+    def __init__(self, cache: SnapshotCache, interval: Optional[float] = None, poll: float = POLL_INTERVAL,
+                 cooldown: float = MANUAL_REFRESH_COOLDOWN):
+        self.cache = cache
+        self.interval = cache.ttl if interval is None else interval
+        self.cache.ttl = self.interval
+        self.poll = min(poll, self.interval)
+        self.cooldown = cooldown
+        self.refreshing = False
+
+        self._requested_at: Optional[float] = None
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def lock_path(self) -> Optional[str]:
+        return f"{self.cache.path}.lock" if self.cache.path else None
+
+    def start(self) -> 'BackgroundRefresher':
+        """Start the refresh thread (once per process)"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name=f"refresh-{self.cache.name}", daemon=True)
+                self._thread.start()
+        return self
+
+    def cooldown_remaining(self) -> float:
+        """Seconds until a manual refresh is accepted again (0 if it would be now)"""
+        self.cache.reload()
+        last = max(self.cache.fetched_at or 0, self._requested_at or 0)
+        return max(0.0, last + self.cooldown - self.cache.clock())
+
+    def request_refresh(self) -> bool:
+        """
+        Manual refresh hook: reload now instead of waiting for the interval. Ignored (returns
+        False) within `cooldown` seconds of the last refresh, which every process sharing the
+        cache dir sees, or of the last accepted request to this process.
+        """
+        if self.cooldown_remaining() > 0:
+            return False
+        self._requested_at = self.cache.clock()
+        self._wake.set()
+        self.start()
+        return True
+
+    def snapshot(self) -> Dict:
+        """The current snapshot and its freshness, without ever calling the loader"""
+        self.cache.reload()
+        fetched_at = self.cache.fetched_at or None
+        return {
+            'data': self.cache.data,
+            'version': self.cache.version,
+            'refreshed_at': iso_timestamp(fetched_at),
+            'stale_at': iso_timestamp(fetched_at + self.interval) if fetched_at else None,
+            'stale': self.cache.stale or not self.cache.is_fresh(),
+            'refreshing': self.refreshing or self._forced()
+        }
+
+    def _forced(self) -> bool:
+        """A manual refresh was requested after the current snapshot was fetched"""
+        return self._requested_at is not None and self.cache.fetched_at < self._requested_at
+
+    def _due(self) -> bool:
+        return self._forced() or self.cache.needs_refresh()
+
+    def _run(self):
+        while True:
+            try:
+                self._tick()
+            except Exception as e:
+                logger.error(f"❌ Background refresh of '{self.cache.name}' failed: {e}")
+            self._wake.wait(self.poll)
+            self._wake.clear()
+
+    def _tick(self):
+        self.cache.reload()
+        if not self._due():
+            return
+        with self._process_lock() as held:
+            if not held:
+                return  # another process is refreshing; its snapshot arrives via reload()
+            # It may have finished between our check and taking the lock
+            self.cache.reload()
+            if not self._due():
+                return
+            self._requested_at = None
+            self.refreshing = True
+            try:
+                self.cache.refresh()
+            finally:
+                self.refreshing = False
+
+    @contextmanager
+    def _process_lock(self):
+        """Non-blocking exclusive lock shared by every process using the same cache dir"""
+        if fcntl is None or not self.lock_path:
+            yield True
+            return
+        os.makedirs(os.path.dirname(self.lock_path) or '.', exist_ok=True)
+        with open(self.lock_path, 'w') as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
@@ -0,0 +1,260 @@
+"""
+TAYLOR VECTOR TERMINAL - Record & Replay Harness
+Captures raw upstream responses during live operation and replays them through
+main.analyze() offline, as fast as possible and without network access
+
+Record:  TERMINAL_RECORD_PATH=recordings/live.jsonl.gz python main.py
+Replay:  python -m core.replay recordings/live.jsonl.gz [--save picks.json | --expect picks.json]
+"""
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+from core.db import get_connection
+from core.http_client import StoredResponse, normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Response headers worth keeping (validators and quota counters)
+RECORDED_HEADERS = {'content-type', 'etag', 'last-modified', 'x-requests-remaining', 'x-requests-used'}
+
+
+def replay_key(url: str) -> str:
+    """Path + query of a normalized URL, so a recording replays whatever base URLs are configured"""
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}"
+
+
+class HttpRecorder:
+    """Appends upstream responses and cycle markers to a gzip'd JSON-lines log"""
+
+    def __init__(self, path: str, meta: Optional[Dict] = None):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(path, 'at', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._write({'kind': 'session', 't': time.time(), 'meta': meta or {}})
+
+    def _write(self, event: Dict):
+        with self._lock:
+            self._file.write(json.dumps(event, separators=(',', ':')) + '\n')
+
+    def mark_cycle(self):
+        """Start a new analyze() cycle in the log"""
+        self._write({'kind': 'cycle', 't': time.time()})
+
+    def end_cycle(self):
+        """Mark the current cycle complete and flush it, so a killed process loses at most the cycle in flight"""
+        self._write({'kind': 'cycle_end', 't': time.time()})
+        with self._lock:
+            self._file.flush()
+
+    def record(self, url: str, response, params=None):
+        """Store one upstream response"""
+        self._write({
+            'kind': 'response',
+            't': time.time(),
+            'url': normalize_url(url, params),
+            'status': response.status_code,
+            'headers': {k.lower(): v for k, v in response.headers.items() if k.lower() in RECORDED_HEADERS},
+            'body': response.text
+        })
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class ReplayTransport:
+    """Serves recorded responses in order per URL; re-serves the last one when a URL runs dry"""
+
+    def __init__(self):
+        self.queues = defaultdict(deque)
+        self.last = {}
+        self.served = 0
+        self.misses = 0
+
+    def load(self, events: List[Dict]):
+        for event in events:
+            self.queues[replay_key(event['url'])].append(event)
+
+    def get(self, url, params=None, **kwargs):
+        key = replay_key(normalize_url(url, params))
+        if self.queues[key]:
+            self.last[key] = self.queues[key].popleft()
+        elif key not in self.last:
+            self.misses += 1
+            raise requests.ConnectionError(f"replay: no recorded response for {key}")
+        self.served += 1
+        return StoredResponse(self.last[key])
+
+
+def read_log(path: str):
+    """
+    Split a recording into (session meta, [(cycle time, [responses])]). A recording cut off
+    mid-write (the terminal was killed) keeps every cycle its recorder marked complete.
+    """
+    meta = {}
+    cycles = []
+    complete = 0
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                event = json.loads(line)
+                if event['kind'] == 'session':
+                    meta.update(event.get('meta', {}))
+                elif event['kind'] == 'cycle':
+                    cycles.append((event['t'], []))
+                elif event['kind'] == 'cycle_end':
+                    complete = len(cycles)
+                elif event['kind'] == 'response' and cycles:
+                    cycles[-1][1].append(event)
+    except (EOFError, gzip.BadGzipFile, json.JSONDecodeError, UnicodeDecodeError) as e:
+        # Recordings without cycle_end markers predate end_cycle(): only the cycle in flight is suspect
+        complete = complete or max(0, len(cycles) - 1)
+        logger.warning(f"⚠️ {path} is truncated ({e}), replaying its {complete} complete cycles")
+        cycles = cycles[:complete]
+    return meta, cycles
+
+
+def dump_picks(db_path: str) -> Dict:
+    """Deterministic view of the picks written during a replay"""
+    conn = get_connection(db_path)
+    picks = conn.execute('''
+        SELECT game, pick, pick_date, round(edge, 6), spread FROM picks ORDER BY game, pick_date, pick
+    ''').fetchall()
+    history = conn.execute('''
+        SELECT p.game, h.pick, round(h.edge, 6), h.spread
+        FROM pick_history h JOIN picks p ON p.id = h.pick_id
+        ORDER BY h.id
+    ''').fetchall()
+    conn.close()
+    return {'picks': [list(row) for row in picks], 'history': [list(row) for row in history]}
+
+
+def recorded_odds_markets(cycles) -> Optional[str]:
+    """`markets` parameter of the first recorded odds request"""
+    for _, responses in cycles:
+        for event in responses:
+            parts = urlsplit(event['url'])
+            if parts.path.endswith('/odds/'):
+                return dict(parse_qsl(parts.query)).get('markets')
+    return None
+
+
+def replay(path: str, repeat: int = 1, db_path: Optional[str] = None) -> Dict:
+    """Run every recorded cycle through main.analyze() against a scratch database"""
+    import main as terminal
+    from core.line_store import LineStore
+    from core.line_tracker import LineChangeTracker
+    from core.profiler import CycleProfiler
+    from core.scheduler import PollScheduler
+    from core.snapshot_cache import SnapshotCache
+
+    meta, cycles = read_log(path)
+    clock = {'now': cycles[0][0] if cycles else time.time()}
+    transport = ReplayTransport()
+
+    # Reproduce the recorded ingestion settings, minus all waiting
+    terminal.STATS_FETCH_MODE = meta.get('stats_fetch_mode', terminal.STATS_FETCH_MODE)
+    terminal.STATS_MAX_WORKERS = meta.get('stats_max_workers', terminal.STATS_MAX_WORKERS)
+    terminal.STATS_PAGE_DELAY = 0
+    # Request the same odds markets the recording did (older logs only hold spreads)
+    terminal.ODDS_MARKETS = recorded_odds_markets(cycles) or terminal.ODDS_MARKETS
+    terminal.stats_rate_limiter.rate = 0
+    terminal.http_get = transport.get
+    terminal.DB_FILE = db_path or os.path.join(tempfile.mkdtemp(prefix='tvt_replay_'), 'replay.db')
+    terminal.line_tracker = LineChangeTracker()
+    terminal.line_store = LineStore(terminal.DB_FILE)
+    terminal.poll_scheduler = PollScheduler(terminal.ODDS_DAILY_BUDGET, clock=lambda: clock['now'],
+                                            poll_cost=len(terminal.ODDS_MARKETS.split(',')))
+    terminal.cycle_profiler = CycleProfiler()
+    # Stats refresh exactly when the live run did (whenever the cycle holds a playertotals
+    # response) instead of re-deriving it from the TTL and slightly different timings
+    terminal.season_stats_cache = SnapshotCache(
+        terminal.season_stats_cache.name, terminal.season_stats_cache.loader,
+        ttl=float('inf'), cache_dir=None, clock=lambda: clock['now'],
+        encode=terminal.season_stats_cache.encode, decode=terminal.season_stats_cache.decode
+    )
+    stats_path = urlsplit(terminal.NBA_STATS_URL).path
+    terminal.init_database()
+
+    start = time.perf_counter()
+    result = None
+    for _ in range(repeat):
+        for cycle_time, responses in cycles:
+            clock['now'] = cycle_time
+            transport.load(responses)
+            if terminal.season_stats_cache.data is not None and \
+                    any(urlsplit(event['url']).path == stats_path for event in responses):
+                terminal.season_stats_cache.refresh()
+            terminal.analyze()
+        # Later passes only add benchmark load; the picks to compare come from the first
+        if result is None:
+            pass_time = time.perf_counter()
+            result = dump_picks(terminal.DB_FILE)
+            start += time.perf_counter() - pass_time
+    elapsed = time.perf_counter() - start
+
+    result['stats'] = {
+        'cycles': len(cycles) * repeat,
+        'elapsed': round(elapsed, 3),
+        'cycles_per_second': round(len(cycles) * repeat / elapsed, 1) if elapsed else None,
+        'responses_served': transport.served,
+        'responses_missing': transport.misses
+    }
+    result['stages'] = terminal.cycle_profiler.summary()['stages']
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a terminal recording through analyze()')
+    parser.add_argument('recording')
+    parser.add_argument('--repeat', type=int, default=1, help='replay the log N times (benchmarking; picks come from the first pass)')
+    parser.add_argument('--save', help='write the resulting picks to this JSON file')
+    parser.add_argument('--expect', help='fail unless picks match this JSON file')
+    parser.add_argument('--verbose', action='store_true', help='keep the terminal INFO logs')
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.INFO)
+
+    result = replay(args.recording, repeat=args.repeat)
+    stats = result['stats']
+    print(f"Replayed {stats['cycles']} cycles in {stats['elapsed']}s "
+          f"({stats['cycles_per_second']} cycles/s), {len(result['picks'])} picks, "
+          f"{stats['responses_missing']} missing responses")
+    for name, timing in result['stages'].items():
+        print(f"  {name:<12} p50 {timing['p50']:>8.2f}ms  p95 {timing['p95']:>8.2f}ms  p99 {timing['p99']:>8.2f}ms")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'picks': result['picks'], 'history': result['history']}, f, indent=2)
+        print(f"Saved picks to {args.save}")
+
+    if args.expect:
+        with open(args.expect, 'r') as f:
+            expected = json.load(f)
+        if expected['picks'] != result['picks'] or expected['history'] != result['history']:
+            print(f"❌ Picks differ from {args.expect}")
+            sys.exit(1)
+        print(f"✅ Picks identical to {args.expect}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+"""
+TAYLOR VECTOR TERMINAL - Adaptive Poll Scheduler
+Decides when the terminal polls The Odds API next: fast around tip-off and while
+lines are moving, slow when nothing is on the board, and never faster than the
+daily request budget allows. Every poll costs one credit per requested market.
+The provider's x-requests-remaining is a monthly quota: it only caps a day at its
+even share of what is left in the billing period, never the whole remainder.
+When the rest of the day's natural cadence (see demand()) costs more polls than are
+left, every interval is stretched by the same factor, so moving lines before tip-off
+and the tip-off window itself both keep polling instead of one starving the other.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Poll intervals in seconds, from most to least urgent
+FAST_INTERVAL = 30       # a game tips within NEAR_TIPOFF, or lines moved last cycle
+ACTIVE_INTERVAL = 120    # a game tips within SOON
+IDLE_INTERVAL = 600      # games later today
+MAX_INTERVAL = 1800      # nothing upcoming
+
+NEAR_TIPOFF = 30 * 60
+SOON = 3 * 3600
+TODAY = 12 * 3600
+LIVE_WINDOW = 3 * 3600   # a game that tipped this long ago may still be on the board
+
+
+def parse_commence_time(value: Optional[str]) -> Optional[float]:
+    """Epoch seconds for an Odds API commence_time ('2026-10-17T23:30:00Z')"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
+
+class PollScheduler:
+    """Plans the next odds poll from tip-off times, line movement and the daily budget"""
+
+    def __init__(self, daily_budget: int = 500, status_path: Optional[str] = None,
+                 clock: Callable[[], float] = time.time, poll_cost: int = 1, quota_reset_day: int = 1):
+        self.daily_budget = daily_budget
+        self.quota_reset_day = min(28, max(1, quota_reset_day))  # day of month the provider resets its quota
+        self.poll_cost = max(1, poll_cost)  # credits one odds request bills
+        self.status_path = status_path
+        self.clock = clock
+
+        self.day = self._day(clock())
+        self.requests_today = 0
+        self.upstream_remaining: Optional[int] = None  # monthly credits left, as the provider last reported
+        self.quota_resets = self._quota_resets(self.day)
+        self.next_tipoff: Optional[float] = None
+        self.tipoffs: List[float] = []
+        self.lines_moved = False
+        self.next_poll_at = clock()
+        self.interval = 0.0
+        self.reason = 'startup'
+        self._load_status()
+
+    @staticmethod
+    def _day(now: float) -> str:
+        return datetime.fromtimestamp(now, timezone.utc).strftime('%Y-%m-%d')
+
+    def _quota_resets(self, day: str) -> str:
+        """Date the provider's monthly quota next resets, as seen from `day`"""
+        date = datetime.strptime(day, '%Y-%m-%d')
+        if date.day >= self.quota_reset_day:
+            date = (date.replace(day=1) + timedelta(days=32)).replace(day=1)
+        return date.replace(day=self.quota_reset_day).strftime('%Y-%m-%d')
+
+    def _roll_day(self, now: float):
+        day = self._day(now)
+        if day != self.day:
+            self.day = day
+            self.requests_today = 0
+            quota_resets = self._quota_resets(day)
+            if quota_resets != self.quota_resets:
+                # New billing period: the last reported remainder is stale
+                self.quota_resets = quota_resets
+                self.upstream_remaining = None
+
+    @property
+    def quota_share(self) -> Optional[int]:
+        """
+        Credits today may spend of the provider's monthly quota: an even split, over the days
+        left in the billing period, of what was left this morning (None until it reports one)
+        """
+        if self.upstream_remaining is None:
+            return None
+        days_left = (datetime.strptime(self.quota_resets, '%Y-%m-%d') - datetime.strptime(self.day, '%Y-%m-%d')).days
+        return (self.upstream_remaining + self.requests_today) // max(1, days_left)
+
+    @property
+    def remaining_today(self) -> int:
+        """Requests left in today's budget (UTC day)"""
+        self._roll_day(self.clock())
+        budget = self.daily_budget
+        if self.quota_share is not None:
+            budget = min(budget, self.quota_share)
+        return max(0, budget - self.requests_today)
+
+    @property
+    def polls_left(self) -> int:
+        """Odds requests today's remaining credits pay for"""
+        return self.remaining_today // self.poll_cost
+
+    def record_request(self, upstream_remaining=None, cost: int = 1):
+        """Count one odds request (`cost` credits), noting the provider's x-requests-remaining when sent"""
+        self._roll_day(self.clock())
+        self.requests_today += cost
+        self.poll_cost = max(1, cost)
+        if upstream_remaining is not None:
+            try:
+                self.upstream_remaining = int(float(upstream_remaining))
+            except ValueError:
+                pass
+
+    def observe(self, games: Iterable[Dict], lines_moved: bool = False):
+        """Take in the latest odds payload: the earliest tip-off still relevant and whether lines moved"""
+        now = self.clock()
+        tipoffs = [t for t in (parse_commence_time(g.get('commence_time')) for g in games)
+                   if t is not None and t > now - LIVE_WINDOW]
+        self.tipoffs = sorted(tipoffs)
+        self.next_tipoff = self.tipoffs[0] if tipoffs else None
+        self.lines_moved = lines_moved
+
+    def plan(self) -> float:
+        """Pick the next poll time; returns seconds to sleep"""
+        now = self.clock()
+        until_tipoff = self.next_tipoff - now if self.next_tipoff is not None else None
+
+        if until_tipoff is None:
+            interval, reason = MAX_INTERVAL, 'no upcoming games'
+        elif until_tipoff <= NEAR_TIPOFF:
+            interval, reason = FAST_INTERVAL, 'near tip-off' if until_tipoff > 0 else 'games in progress'
+        elif self.lines_moved:
+            interval, reason = FAST_INTERVAL, 'lines moving'
+        elif until_tipoff <= SOON:
+            interval, reason = ACTIVE_INTERVAL, 'tip-off within 3h'
+        elif until_tipoff <= TODAY:
+            interval, reason = IDLE_INTERVAL, 'games later today'
+        else:
+            # Nothing to watch until the run-up to the next tip-off
+            interval = min(MAX_INTERVAL, max(IDLE_INTERVAL, until_tipoff - TODAY))
+            reason = 'next tip-off over 12h away'
+
+        interval, reason = self._pace(now, interval, reason)
+
+        self.interval = interval
+        self.reason = reason
+        self.next_poll_at = now + interval
+        self._save_status()
+        return interval
+
+    def _day_end(self) -> float:
+        return (datetime.strptime(self.day, '%Y-%m-%d').replace(tzinfo=timezone.utc) + timedelta(days=1)).timestamp()
+
+    def fast_windows(self):
+        """
+        [(start, end)] of today's fast polling: each game on the board from NEAR_TIPOFF before
+        its tip-off until it has been in progress for LIVE_WINDOW, overlapping games merged and
+        capped at the end of the UTC day (later polls come out of tomorrow's budget)
+        """
+        day_end = self._day_end()
+        windows = []
+        for tipoff in self.tipoffs:
+            start, end = tipoff - NEAR_TIPOFF, min(day_end, tipoff + LIVE_WINDOW)
+            if end <= start:
+                continue
+            if windows and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+            else:
+                windows.append((start, end))
+        return windows
+
+    def _cadence(self, at: float) -> float:
+        """Unconstrained interval at time `at`: the most urgent tier any game on the board puts it in"""
+        interval = MAX_INTERVAL
+        for tipoff in self.tipoffs:
+            until_tipoff = tipoff - at
+            if -LIVE_WINDOW < until_tipoff <= NEAR_TIPOFF:
+                return FAST_INTERVAL
+            if 0 < until_tipoff <= SOON:
+                interval = min(interval, ACTIVE_INTERVAL)
+            elif 0 < until_tipoff <= TODAY:
+                interval = min(interval, IDLE_INTERVAL)
+        return interval
+
+    def demand(self, now: Optional[float] = None) -> float:
+        """
+        Polls the rest of the UTC day takes at the unconstrained cadence: per game, IDLE_INTERVAL
+        from 12h before tip-off, ACTIVE_INTERVAL from 3h out and FAST_INTERVAL through its fast
+        window; MAX_INTERVAL whenever no game needs anything faster
+        """
+        now = self.clock() if now is None else now
+        day_end = self._day_end()
+        edges = {now, day_end}
+        for tipoff in self.tipoffs:
+            edges.update(tipoff - offset for offset in (TODAY, SOON, NEAR_TIPOFF, -LIVE_WINDOW))
+        edges = sorted(edge for edge in edges if now <= edge <= day_end)
+        return sum((end - start) / self._cadence((start + end) / 2)
+                   for start, end in zip(edges, edges[1:]))
+
+    def _pace(self, now: float, interval: float, reason: str):
+        """
+        Stretch `interval` so today's remaining polls last until the end of the UTC day.
+        When demand() exceeds the polls left, every tier is stretched by the same factor;
+        a poll sped up by moving lines is then paced like its tier, so reacting to a move
+        never spends polls the rest of the day was counting on.
+        """
+        polls = self.polls_left
+        seconds_left = max(1.0, self._day_end() - now)
+        if polls == 0:
+            return seconds_left, 'daily budget exhausted'
+
+        stretch = self.demand(now) / polls
+        if stretch > 1:
+            interval = max(interval, self._cadence(now)) * stretch
+            reason = f'{reason} (budget-limited)'
+        upcoming = [start for start, _ in self.fast_windows() if start > now]
+        if upcoming:
+            # Wake up for the start of the next fast window rather than sleeping past it
+            interval = min(interval, max(FAST_INTERVAL, upcoming[0] - now))
+        return min(interval, seconds_left), reason
+
+    def status(self) -> Dict:
+        """Current plan and quota, as served to the dashboard"""
+        return {
+            'next_poll_at': datetime.fromtimestamp(self.next_poll_at, timezone.utc).isoformat(),
+            'interval': round(self.interval, 1),
+            'reason': self.reason,
+            'next_tipoff': datetime.fromtimestamp(self.next_tipoff, timezone.utc).isoformat()
+            if self.next_tipoff is not None else None,
+            'day': self.day,
+            'daily_budget': self.daily_budget,
+            'requests_today': self.requests_today,
+            'remaining_today': self.remaining_today,
+            'poll_cost': self.poll_cost,
+            'polls_left': self.polls_left,
+            'upstream_remaining': self.upstream_remaining,
+            'quota_share': self.quota_share,
+            'quota_resets': self.quota_resets
+        }
+
+    def _load_status(self):
+        """Carry today's request count, and the quota left this billing period, over a restart"""
+        if not self.status_path or not os.path.exists(self.status_path):
+            return
+        try:
+            with open(self.status_path, 'r') as f:
+                stored = json.load(f)
+            if stored.get('day') == self.day:
+                self.requests_today = stored.get('requests_today', 0)
+            if stored.get('quota_resets') == self.quota_resets:
+                self.upstream_remaining = stored.get('upstream_remaining')
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable scheduler status {self.status_path}: {e}")
+
+    def _save_status(self):
+        """Atomically write status() for the web dashboard"""
+        if not self.status_path:
+            return
+        try:
+            directory = os.path.dirname(self.status_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.status_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.status(), f)
+            os.replace(tmp_path, self.status_path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not write scheduler status {self.status_path}: {e}")
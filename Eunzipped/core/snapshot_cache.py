@@ -0,0 +1,166 @@
+"""
+TAYLOR VECTOR TERMINAL - Snapshot Cache
+Keeps a parsed upstream snapshot in memory and on disk with a TTL, content-hash
+change detection and fallback to the last good snapshot when the upstream fails
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv('TERMINAL_CACHE_DIR', 'cache')
+RETRY_AFTER = 60  # seconds to wait before retrying a failed refresh
+
+
+def content_hash(data: Any) -> str:
+    """Stable SHA-256 of a JSON-serializable snapshot"""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, separators=(',', ':')).encode()).hexdigest()
+
+
+class SnapshotCache:
+    """TTL'd snapshot of `loader()` shared across terminal cycles"""
+
+    def __init__(self, name: str, loader: Callable[[], Any], ttl: float = 900,
+                 cache_dir: Optional[str] = CACHE_DIR, clock: Callable[[], float] = time.time,
+                 encode: Optional[Callable[[Any], Any]] = None, decode: Optional[Callable[[Any], Any]] = None):
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.clock = clock
+        # JSON form of a non-JSON snapshot (hashed and written to disk) and its inverse
+        self.encode = encode or (lambda data: data)
+        self.decode = decode or (lambda data: data)
+
+        self.data = None
+        self.content_hash = None
+        self.fetched_at = 0.0
+        self.version = 0
+        self.stale = False
+        self._next_attempt = 0.0
+        self._disk_checked = False
+        self._disk_mtime = None
+
+    @property
+    def path(self) -> Optional[str]:
+        """On-disk location of the snapshot (None when disk persistence is off)"""
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{self.name}.json")
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was last confirmed against the upstream"""
+        return self.clock() - self.fetched_at if self.fetched_at else float('inf')
+
+    def is_fresh(self) -> bool:
+        """True when the snapshot is younger than the TTL"""
+        return self.data is not None and self.age < self.ttl
+
+    def needs_refresh(self) -> bool:
+        """True when the TTL has expired and a failed refresh isn't backing off"""
+        return not self.is_fresh() and self.clock() >= self._next_attempt
+
+    def get(self) -> Any:
+        """Return the snapshot, refreshing it when the TTL has expired"""
+        if not self._disk_checked:
+            self._load_from_disk()
+
+        if self.needs_refresh():
+            self.refresh()
+        return self.data
+
+    def reload(self) -> bool:
+        """
+        Adopt a newer snapshot written to disk by another process sharing the cache dir
+        (one stat() when nothing changed); returns True if one was loaded
+        """
+        if not self.path:
+            return False
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return False
+        if mtime == self._disk_mtime:
+            return False
+        fetched_at = self.fetched_at
+        self._load_from_disk()
+        return self.fetched_at > fetched_at
+
+    def refresh(self) -> bool:
+        """Reload from the upstream; returns True if the content changed"""
+        now = self.clock()
+        try:
+            data = self.loader()
+        except Exception as e:
+            logger.error(f"❌ Snapshot '{self.name}' refresh failed: {e}")
+            data = None
+
+        if not data:
+            self._next_attempt = now + min(self.ttl, RETRY_AFTER)
+            if self.data is not None:
+                self.stale = True
+                logger.warning(f"⚠️ Serving last good '{self.name}' snapshot ({self.age:.0f}s old)")
+            return False
+
+        new_hash = content_hash(self.encode(data))
+        changed = new_hash != self.content_hash
+        if changed:
+            self.data = data
+            self.content_hash = new_hash
+            self.version += 1
+        self.fetched_at = now
+        self.stale = False
+        self._next_attempt = 0.0
+        self._save_to_disk()
+
+        if changed:
+            logger.info(f"✅ Snapshot '{self.name}' updated (v{self.version})")
+        else:
+            logger.info(f"✅ Snapshot '{self.name}' unchanged, TTL extended")
+        return changed
+
+    def _load_from_disk(self):
+        """Seed memory from the last snapshot written to disk"""
+        self._disk_checked = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            self._disk_mtime = os.path.getmtime(self.path)
+            with open(self.path, 'r') as f:
+                stored = json.load(f)
+            if stored['fetched_at'] <= self.fetched_at:
+                return
+            if stored['content_hash'] != self.content_hash:
+                self.data = self.decode(stored['data'])
+                self.content_hash = stored['content_hash']
+                self.version += 1
+            self.fetched_at = stored['fetched_at']
+            self.stale = False
+            logger.info(f"📦 Loaded '{self.name}' snapshot from disk ({self.age:.0f}s old)")
+        except Exception as e:
+            logger.warning(f"⚠️ Ignoring unreadable snapshot {self.path}: {e}")
+
+    def _save_to_disk(self):
+        """Atomically persist the snapshot"""
+        if not self.path:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'name': self.name,
+                    'fetched_at': self.fetched_at,
+                    'content_hash': self.content_hash,
+                    'data': self.encode(self.data)
+                }, f)
+            os.replace(tmp_path, self.path)
+            self._disk_mtime = os.path.getmtime(self.path)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not persist snapshot {self.path}: {e}")
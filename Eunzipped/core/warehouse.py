@@ -0,0 +1,398 @@
+"""
+TAYLOR VECTOR TERMINAL - Player Season Warehouse
+Local SQLite copy of the nbaapi playertotals rows (one per player, team and season)
+kept current by an incremental ingest job, so reports, tools and bots query
+indexed tables instead of re-downloading whole seasons on demand
+
+Completed seasons are downloaded once. The current season is re-walked page by page
+with conditional requests when the upstream sends validators, and a page is only
+rewritten when its content hash changed.
+
+Usage: python -m core.warehouse [--seasons 2015-2025] [--force]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from core.db import get_connection
+from core.http_client import http_get
+from core.ingest import fetch_pages_concurrent
+from core.migrations import run_migrations
+from core.minutes import malformed_summary, parse_minutes
+from core.rate_limiter import RateLimiter
+from core.snapshot_cache import content_hash
+
+logger = logging.getLogger(__name__)
+
+# One warehouse file per checkout, shared by the web app, premium jobs, tools and bots
+WAREHOUSE_DB = os.getenv('PLAYER_WAREHOUSE_DB', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'player_warehouse.db'))
+NBA_STATS_URL = os.getenv('NBA_STATS_URL', 'https://api.server.nbaapi.com/api/playertotals')
+
+FIRST_SEASON = 2015
+CURRENT_SEASON = int(os.getenv('CURRENT_SEASON', '2025'))
+PAGE_SIZE = 100
+MAX_WORKERS = int(os.getenv('WAREHOUSE_MAX_WORKERS', '4'))
+RATE_LIMIT = float(os.getenv('WAREHOUSE_RATE_LIMIT', '5'))  # requests/second, 0 = unlimited
+# A query for the current season triggers an incremental refresh once it is this old (seconds)
+REFRESH_TTL = float(os.getenv('WAREHOUSE_REFRESH_TTL', str(6 * 3600)))
+
+
+def row_slug(row: Dict) -> Optional[str]:
+    """Stable player key for a playertotals row"""
+    return row.get('slug') or row.get('playerId')
+
+
+class PlayerWarehouse:
+    """Incremental ingest into, and indexed queries over, the player_seasons table"""
+
+    def __init__(self, db_path: str = WAREHOUSE_DB, stats_url: str = NBA_STATS_URL,
+                 refresh_ttl: float = REFRESH_TTL, auto_ingest: bool = True):
+        self.db_path = db_path
+        self.stats_url = stats_url
+        self.refresh_ttl = refresh_ttl
+        self.auto_ingest = auto_ingest
+        self.limiter = RateLimiter(RATE_LIMIT, burst=MAX_WORKERS)
+        self._ingest_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self):
+        # Pooled per thread, in WAL mode so the web workers read while the nightly job writes
+        return get_connection(self.db_path, row_factory=sqlite3.Row)
+
+    def init_schema(self):
+        """Create the warehouse tables and indexes"""
+        if self._schema_ready:
+            return
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        cursor = conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS player_seasons (
+                season INTEGER NOT NULL,
+                ordinal INTEGER NOT NULL,
+                slug TEXT,
+                player_name TEXT,
+                name_key TEXT,
+                team TEXT,
+                position TEXT,
+                games INTEGER NOT NULL DEFAULT 0,
+                minutes REAL,
+                minutes_malformed INTEGER NOT NULL DEFAULT 0,
+                data TEXT NOT NULL,
+                PRIMARY KEY (season, ordinal)
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_seasons_slug ON player_seasons(slug, season)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_seasons_name ON player_seasons(name_key, season)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_seasons_team ON player_seasons(team, season)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_player_seasons_position ON player_seasons(season, position)')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS warehouse_pages (
+                season INTEGER NOT NULL,
+                page INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                row_count INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                changed_at REAL NOT NULL,
+                PRIMARY KEY (season, page)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS warehouse_seasons (
+                season INTEGER PRIMARY KEY,
+                pages INTEGER NOT NULL,
+                row_count INTEGER NOT NULL,
+                complete INTEGER NOT NULL DEFAULT 0,
+                refreshed_at REAL NOT NULL,
+                changed_at REAL
+            )
+        ''')
+        conn.commit()
+        # Columns added since (core/migrations.py)
+        run_migrations(conn, 'warehouse')
+        conn.close()
+        self._schema_ready = True
+
+    # ------------------------------------------------------------------ ingest
+
+    def season_status(self, season: int) -> Optional[Dict]:
+        """Ingest bookkeeping for one season (None if never ingested)"""
+        self.init_schema()
+        conn = self._connect()
+        row = conn.execute('SELECT * FROM warehouse_seasons WHERE season = ?', (season,)).fetchone()
+        conn.close()
+        return dict(row) if row else None
+
+    def needs_refresh(self, season: int) -> bool:
+        """Completed seasons are fetched once; the current one goes stale after refresh_ttl"""
+        status = self.season_status(season)
+        if status is None:
+            return True
+        if status['complete']:
+            return False
+        return time.time() - status['refreshed_at'] >= self.refresh_ttl
+
+    def _fetch_page(self, season: int, page: int, known: Dict, stored: Dict, fetched: Dict) -> List[Dict]:
+        """One playertotals page, replaying stored rows when the upstream answers 304"""
+        headers = {}
+        prior = known.get(page)
+        if prior and prior['etag']:
+            headers['If-None-Match'] = prior['etag']
+        if prior and prior['last_modified']:
+            headers['If-Modified-Since'] = prior['last_modified']
+
+        url = f"{self.stats_url}?season={season}&pageSize={PAGE_SIZE}&page={page}"
+        response = http_get(url, timeout=15, ttl=0, headers=headers or None)
+        if response.status_code == 304 and prior:
+            rows = stored.get(page, [])
+            fetched[page] = (rows, prior['etag'], prior['last_modified'], True)
+            return rows
+        if response.status_code != 200:
+            raise RuntimeError(f"nbaStats API failed: {response.status_code}")
+
+        rows = response.json().get('data', [])
+        fetched[page] = (rows, response.headers.get('ETag'), response.headers.get('Last-Modified'), False)
+        return rows
+
+    def ingest_season(self, season: int, force: bool = False) -> Dict:
+        """
+        Bring one season up to date. Unchanged pages cost a request (or a 304) but no
+        writes; a failed page aborts the season and leaves the stored rows untouched.
+        """
+        self.init_schema()
+        with self._ingest_lock:
+            if not force and not self.needs_refresh(season):
+                return {'season': season, 'skipped': True, 'requests': 0, 'changed_pages': 0}
+
+            conn = self._connect()
+            known = {row['page']: dict(row) for row in
+                     conn.execute('SELECT * FROM warehouse_pages WHERE season = ?', (season,))}
+            stored: Dict[int, List[Dict]] = {}
+            if any(page['etag'] or page['last_modified'] for page in known.values()):
+                for row in conn.execute('SELECT ordinal, data FROM player_seasons WHERE season = ? ORDER BY ordinal',
+                                        (season,)):
+                    stored.setdefault(row['ordinal'] // PAGE_SIZE + 1, []).append(json.loads(row['data']))
+            conn.close()
+
+            fetched: Dict[int, tuple] = {}
+            fetch_pages_concurrent(
+                lambda page: self._fetch_page(season, page, known, stored, fetched),
+                PAGE_SIZE,
+                max_workers=MAX_WORKERS,
+                limiter=self.limiter,
+                strict=True
+            )
+
+            # Pages past the first empty/short one were fetched speculatively and are ignored
+            pages = []
+            page = 1
+            while page in fetched and fetched[page][0]:
+                pages.append(page)
+                if len(fetched[page][0]) < PAGE_SIZE:
+                    break
+                page += 1
+
+            now = time.time()
+            changed = self._write_pages(season, pages, fetched, known, now, force)
+            total_rows = sum(len(fetched[page][0]) for page in pages)
+            complete = 1 if season < CURRENT_SEASON else 0
+
+            conn = self._connect()
+            conn.execute('''
+                INSERT INTO warehouse_seasons (season, pages, row_count, complete, refreshed_at, changed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(season) DO UPDATE SET
+                    pages = excluded.pages,
+                    row_count = excluded.row_count,
+                    complete = excluded.complete,
+                    refreshed_at = excluded.refreshed_at,
+                    changed_at = COALESCE(excluded.changed_at, warehouse_seasons.changed_at)
+            ''', (season, len(pages), total_rows, complete, now, now if changed else None))
+            conn.commit()
+            conn.close()
+
+            summary = {
+                'season': season,
+                'skipped': False,
+                'requests': len(fetched),
+                'not_modified': sum(1 for page in pages if fetched[page][3]),
+                'pages': len(pages),
+                'changed_pages': changed,
+                'rows': total_rows
+            }
+            logger.info(f"✅ Warehouse {season}: {total_rows} rows, {changed}/{len(pages)} pages changed")
+            return summary
+
+    def _write_pages(self, season: int, pages: List[int], fetched: Dict, known: Dict,
+                     now: float, force: bool) -> int:
+        """Rewrite the rows of changed pages in one transaction; returns how many changed"""
+        changed = 0
+        conn = self._connect()
+        try:
+            for page in pages:
+                rows, etag, last_modified, not_modified = fetched[page]
+                page_hash = known[page]['content_hash'] if not_modified else content_hash(rows)
+                prior = known.get(page)
+                if prior and prior['content_hash'] == page_hash and not force:
+                    conn.execute('''
+                        UPDATE warehouse_pages SET etag = ?, last_modified = ?, fetched_at = ?
+                        WHERE season = ? AND page = ?
+                    ''', (etag, last_modified, now, season, page))
+                    continue
+
+                first = (page - 1) * PAGE_SIZE
+                minutes, malformed = parse_minutes([row.get('minutesPg') for row in rows])
+                if malformed.any():
+                    logger.warning(f"⚠️ Warehouse {season} page {page} malformed minutes: "
+                                   f"{malformed_summary(rows, malformed)}")
+                conn.execute('DELETE FROM player_seasons WHERE season = ? AND ordinal >= ? AND ordinal < ?',
+                             (season, first, first + PAGE_SIZE))
+                conn.executemany('''
+                    INSERT INTO player_seasons (season, ordinal, slug, player_name, name_key, team, position, games,
+                                                minutes, minutes_malformed, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (season, first + i, row_slug(row), row.get('playerName'),
+                     (row.get('playerName') or '').lower(), row.get('team'), row.get('position'),
+                     int(row.get('games') or 0), value, int(bad), json.dumps(row))
+                    for i, (row, value, bad) in enumerate(zip(rows, minutes.tolist(), malformed.tolist()))
+                ])
+                conn.execute('''
+                    INSERT OR REPLACE INTO warehouse_pages
+                        (season, page, content_hash, etag, last_modified, row_count, fetched_at, changed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (season, page, page_hash, etag, last_modified, len(rows), now, now))
+                changed += 1
+
+            # The season got shorter (players consolidated or removed upstream)
+            last = pages[-1] if pages else 0
+            end = (last - 1) * PAGE_SIZE + len(fetched[last][0]) if pages else 0
+            removed = conn.execute('DELETE FROM player_seasons WHERE season = ? AND ordinal >= ?',
+                                   (season, end)).rowcount
+            conn.execute('DELETE FROM warehouse_pages WHERE season = ? AND page > ?', (season, last))
+            if removed:
+                changed += 1
+            conn.commit()
+        finally:
+            conn.close()
+        return changed
+
+    def ingest(self, seasons: Iterable[int], force: bool = False) -> List[Dict]:
+        """Incrementally ingest several seasons, continuing past failures"""
+        results = []
+        for season in seasons:
+            try:
+                results.append(self.ingest_season(season, force=force))
+            except Exception as e:
+                logger.error(f"❌ Warehouse ingest failed for {season}: {e}")
+                results.append({'season': season, 'error': str(e)})
+        return results
+
+    def ensure(self, seasons: Iterable[int]):
+        """Ingest any queried season that is missing or stale (no-op without auto_ingest)"""
+        if not self.auto_ingest:
+            return
+        for season in seasons:
+            if self.needs_refresh(season):
+                try:
+                    self.ingest_season(season)
+                except Exception as e:
+                    logger.warning(f"⚠️ Warehouse refresh for {season} failed, serving stored rows: {e}")
+
+    # ------------------------------------------------------------------ queries
+
+    def _query(self, sql: str, params: tuple) -> List[Dict]:
+        """
+        Decoded rows, each tagged with its season and with 'minutes' (float minutes parsed
+        from minutesPg at ingestion) and 'minutes_malformed'
+        """
+        self.init_schema()
+        conn = self._connect()
+        rows = []
+        for row in conn.execute(sql, params):
+            data = json.loads(row['data'])
+            data.setdefault('season', row['season'])
+            data['minutes'] = row['minutes'] or 0.0
+            data['minutes_malformed'] = bool(row['minutes_malformed'])
+            rows.append(data)
+        conn.close()
+        return rows
+
+    def season(self, season: int, team: Optional[str] = None, position: Optional[str] = None,
+               min_games: int = 0) -> List[Dict]:
+        """Raw playertotals rows for a season in upstream order, optionally by team/position"""
+        self.ensure([season])
+        sql = 'SELECT season, minutes, minutes_malformed, data FROM player_seasons WHERE season = ?'
+        params = [season]
+        if team:
+            sql += ' AND team = ?'
+            params.append(team)
+        if position:
+            sql += ' AND position = ?'
+            params.append(position)
+        if min_games:
+            sql += ' AND games >= ?'
+            params.append(min_games)
+        return self._query(sql + ' ORDER BY ordinal', tuple(params))
+
+    def player(self, slug_or_name: str, seasons: Optional[Iterable[int]] = None) -> List[Dict]:
+        """Every season row for one player (slug or case-insensitive full name), oldest first"""
+        seasons = list(seasons) if seasons is not None else list(range(FIRST_SEASON, CURRENT_SEASON + 1))
+        self.ensure(seasons)
+        placeholders = ','.join('?' * len(seasons))
+        return self._query(f'''
+            SELECT season, minutes, minutes_malformed, data FROM player_seasons
+            WHERE (slug = ? OR name_key = ?) AND season IN ({placeholders})
+            ORDER BY season, ordinal
+        ''', (slug_or_name, slug_or_name.lower(), *seasons))
+
+    def team(self, team: str, season: int = CURRENT_SEASON) -> List[Dict]:
+        """Rows for one team abbreviation in a season"""
+        return self.season(season, team=team)
+
+
+_warehouse = None
+_warehouse_lock = threading.Lock()
+
+
+def get_warehouse() -> PlayerWarehouse:
+    """The process-wide warehouse (created on first use)"""
+    global _warehouse
+    if _warehouse is None:
+        with _warehouse_lock:
+            if _warehouse is None:
+                _warehouse = PlayerWarehouse()
+    return _warehouse
+
+
+def parse_seasons(value: str) -> List[int]:
+    """'2015-2025' or '2024,2025' -> list of seasons"""
+    seasons = []
+    for part in value.split(','):
+        start, _, end = part.partition('-')
+        seasons.extend(range(int(start), int(end or start) + 1))
+    return seasons
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Incremental playertotals ingest into the local warehouse')
+    parser.add_argument('--seasons', default=f'{FIRST_SEASON}-{CURRENT_SEASON}')
+    parser.add_argument('--force', action='store_true', help='re-fetch and rewrite every page')
+    parser.add_argument('--db', default=WAREHOUSE_DB)
+    args = parser.parse_args()
+
+    warehouse = PlayerWarehouse(args.db)
+    for result in warehouse.ingest(parse_seasons(args.seasons), force=args.force):
+        print(json.dumps(result))
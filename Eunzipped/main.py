@@ -1,10 +1,28 @@
-import requests
-import sqlite3
 import time
 import logging
 import os
+import signal
+import sys
 from datetime import datetime
 
+from core.consensus import consensus_by_market, probability_to_american
+from core.db import get_connection
+from core.http_client import get_client
+from core.ingest import fetch_pages_concurrent
+from core.rate_limiter import RateLimiter
+from core.replay import HttpRecorder
+from core.line_store import LineStore
+from core.line_tracker import LineChangeTracker, event_key
+from core.markets import parse_markets, pick_side_from_text, supported_markets
+from core.metrics import TEAM_MAPPING, calculate_side_edge, calculate_total_edge
+from core.migrations import run_migrations
+from core.minutes import malformed_summary, parse_minutes
+from core.player_frame import PlayerFrame
+from core.player_store import PlayerStore
+from core.profiler import CycleProfiler
+from core.scheduler import PollScheduler
+from core.snapshot_cache import CACHE_DIR, SnapshotCache
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -15,9 +33,67 @@ BALLDONTLIE_API_KEY = os.getenv('BALLDONTLIE_API_KEY', 'eada3064-5b46-4fe0-948c-
 
 DB_FILE = 'taylor_62.db'
 
+# Upstream base URLs can point at benchmarks/fake_upstream.py for offline runs
+ODDS_API_BASE_URL = os.getenv('ODDS_API_BASE_URL', 'https://api.the-odds-api.com/v4')
+
+# Every market comes back in the same odds request; each has its own pick threshold.
+# Keys the terminal can't price (anything outside core.markets.SUPPORTED_MARKETS) are dropped.
+ODDS_MARKETS = ','.join(supported_markets(os.getenv('ODDS_MARKETS', 'spreads,totals,h2h')))
+MARKET_MIN_EDGE = {
+    'spreads': MIN_EDGE,
+    'totals': float(os.getenv('MIN_EDGE_TOTALS', '60')),  # a projection ~4.5 points off the line
+    'h2h': float(os.getenv('MIN_EDGE_H2H', '70'))
+}
+
+# Season stats ingestion: 'concurrent' fetches playertotals pages in parallel waves,
+# 'sequential' walks them one by one. STATS_RATE_LIMIT is requests/second (0 = unlimited).
+NBA_STATS_URL = os.getenv('NBA_STATS_URL', 'https://api.server.nbaapi.com/api/playertotals')
+STATS_PAGE_SIZE = 100
+STATS_FETCH_MODE = os.getenv('STATS_FETCH_MODE', 'concurrent')
+STATS_MAX_WORKERS = int(os.getenv('STATS_MAX_WORKERS', '8'))
+STATS_RATE_LIMIT = float(os.getenv('STATS_RATE_LIMIT', '10'))
+STATS_PAGE_DELAY = 0.3  # pause between pages in sequential mode
+
+stats_rate_limiter = RateLimiter(STATS_RATE_LIMIT, burst=STATS_MAX_WORKERS)
+
+# Season totals change a few times a night, so the parsed league is cached in memory
+# and on disk (cache/) and only re-downloaded once STATS_CACHE_TTL seconds have passed.
+SEASON = 2025
+STATS_CACHE_TTL = float(os.getenv('STATS_CACHE_TTL', '900'))
+
+# Odds polling adapts to tip-off times and line movement within a daily request budget;
+# the plan and remaining quota are written to SCHEDULER_STATUS_FILE for the dashboard
+ODDS_DAILY_BUDGET = int(os.getenv('ODDS_DAILY_BUDGET', '500'))
+ODDS_QUOTA_RESET_DAY = int(os.getenv('ODDS_QUOTA_RESET_DAY', '1'))  # day of month The Odds API quota renews
+SCHEDULER_STATUS_FILE = os.path.join(CACHE_DIR, 'scheduler.json')
+
+# Per-stage cycle timings (rolling p50/p95/p99) for the dashboard
+CYCLE_METRICS_FILE = os.path.join(CACHE_DIR, 'cycle_metrics.json')
+
+# Multi-bookmaker consensus values stored alongside each pick (see core/consensus.py).
+# For moneyline picks they describe the home side's implied win probability (0-1)
+# instead of a points line; the American price bet is in the price column.
+CONSENSUS_COLUMNS = ('consensus_spread', 'mean_spread', 'spread_stdev', 'best_spread', 'best_book', 'book_count')
+
+# Set TERMINAL_RECORD_PATH to capture every upstream response for offline replay (core/replay.py)
+RECORD_PATH = os.getenv('TERMINAL_RECORD_PATH')
+recorder = None
+
+def http_get(url, **kwargs):
+    """
+    GET an upstream URL through the shared pooled client, recording the response when a
+    recording is active. The HTTP disk cache is bypassed: season stats already go through
+    season_stats_cache and odds must always be live.
+    """
+    kwargs.setdefault('ttl', 0)
+    response = get_client().get(url, **kwargs)
+    if recorder:
+        recorder.record(url, response, params=kwargs.get('params'))
+    return response
+
 def init_database():
     """Initialize SQLite database"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     cursor = conn.cursor()
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS picks (
@@ -30,22 +106,52 @@ def init_database():
             away_tusg REAL,
             home_pvr REAL,
             away_pvr REAL,
-            spread REAL
+            spread REAL,
+            pick_side TEXT,
+            pick_date TEXT,
+            updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            consensus_spread REAL,
+            mean_spread REAL,
+            spread_stdev REAL,
+            best_spread REAL,
+            best_book TEXT,
+            book_count INTEGER,
+            market TEXT DEFAULT 'spreads',
+            price INTEGER
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS pick_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            pick_id INTEGER NOT NULL,
+            recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+            pick TEXT,
+            edge REAL,
+            spread REAL,
+            FOREIGN KEY (pick_id) REFERENCES picks(id)
         )
     ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_pick_history_pick ON pick_history(pick_id, recorded_at)')
     conn.commit()
+    
+    # Columns, keys and tables added since go through versioned migrations (core/migrations.py)
+    run_migrations(conn, 'terminal')
     conn.close()
+    line_store.load_last_seen()
     logger.info("✅ Database initialized")
 
 def get_live_spreads():
-    """Fetch live NBA spreads from The Odds API"""
-    url = f"https://api.the-odds-api.com/v4/sports/basketball_nba/odds/?apiKey={ODDS_API_KEY}&regions=us&markets=spreads&oddsFormat=american"
+    """Fetch live NBA spreads, totals and moneylines from The Odds API in one request"""
+    url = f"{ODDS_API_BASE_URL}/sports/basketball_nba/odds/?apiKey={ODDS_API_KEY}&regions=us&markets={ODDS_MARKETS}&oddsFormat=american"
     
     try:
-        response = requests.get(url, timeout=10)
+        response = http_get(url, timeout=10)
+        # The Odds API bills one credit per market per region
+        poll_scheduler.record_request(response.headers.get('x-requests-remaining'),
+                                      cost=len(ODDS_MARKETS.split(',')))
         if response.status_code == 200:
             games = response.json()
-            logger.info(f"✅ The Odds API: {len(games)} live NBA games with spreads")
+            logger.info(f"✅ The Odds API: {len(games)} live NBA games ({ODDS_MARKETS})")
             return games if games else []
         else:
             logger.error(f"❌ The Odds API failed: {response.status_code}")
@@ -54,217 +160,307 @@ def get_live_spreads():
         logger.error(f"❌ The Odds API error: {e}")
         return []
 
-def get_player_season_averages(season=2025):
-    """Fetch current season averages from FREE nbaStats API (NO KEY REQUIRED)"""
-    all_stats = []
+def parse_player_totals(player, minutes):
+    """Convert one nbaStats playertotals row into per-game stats (None if no games played)"""
+    games = player.get('games', 0)
+    if games == 0:
+        return None
+    
+    return {
+        'player_id': player.get('slug'),
+        'player_name': player.get('playerName'),
+        'team': player.get('team'),
+        'games_played': games,
+        'min': minutes,
+        'pts': player.get('points', 0) / games,
+        'ast': player.get('assists', 0) / games,
+        'tov': player.get('turnovers', 0) / games,
+        'fga': player.get('fieldAttempts', 0) / games,
+        'fta': player.get('ftAttempts', 0) / games
+    }
+
+def fetch_player_totals_page(season, page, page_size=STATS_PAGE_SIZE):
+    """Fetch one raw playertotals page (raises on a non-200 response)"""
+    url = f"{NBA_STATS_URL}?season={season}&pageSize={page_size}&page={page}"
+    response = http_get(url, timeout=15)
+    if response.status_code != 200:
+        raise RuntimeError(f"nbaStats API failed: {response.status_code}")
+    return response.json().get('data', [])
+
+def fetch_player_totals_sequential(season, strict=False):
+    """Walk playertotals pages one at a time (original ingestion path)"""
+    rows = []
     page = 1
-    page_size = 100
+    
+    while True:
+        try:
+            players = fetch_player_totals_page(season, page)
+        except RuntimeError as e:
+            logger.error(f"❌ {e}")
+            if strict:
+                raise
+            break
+        
+        if not players:
+            break
+        
+        rows.extend(players)
+        
+        if len(players) < STATS_PAGE_SIZE:
+            break
+        
+        page += 1
+        time.sleep(STATS_PAGE_DELAY)
+    
+    return rows
+
+def fetch_player_totals_concurrent(season, strict=False):
+    """Fetch playertotals pages in parallel waves within the configured rate budget"""
+    return fetch_pages_concurrent(
+        lambda page: fetch_player_totals_page(season, page),
+        STATS_PAGE_SIZE,
+        max_workers=STATS_MAX_WORKERS,
+        limiter=stats_rate_limiter,
+        strict=strict
+    )
+
+def get_player_season_averages(season=2025, mode=None, strict=False):
+    """
+    Fetch current season averages from FREE nbaStats API (NO KEY REQUIRED)
+    With strict=True any failed page raises instead of returning a partial league.
+    """
+    mode = mode or STATS_FETCH_MODE
     
     try:
-        while True:
-            url = f"https://api.server.nbaapi.com/api/playertotals?season={season}&pageSize={page_size}&page={page}"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                players = data.get('data', [])
-                
-                if not players:
-                    break
-                
-                for player in players:
-                    games = player.get('games', 0)
-                    if games == 0:
-                        continue
-                    
-                    # Parse minutes (API returns various formats: "MM:SS", "MM:SS:hundredths", "HH:MM:SS", or numeric)
-                    minutes_str = player.get('minutesPg', '0:00')
-                    try:
-                        if isinstance(minutes_str, str) and ':' in minutes_str:
-                            parts = minutes_str.split(':')
-                            if len(parts) == 3:
-                                first = float(parts[0])
-                                if first > 59:  # True HH:MM:SS format (hours exceed 59)
-                                    minutes = first * 60 + float(parts[1]) + float(parts[2]) / 60
-                                else:  # MM:SS:hundredths format (e.g., "28:43:00" = 28 min, 43 sec)
-                                    minutes = first + float(parts[1]) / 60 + float(parts[2]) / 3600
-                            elif len(parts) == 2:  # MM:SS format
-                                minutes = float(parts[0]) + float(parts[1]) / 60
-                            else:
-                                minutes = 0.0
-                        else:
-                            minutes = float(minutes_str) if minutes_str else 0.0
-                    except (ValueError, AttributeError):
-                        minutes = 0.0  # Gracefully handle bad inputs
-                    
-                    stats = {
-                        'player_id': player.get('slug'),
-                        'player_name': player.get('playerName'),
-                        'team': player.get('team'),
-                        'games_played': games,
-                        'min': minutes,
-                        'pts': player.get('points', 0) / games,
-                        'ast': player.get('assists', 0) / games,
-                        'tov': player.get('turnovers', 0) / games,
-                        'fga': player.get('fieldAttempts', 0) / games,
-                        'fta': player.get('ftAttempts', 0) / games
-                    }
-                    all_stats.append(stats)
-                
-                if len(players) < page_size:
-                    break
-                
-                page += 1
-                time.sleep(0.3)
-            else:
-                logger.error(f"❌ nbaStats API failed: {response.status_code}")
-                break
+        if mode == 'sequential':
+            rows = fetch_player_totals_sequential(season, strict=strict)
+        else:
+            rows = fetch_player_totals_concurrent(season, strict=strict)
+        
+        # Every minutes string in the league is parsed in one pass here, never again downstream
+        minutes, malformed = parse_minutes([row.get('minutesPg', '0:00') for row in rows])
+        if malformed.any():
+            logger.warning(f"⚠️ Malformed minutes counted as 0: {malformed_summary(rows, malformed)}")
+        all_stats = [stats for stats in map(parse_player_totals, rows, minutes.tolist()) if stats]
         
         logger.info(f"✅ FREE NBA API: {len(all_stats)} player season averages loaded")
         return all_stats
     except Exception as e:
+        if strict:
+            raise
         logger.error(f"❌ Error fetching season averages: {e}")
         import traceback
         traceback.print_exc()
         return []
 
-def get_team_players_stats(team_name, all_stats):
-    """Get stats for all players on a specific team"""
-    team_mapping = {
-        'Atlanta Hawks': 'ATL', 'Boston Celtics': 'BOS', 'Brooklyn Nets': 'BKN',
-        'Charlotte Hornets': 'CHA', 'Chicago Bulls': 'CHI', 'Cleveland Cavaliers': 'CLE',
-        'Dallas Mavericks': 'DAL', 'Denver Nuggets': 'DEN', 'Detroit Pistons': 'DET',
-        'Golden State Warriors': 'GSW', 'Houston Rockets': 'HOU', 'Indiana Pacers': 'IND',
-        'LA Clippers': 'LAC', 'Los Angeles Lakers': 'LAL', 'Memphis Grizzlies': 'MEM',
-        'Miami Heat': 'MIA', 'Milwaukee Bucks': 'MIL', 'Minnesota Timberwolves': 'MIN',
-        'New Orleans Pelicans': 'NOP', 'New York Knicks': 'NYK', 'Oklahoma City Thunder': 'OKC',
-        'Orlando Magic': 'ORL', 'Philadelphia 76ers': 'PHI', 'Phoenix Suns': 'PHX',
-        'Portland Trail Blazers': 'POR', 'Sacramento Kings': 'SAC', 'San Antonio Spurs': 'SAS',
-        'Toronto Raptors': 'TOR', 'Utah Jazz': 'UTA', 'Washington Wizards': 'WAS'
-    }
-    
-    team_abbr = team_mapping.get(team_name)
-    if not team_abbr:
-        return []
-    
-    return [s for s in all_stats if s.get('team') == team_abbr]
-
-TEAM_PACE = {
-    'ATL': 101.8, 'BOS': 99.3, 'BKN': 100.5, 'CHA': 99.8, 'CHI': 98.5, 'CLE': 97.2,
-    'DAL': 99.1, 'DEN': 98.8, 'DET': 100.2, 'GSW': 100.9, 'HOU': 101.2, 'IND': 100.6,
-    'LAC': 98.7, 'LAL': 99.4, 'MEM': 97.5, 'MIA': 98.3, 'MIL': 99.7, 'MIN': 99.5,
-    'NOP': 100.3, 'NYK': 96.8, 'OKC': 98.9, 'ORL': 99.2, 'PHI': 98.1, 'PHX': 100.4,
-    'POR': 99.6, 'SAC': 101.5, 'SAS': 99.0, 'TOR': 98.6, 'UTA': 98.4, 'WAS': 100.1
-}
+# The league is held as a columnar PlayerFrame; disk snapshots store its column lists
+season_stats_cache = SnapshotCache(
+    f'season_averages_{SEASON}',
+    lambda: PlayerFrame.from_records(get_player_season_averages(SEASON, strict=True)),
+    ttl=STATS_CACHE_TTL,
+    encode=PlayerFrame.to_columns,
+    decode=PlayerFrame.from_snapshot
+)
 
-def calculate_player_tusg(player_stats, team_pace):
+_player_store = None
+line_tracker = LineChangeTracker()
+line_store = LineStore(DB_FILE)
+poll_scheduler = PollScheduler(ODDS_DAILY_BUDGET, status_path=SCHEDULER_STATUS_FILE,
+                               poll_cost=len(ODDS_MARKETS.split(',')), quota_reset_day=ODDS_QUOTA_RESET_DAY)
+cycle_profiler = CycleProfiler(metrics_path=CYCLE_METRICS_FILE)
+
+def get_player_store():
+    """Return the team-indexed store for the current stats snapshot (rebuilt only when it changes)"""
+    global _player_store
+    version = season_stats_cache.version
+    if _player_store is None or _player_store.version != version:
+        _player_store = PlayerStore(season_stats_cache.data or [], version=version)
+    return _player_store
+
+def save_pick(game, pick, edge, home_tusg, away_tusg, home_pvr, away_pvr, spread, pick_date=None, consensus=None,
+              market='spreads', price=None):
     """
-    TUSG% = (FGA + TOV + (FTA × 0.44)) / ((MP/48) × TeamPace) × 100
+    Upsert a pick on its natural key (game, market, picked side, game date). Re-saving
+    an unchanged pick writes nothing; a moved edge, line, price or consensus updates the
+    row and is appended to pick_history. `spread` holds the line (the total for totals).
     """
-    mp = player_stats.get('min', 0)
-    fga = player_stats.get('fga', 0)
-    tov = player_stats.get('tov', 0)
-    fta = player_stats.get('fta', 0)
-    
-    if mp == 0 or team_pace == 0:
-        return 0.0
-    
-    numerator = fga + tov + (fta * 0.44)
-    denominator = (mp / 48) * team_pace
-    
-    if denominator == 0:
-        return 0.0
-    
-    tusg = (numerator / denominator) * 100
-    return tusg
+    try:
+        conn = get_connection(DB_FILE)
+        cursor = conn.cursor()
+        pick_side = pick_side_from_text(pick)
+        pick_date = pick_date or datetime.utcnow().strftime('%Y-%m-%d')
+        consensus = consensus or {}
+        cursor.execute(f'''
+            INSERT INTO picks (game, market, pick, pick_side, pick_date, edge, home_tusg, away_tusg, home_pvr, away_pvr,
+                               spread, price, {', '.join(CONSENSUS_COLUMNS)}, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, {', '.join('?' for _ in CONSENSUS_COLUMNS)}, CURRENT_TIMESTAMP)
+            ON CONFLICT(game, market, pick_side, pick_date) DO UPDATE SET
+                pick = excluded.pick,
+                edge = excluded.edge,
+                home_tusg = excluded.home_tusg,
+                away_tusg = excluded.away_tusg,
+                home_pvr = excluded.home_pvr,
+                away_pvr = excluded.away_pvr,
+                spread = excluded.spread,
+                price = excluded.price,
+                {', '.join(f'{column} = excluded.{column}' for column in CONSENSUS_COLUMNS)},
+                updated_at = CURRENT_TIMESTAMP
+            WHERE round(picks.edge, 2) IS NOT round(excluded.edge, 2)
+               OR picks.spread IS NOT excluded.spread
+               OR picks.price IS NOT excluded.price
+               OR picks.consensus_spread IS NOT excluded.consensus_spread
+        ''', (game, market, pick, pick_side, pick_date, edge, home_tusg, away_tusg, home_pvr, away_pvr, spread, price,
+              *(consensus.get(column) for column in CONSENSUS_COLUMNS)))
+        
+        if cursor.rowcount:
+            cycle_profiler.count('rows_written', 2)
+            cursor.execute('''
+                INSERT INTO pick_history (pick_id, pick, edge, spread)
+                SELECT id, pick, edge, spread FROM picks
+                WHERE game = ? AND market = ? AND pick_side = ? AND pick_date = ?
+            ''', (game, market, pick_side, pick_date))
+        
+        conn.commit()
+        conn.close()
+        return True
+    except Exception as e:
+        logger.error(f"❌ Database error: {e}")
+        return False
 
-def calculate_team_tusg(team_players_stats, team_abbr):
-    """Calculate average TUSG% for entire team"""
-    if not team_players_stats:
-        return 50.0
-    
-    team_pace = TEAM_PACE.get(team_abbr, 99.5)
-    
-    tusg_values = []
-    for player in team_players_stats:
-        if player.get('min', 0) >= 10:
-            tusg = calculate_player_tusg(player, team_pace)
-            if tusg > 0:
-                tusg_values.append(tusg)
-    
-    if not tusg_values:
-        return 50.0
-    
-    return sum(tusg_values) / len(tusg_values)
+def consensus_columns(summary, best, best_book):
+    """Map a core/consensus.py summary onto the picks consensus columns"""
+    return {
+        'consensus_spread': summary['median'],
+        'mean_spread': summary['mean'],
+        'spread_stdev': summary['stdev'],
+        'best_spread': best,
+        'best_book': best_book,
+        'book_count': summary['books']
+    }
 
-def calculate_player_pvr(player_stats):
+def format_line(market, value):
+    """A consensus value as bettors read it: American odds for moneylines, points otherwise"""
+    return f"{probability_to_american(value):+d}" if market == 'h2h' else f"{value:+.1f}"
+
+def format_spread(market, stdev):
+    """Book-to-book dispersion: implied-probability points for moneylines, points otherwise"""
+    return f"{stdev * 100:.1f}%" if market == 'h2h' else f"{stdev:.2f}"
+
+def evaluate_markets(game, consensus, home_tusg, away_tusg, home_pvr, away_pvr):
     """
-    PVR = [(PTS + (AST × Multiplier)) / (FGA + TOV + (0.44 × FTA) + AST) - 1.00] × 100
-    Multiplier: AST/TOV ≥ 1.8 → 2.3, else 1.8
+    Candidate picks for one game across every market in the payload, each judged
+    against its own threshold. Picks are made at the best number on the board.
     """
-    pts = player_stats.get('pts', 0)
-    ast = player_stats.get('ast', 0)
-    fga = player_stats.get('fga', 0)
-    tov = player_stats.get('tov', 0)
-    fta = player_stats.get('fta', 0)
-    
-    if tov == 0:
-        ast_tov_ratio = ast if ast > 0 else 0
-    else:
-        ast_tov_ratio = ast / tov
-    
-    multiplier = 2.3 if ast_tov_ratio > 1.8 else 1.8
+    event = event_key(game)
+    home_team = game.get('home_team', 'Unknown')
+    away_team = game.get('away_team', 'Unknown')
+    side_edge = calculate_side_edge(home_tusg, away_tusg, home_pvr, away_pvr)
+    picks = []
     
-    numerator = pts + (ast * multiplier)
-    denominator = fga + tov + (0.44 * fta) + ast
+    spread = consensus.get('spreads', {}).get(event)
+    if spread and side_edge >= MARKET_MIN_EDGE['spreads']:
+        picks.append({
+            'market': 'spreads',
+            'pick': f"{home_team} {spread['high']:+.1f}",
+            'edge': side_edge,
+            'line': spread['high'],
+            'price': None,
+            'consensus': consensus_columns(spread, spread['high'], spread['high_book'])
+        })
     
-    if denominator == 0:
-        return 0.0
+    total = consensus.get('totals', {}).get(event)
+    if total:
+        # Each side is judged at the number it would be bet at: Over the lowest total, Under the highest
+        home_abbr, away_abbr = TEAM_MAPPING.get(home_team), TEAM_MAPPING.get(away_team)
+        over_edge = calculate_total_edge(home_abbr, away_abbr, total['low'])
+        under_edge = 100 - calculate_total_edge(home_abbr, away_abbr, total['high'])
+        if over_edge >= MARKET_MIN_EDGE['totals']:
+            picks.append({
+                'market': 'totals',
+                'pick': f"Over {total['low']:.1f}",
+                'edge': over_edge,
+                'line': total['low'],
+                'price': None,
+                'consensus': consensus_columns(total, total['low'], total['low_book'])
+            })
+        elif under_edge >= MARKET_MIN_EDGE['totals']:
+            picks.append({
+                'market': 'totals',
+                'pick': f"Under {total['high']:.1f}",
+                'edge': under_edge,
+                'line': total['high'],
+                'price': None,
+                'consensus': consensus_columns(total, total['high'], total['high_book'])
+            })
     
-    pvr = ((numerator / denominator) - 1.00) * 100
-    return pvr
-
-def calculate_team_pvr(team_players_stats):
-    """Calculate average PVR for entire team"""
-    if not team_players_stats:
-        return 0.0
-    
-    pvr_values = []
-    for player in team_players_stats:
-        if player.get('min', 0) >= 10:
-            pvr = calculate_player_pvr(player)
-            pvr_values.append(pvr)
+    moneyline = consensus.get('h2h', {}).get(event)
+    if moneyline and side_edge >= MARKET_MIN_EDGE['h2h']:
+        # Lowest implied probability on the board is the best home price
+        price = probability_to_american(moneyline['low'])
+        picks.append({
+            'market': 'h2h',
+            'pick': f"{home_team} ML {price:+d}",
+            'edge': side_edge,
+            'line': None,
+            'price': price,
+            'consensus': consensus_columns(moneyline, moneyline['low'], moneyline['low_book'])
+        })
     
-    if not pvr_values:
-        return 0.0
-    
-    return sum(pvr_values) / len(pvr_values)
+    return picks
 
-def save_pick(game, pick, edge, home_tusg, away_tusg, home_pvr, away_pvr, spread):
-    """Save pick to database"""
+def record_heartbeat(next_cycle_in):
+    """Stamp pick_summary with this cycle and when the next one runs (dashboard liveness)"""
     try:
-        conn = sqlite3.connect(DB_FILE)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO picks (game, pick, edge, home_tusg, away_tusg, home_pvr, away_pvr, spread)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (game, pick, edge, home_tusg, away_tusg, home_pvr, away_pvr, spread))
-        conn.commit()
-        conn.close()
+        conn = get_connection(DB_FILE)
+        try:
+            conn.execute('''
+                UPDATE pick_summary SET heartbeat_at = CURRENT_TIMESTAMP,
+                                        next_cycle_at = datetime('now', ?)
+                WHERE id = 1
+            ''', (f'+{int(next_cycle_in)} seconds',))
+            conn.commit()
+        finally:
+            conn.close()
     except Exception as e:
-        logger.error(f"❌ Database error: {e}")
+        logger.warning(f"⚠️ Could not record heartbeat: {e}")
 
 def analyze():
+    """Run one profiled analysis cycle"""
+    cycle_profiler.begin_cycle()
+    try:
+        analyze_cycle()
+    finally:
+        cycle = cycle_profiler.end_cycle()
+        stages = cycle.get('stages_ms', {})
+        logger.info(f"⏱️ Cycle {stages.get('total', 0):.0f}ms | " + ", ".join(
+            f"{name} {ms:.0f}ms" for name, ms in stages.items() if name != 'total'
+        ))
+
+def analyze_cycle():
     """Main analysis function - Combines FREE NBA API stats + The Odds API spreads"""
     logger.info("🏀 TAYLOR VECTOR TERMINAL - Starting analysis...")
     
-    spreads = get_live_spreads()
+    with cycle_profiler.stage('fetch_odds'):
+        spreads = get_live_spreads()
     
     if not spreads:
         logger.warning("❌ No live games with spreads available")
+        poll_scheduler.observe([])
         return
     
-    player_stats = get_player_season_averages(2025)
+    try:
+        with cycle_profiler.stage('persist'):
+            moved = line_store.record(spreads, markets=ODDS_MARKETS.split(','))
+        cycle_profiler.count('rows_written', moved)
+        if moved:
+            logger.info(f"📈 Stored {moved} line movements")
+    except Exception as e:
+        logger.error(f"❌ Line store error: {e}")
+    
+    with cycle_profiler.stage('fetch_stats'):
+        player_stats = season_stats_cache.get() or []
+    with cycle_profiler.stage('aggregate'):
+        player_store = get_player_store()
     
     if not player_stats:
         logger.warning("⚠️ Could not load player stats, using simplified calculation")
@@ -274,114 +470,123 @@ def analyze():
     logger.info(f"{'='*70}")
     logger.info(f"Analyzing {len(spreads)} games with live spreads")
     
-    picks_found = 0
-    
-    for game in spreads:
-        try:
-            home_team = game.get('home_team', 'Unknown')
-            away_team = game.get('away_team', 'Unknown')
-            
-            bookmakers = game.get('bookmakers', [])
-            if not bookmakers:
-                continue
-            
-            spread_market = None
-            for bookmaker in bookmakers:
-                markets = bookmaker.get('markets', [])
-                for market in markets:
-                    if market.get('key') == 'spreads':
-                        spread_market = market
-                        break
-                if spread_market:
-                    break
-            
-            if not spread_market:
-                continue
-            
-            outcomes = spread_market.get('outcomes', [])
-            home_spread = None
-            away_spread = None
-            
-            for outcome in outcomes:
-                if outcome.get('name') == home_team:
-                    home_spread = outcome.get('point', 0)
-                elif outcome.get('name') == away_team:
-                    away_spread = outcome.get('point', 0)
-            
-            if home_spread is None or away_spread is None:
-                continue
-            
-            home_stats = get_team_players_stats(home_team, player_stats)
-            away_stats = get_team_players_stats(away_team, player_stats)
-            
-            team_mapping = {
-                'Atlanta Hawks': 'ATL', 'Boston Celtics': 'BOS', 'Brooklyn Nets': 'BKN',
-                'Charlotte Hornets': 'CHA', 'Chicago Bulls': 'CHI', 'Cleveland Cavaliers': 'CLE',
-                'Dallas Mavericks': 'DAL', 'Denver Nuggets': 'DEN', 'Detroit Pistons': 'DET',
-                'Golden State Warriors': 'GSW', 'Houston Rockets': 'HOU', 'Indiana Pacers': 'IND',
-                'LA Clippers': 'LAC', 'Los Angeles Lakers': 'LAL', 'Memphis Grizzlies': 'MEM',
-                'Miami Heat': 'MIA', 'Milwaukee Bucks': 'MIL', 'Minnesota Timberwolves': 'MIN',
-                'New Orleans Pelicans': 'NOP', 'New York Knicks': 'NYK', 'Oklahoma City Thunder': 'OKC',
-                'Orlando Magic': 'ORL', 'Philadelphia 76ers': 'PHI', 'Phoenix Suns': 'PHX',
-                'Portland Trail Blazers': 'POR', 'Sacramento Kings': 'SAC', 'San Antonio Spurs': 'SAS',
-                'Toronto Raptors': 'TOR', 'Utah Jazz': 'UTA', 'Washington Wizards': 'WAS'
-            }
-            
-            home_abbr = team_mapping.get(home_team, 'UNK')
-            away_abbr = team_mapping.get(away_team, 'UNK')
-            
-            home_tusg = calculate_team_tusg(home_stats, home_abbr) if home_stats else 50.0
-            away_tusg = calculate_team_tusg(away_stats, away_abbr) if away_stats else 50.0
-            
-            home_pvr = calculate_team_pvr(home_stats) if home_stats else 0.0
-            away_pvr = calculate_team_pvr(away_stats) if away_stats else 0.0
-            
-            edge = 50 + (home_tusg - away_tusg) + (home_pvr - away_pvr) * 0.5
-            edge = max(min(edge, 80), 45)
-            
-            if edge >= MIN_EDGE:
-                picks_found += 1
-                game_text = f"{away_team} @ {home_team}"
-                pick_text = f"{home_team} {home_spread:+.1f}"
+    with cycle_profiler.stage('evaluate'):
+        # Typed quotes for every market and their consensus over all bookmakers, once per payload
+        consensus = consensus_by_market(parse_markets(spreads, ODDS_MARKETS.split(',')))
+        
+        picks_found = 0
+        line_tracker.begin_cycle()
+        line_tracker.prune(event_key(game) for game in spreads)
+        
+        for game in spreads:
+            try:
+                home_team = game.get('home_team', 'Unknown')
+                away_team = game.get('away_team', 'Unknown')
                 
-                save_pick(game_text, pick_text, edge, home_tusg, away_tusg, home_pvr, away_pvr, home_spread)
+                home_tusg, home_pvr = player_store.team_metrics(home_team)
+                away_tusg, away_pvr = player_store.team_metrics(away_team)
                 
-                logger.info(f"\n🔥 {game_text}")
-                logger.info(f"   PICK: {pick_text} | EDGE: {edge:.1f}%")
-                logger.info(f"   TUSG: Home={home_tusg:.1f} vs Away={away_tusg:.1f}")
-                logger.info(f"   PVR: Home={home_pvr:.1f} vs Away={away_pvr:.1f}")
-                logger.info(f"   Spread: {home_spread:+.1f}")
-        
-        except Exception as e:
-            logger.error(f"❌ Error processing game: {e}")
-            import traceback
-            traceback.print_exc()
+                # Only games whose lines or team inputs moved since last cycle are re-evaluated
+                if not line_tracker.has_changed(game, (home_tusg, away_tusg, home_pvr, away_pvr)):
+                    continue
+                
+                game_text = f"{away_team} @ {home_team}"
+                game_date = (game.get('commence_time') or '')[:10] or None
+                
+                for pick in evaluate_markets(game, consensus, home_tusg, away_tusg, home_pvr, away_pvr):
+                    picks_found += 1
+                    summary = pick['consensus']
+                    
+                    with cycle_profiler.stage('persist'):
+                        saved = save_pick(game_text, pick['pick'], pick['edge'], home_tusg, away_tusg, home_pvr, away_pvr,
+                                          pick['line'], pick_date=game_date, consensus=summary,
+                                          market=pick['market'], price=pick['price'])
+                    if not saved:
+                        line_tracker.invalidate(event_key(game))
+                    
+                    logger.info(f"\n🔥 {game_text} [{pick['market']}]")
+                    logger.info(f"   PICK: {pick['pick']} | EDGE: {pick['edge']:.1f}%")
+                    logger.info(f"   TUSG: Home={home_tusg:.1f} vs Away={away_tusg:.1f}")
+                    logger.info(f"   PVR: Home={home_pvr:.1f} vs Away={away_pvr:.1f}")
+                    logger.info(f"   Best: {format_line(pick['market'], summary['best_spread'])} @ {summary['best_book']} | "
+                                f"Consensus: {format_line(pick['market'], summary['consensus_spread'])} "
+                                f"(±{format_spread(pick['market'], summary['spread_stdev'])}, "
+                                f"{summary['book_count']} books)")
+            
+            except Exception as e:
+                logger.error(f"❌ Error processing game: {e}")
+                import traceback
+                traceback.print_exc()
+                line_tracker.invalidate(event_key(game))
+    
+    cycle_profiler.count('games', len(spreads))
+    cycle_profiler.count('games_evaluated', line_tracker.cycle_recomputed)
+    cycle_profiler.count('picks', picks_found)
+    poll_scheduler.observe(spreads, lines_moved=line_tracker.cycle_moved > 0)
     
-    if picks_found == 0:
-        logger.info("⚠️ No picks with edge ≥ 65% found this cycle")
-    else:
-        logger.info(f"✅ Generated {picks_found} high-confidence picks!")
+    # Unchanged games are reported on their own: they were not evaluated, so they say
+    # nothing about whether anything cleared the edge thresholds
+    if line_tracker.cycle_skipped:
+        logger.info(f"♻️ {line_tracker.cycle_skipped} games unchanged, skipped")
+    if picks_found:
+        logger.info(f"✅ Generated {picks_found} high-confidence picks from "
+                    f"{line_tracker.cycle_recomputed} re-evaluated games!")
+    elif line_tracker.cycle_recomputed:
+        logger.info(f"⚠️ No picks above the market edge thresholds in "
+                    f"{line_tracker.cycle_recomputed} re-evaluated games")
     
     logger.info(f"{'='*70}\n")
 
-logger.info("🚀 TAYLOR VECTOR TERMINAL - LIVE BETTING SYSTEM")
-logger.info(f"💰 Bankroll: ${BANKROLL}")
-logger.info(f"🎯 Min Edge: {MIN_EDGE}%")
-logger.info(f"📊 Data: FREE NBA API (player stats) + The Odds API (spreads)")
-logger.info(f"🔑 APIs: Both FREE & Configured ✅")
-logger.info("⏰ Running every 45 seconds...\n")
-
-init_database()
-
-while True:
+def main():
+    """Main terminal loop"""
+    logger.info("🚀 TAYLOR VECTOR TERMINAL - LIVE BETTING SYSTEM")
+    logger.info(f"💰 Bankroll: ${BANKROLL}")
+    logger.info(f"🎯 Min Edge: " + ", ".join(f"{market} {edge}%" for market, edge in MARKET_MIN_EDGE.items()))
+    logger.info(f"📊 Data: FREE NBA API (player stats) + The Odds API (spreads)")
+    logger.info(f"🔑 APIs: Both FREE & Configured ✅")
+    logger.info(f"⏰ Adaptive polling, {ODDS_DAILY_BUDGET} odds credits/day budget\n")
+    
+    init_database()
+    
+    global recorder
+    if RECORD_PATH:
+        # A recording has to contain every snapshot it uses, so skip the on-disk seed
+        season_stats_cache.cache_dir = None
+        recorder = HttpRecorder(RECORD_PATH, meta={
+            'stats_fetch_mode': STATS_FETCH_MODE,
+            'stats_max_workers': STATS_MAX_WORKERS
+        })
+        logger.info(f"🎙️ Recording upstream responses to {RECORD_PATH}")
+    
+    # Platforms stop the worker with SIGTERM: unwind through the finally below like Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     try:
-        analyze()
-        time.sleep(45)
-    except KeyboardInterrupt:
-        logger.info("👋 Shutting down...")
-        break
-    except Exception as e:
-        logger.error(f"❌ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
-        time.sleep(45)
+        while True:
+            try:
+                if recorder:
+                    recorder.mark_cycle()
+                analyze()
+                if recorder:
+                    recorder.end_cycle()
+                delay = poll_scheduler.plan()
+                record_heartbeat(delay)
+                logger.info(f"⏰ Next poll in {delay:.0f}s ({poll_scheduler.reason}) | "
+                            f"{poll_scheduler.remaining_today} credits left today "
+                            f"({poll_scheduler.polls_left} polls at {poll_scheduler.poll_cost} each)")
+                time.sleep(delay)
+            except KeyboardInterrupt:
+                logger.info("👋 Shutting down...")
+                break
+            except Exception as e:
+                logger.error(f"❌ Unexpected error: {e}")
+                import traceback
+                traceback.print_exc()
+                record_heartbeat(45)
+                time.sleep(45)
+    finally:
+        if recorder:
+            recorder.close()
+            logger.info(f"🎙️ Recording closed: {RECORD_PATH}")
+
+if __name__ == '__main__':
+    main()
@@ -4,12 +4,16 @@ Monitors database for high-edge picks and sends instant notifications via Discor
 """
 
 import sqlite3
+import sys
 import time
 import os
 import requests
 import logging
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -151,7 +155,7 @@ def create_pick_hash(pick_data):
 def check_new_picks():
     """Check database for new high-edge picks"""
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection(DB_FILE)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
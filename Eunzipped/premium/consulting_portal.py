@@ -6,6 +6,7 @@ Pricing: $499/month per group (10 members), $99 for each additional member
 """
 
 import sqlite3
+import sys
 import hashlib
 import secrets
 import json
@@ -13,6 +14,10 @@ import os
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+from core.migrations import run_migrations
+
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_FILE = os.path.join(SCRIPT_DIR, 'consulting_groups.db')
@@ -44,7 +49,7 @@ PER_MEMBER_PRICE = 99  # $99 per additional member
 
 def init_database():
     """Initialize consulting portal database"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     cursor = conn.cursor()
     
     # Groups table
@@ -145,6 +150,7 @@ def init_database():
     ''')
     
     conn.commit()
+    run_migrations(conn, 'consulting')
     conn.close()
 
 
@@ -180,7 +186,7 @@ class ConsultingGroup:
     
     def _get_connection(self):
         """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
     
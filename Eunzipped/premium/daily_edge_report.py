@@ -5,6 +5,7 @@ Task #19 - Professional daily betting edge reports
 """
 
 import sqlite3
+import sys
 import os
 import smtplib
 from email.mime.multipart import MIMEMultipart
@@ -23,6 +24,9 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_FILE = os.path.join(os.path.dirname(SCRIPT_DIR), 'taylor_62.db')
 REPORTS_DIR = os.path.join(SCRIPT_DIR, 'reports')
@@ -39,23 +43,24 @@ os.makedirs(CHARTS_DIR, exist_ok=True)
 
 def get_picks_last_24h():
     """Query database for picks from last 24 hours"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
+    # +edge: sort the timestamp range lookup rather than walking the whole edge index
     query = '''
         SELECT * FROM picks 
-        WHERE datetime(timestamp) >= datetime('now', '-24 hours')
-        ORDER BY edge DESC
+        WHERE timestamp >= datetime('now', '-24 hours')
+        ORDER BY +edge DESC
     '''
-    picks = cursor.fetchall()
+    picks = cursor.execute(query).fetchall()
     conn.close()
     
     return [dict(pick) for pick in picks]
 
 def get_picks_by_date(date):
     """Query database for picks from specific date"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
@@ -4,6 +4,7 @@ Automated PDF reports with top 5 betting edges
 """
 
 import sqlite3
+import sys
 import os
 from datetime import datetime, timedelta
 from reportlab.lib.pagesizes import letter
@@ -14,6 +15,9 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.pdfgen import canvas
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_FILE = os.path.join(os.path.dirname(SCRIPT_DIR), 'taylor_62.db')
@@ -24,7 +28,7 @@ def get_top_edges(date=None, limit=5):
     Query database for top N edges from specified date (default: last 24 hours)
     Returns list of picks with full analysis
     """
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
@@ -41,10 +45,11 @@ def get_top_edges(date=None, limit=5):
         picks = cursor.execute(query, (start_date, end_date, limit)).fetchall()
     else:
         # Get picks from last 24 hours
+        # +edge: sort the timestamp range lookup rather than walking the whole edge index
         query = '''
             SELECT * FROM picks 
-            WHERE datetime(timestamp) >= datetime('now', '-24 hours')
-            ORDER BY edge DESC 
+            WHERE timestamp >= datetime('now', '-24 hours')
+            ORDER BY +edge DESC 
             LIMIT ?
         '''
         picks = cursor.execute(query, (limit,)).fetchall()
@@ -56,7 +61,7 @@ def get_performance_metrics(date=None):
     """
     Calculate performance metrics for the specified date or last 24 hours
     """
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     cursor = conn.cursor()
     
     if date:
@@ -79,15 +84,15 @@ def get_performance_metrics(date=None):
         ).fetchone()[0]
     else:
         total_picks = cursor.execute(
-            "SELECT COUNT(*) FROM picks WHERE datetime(timestamp) >= datetime('now', '-24 hours')"
+            "SELECT COUNT(*) FROM picks WHERE timestamp >= datetime('now', '-24 hours')"
         ).fetchone()[0]
         
         avg_edge = cursor.execute(
-            "SELECT AVG(edge) FROM picks WHERE datetime(timestamp) >= datetime('now', '-24 hours')"
+            "SELECT AVG(edge) FROM picks WHERE timestamp >= datetime('now', '-24 hours')"
         ).fetchone()[0]
         
         max_edge = cursor.execute(
-            "SELECT MAX(edge) FROM picks WHERE datetime(timestamp) >= datetime('now', '-24 hours')"
+            "SELECT MAX(edge) FROM picks WHERE timestamp >= datetime('now', '-24 hours')"
         ).fetchone()[0]
     
     conn.close()
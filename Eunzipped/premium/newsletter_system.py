@@ -5,6 +5,7 @@ Task #25 - Paid newsletter with free/paid tiers
 """
 
 import sqlite3
+import sys
 import os
 import smtplib
 import hashlib
@@ -17,6 +18,10 @@ from datetime import datetime, timedelta
 from jinja2 import Environment, FileSystemLoader
 import time
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+from core.migrations import run_migrations
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 NEWSLETTER_DB = os.path.join(SCRIPT_DIR, 'newsletter.db')
 TEMPLATES_DIR = os.path.join(SCRIPT_DIR, 'newsletter_templates')
@@ -40,7 +45,7 @@ TIER_BENEFITS = {
 
 def init_database():
     """Initialize newsletter subscriber database"""
-    conn = sqlite3.connect(NEWSLETTER_DB)
+    conn = get_connection(NEWSLETTER_DB)
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -89,6 +94,7 @@ def init_database():
     ''')
     
     conn.commit()
+    run_migrations(conn, 'newsletter')
     conn.close()
     print("✅ Newsletter database initialized")
 
@@ -98,7 +104,7 @@ def generate_unsubscribe_token():
 
 def get_db_connection():
     """Get database connection"""
-    conn = sqlite3.connect(NEWSLETTER_DB)
+    conn = get_connection(NEWSLETTER_DB)
     conn.row_factory = sqlite3.Row
     return conn
 
@@ -11,16 +11,21 @@ import requests
 from datetime import datetime, timedelta
 from io import StringIO
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.db import get_connection
+from core.migrations import run_migrations
+from core.leaderboard import get_leaderboard
 
 DB_FILE = '../taylor_62.db'
-LEADERBOARD_FILE = '../leaderboard/data/all_time_tusg.json'
 
 INTEGRATION_TYPES = ['json_feed', 'csv_export', 'widget_embed', 'api_access', 'full_integration']
 PARTNER_STATUS = ['pending', 'active', 'suspended', 'inactive']
 
 def init_partnership_database():
     """Initialize partnership database tables"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -77,6 +82,7 @@ def init_partnership_database():
     ''')
     
     conn.commit()
+    run_migrations(conn, 'partnerships')
     conn.close()
 
 def generate_partner_api_key(site_name):
@@ -97,7 +103,7 @@ def add_partner(site_name, api_endpoint=None, revenue_share=50.0,
                 integration_type='widget_embed', webhook_url=None, custom_branding=None):
     """Add new partner to database"""
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection(DB_FILE)
         cursor = conn.cursor()
         
         api_key = generate_partner_api_key(site_name)
@@ -131,7 +137,7 @@ def add_partner(site_name, api_endpoint=None, revenue_share=50.0,
 
 def get_partner(partner_id=None, api_key=None):
     """Get partner information"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     
     if partner_id:
@@ -157,7 +163,7 @@ def get_partner(partner_id=None, api_key=None):
 
 def get_all_partners(status=None):
     """Get all partners, optionally filtered by status"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     
     if status:
@@ -185,7 +191,7 @@ def update_partner_status(partner_id, status):
     if status not in PARTNER_STATUS:
         return {'error': 'Invalid status'}
     
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     cursor = conn.cursor()
     
     cursor.execute(
@@ -200,8 +206,7 @@ def update_partner_status(partner_id, status):
 def export_json_feed(partner_id=None, limit=50):
     """Export real-time TUSG%/PVR data as JSON feed"""
     try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            leaderboard = json.load(f)
+        leaderboard = get_leaderboard().rows()
         
         limited_data = leaderboard[:limit] if limit else leaderboard
         
@@ -226,8 +231,7 @@ def export_json_feed(partner_id=None, limit=50):
 def export_csv_data(partner_id=None):
     """Export historical data as CSV"""
     try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            leaderboard = json.load(f)
+        leaderboard = get_leaderboard().rows()
         
         output = StringIO()
         writer = csv.DictWriter(output, fieldnames=[
@@ -299,7 +303,7 @@ def track_widget_event(partner_id, event_type, widget_type=None,
                        player_name=None, user_ip=None, referrer=None):
     """Track widget views/clicks for revenue share calculations"""
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection(DB_FILE)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -342,7 +346,7 @@ def calculate_revenue_share(partner_id, base_revenue_per_view=0.01, base_revenue
     
     partner_share = total_revenue * (revenue_share_pct / 100)
     
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     cursor = conn.cursor()
     cursor.execute(
         'UPDATE partners SET total_revenue = ? WHERE id = ?',
@@ -394,7 +398,7 @@ def send_webhook_update(partner_id, event_type, data):
         
         success = response.status_code == 200
         
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection(DB_FILE)
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO webhook_logs (
@@ -412,7 +416,7 @@ def send_webhook_update(partner_id, event_type, data):
             'response': response.text
         }
     except Exception as e:
-        conn = sqlite3.connect(DB_FILE)
+        conn = get_connection(DB_FILE)
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO webhook_logs (
@@ -426,7 +430,7 @@ def send_webhook_update(partner_id, event_type, data):
 
 def get_partner_analytics(partner_id, days=30):
     """Get analytics for a specific partner"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     
     start_date = datetime.now() - timedelta(days=days)
@@ -449,7 +453,7 @@ def get_partner_analytics(partner_id, days=30):
 
 def get_webhook_logs(partner_id, limit=50):
     """Get webhook delivery logs for partner"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     
     logs = conn.execute('''
@@ -3,7 +3,7 @@ TAYLOR VECTOR TERMINAL - Weekly Player Deep Dive Generator
 Comprehensive one-player metric breakdowns with career analysis
 """
 
-import requests
+import sys
 import json
 import os
 from datetime import datetime
@@ -18,6 +18,9 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 from io import BytesIO
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.warehouse import get_warehouse
+
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 REPORTS_DIR = os.path.join(SCRIPT_DIR, 'reports')
@@ -124,82 +127,70 @@ def calculate_pvr(stats):
     return round(pvr, 2)
 
 def fetch_player_career_stats(player_slug):
-    """Fetch player's career statistics from nbaStats API"""
+    """Fetch player's career statistics from the local player warehouse"""
     all_seasons = []
     
-    # Try to fetch all available seasons (2015-2025 as reasonable range)
-    for season in range(2015, 2026):
-        try:
-            url = f"https://api.server.nbaapi.com/api/playertotals?season={season}&pageSize=1000"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                players = data.get('data', [])
-                
-                # Find player in this season
-                player_data = None
-                for player in players:
-                    if player.get('slug') == player_slug or player.get('playerName', '').lower() == player_slug.lower():
-                        player_data = player
-                        break
-                
-                if player_data and player_data.get('games', 0) > 0:
-                    games = player_data.get('games', 1)
-                    
-                    season_stats = {
-                        'season': season,
-                        'season_str': f"{season-1}-{str(season)[-2:]}",
-                        'team': player_data.get('team', 'UNK'),
-                        'games': games,
-                        'min': player_data.get('minutesPg', 0),
-                        'pts': player_data.get('points', 0) / games,
-                        'ast': player_data.get('assists', 0) / games,
-                        'reb': player_data.get('rebounds', 0) / games,
-                        'tov': player_data.get('turnovers', 0) / games,
-                        'fga': player_data.get('fieldAttempts', 0) / games,
-                        'fgm': player_data.get('fieldGoals', 0) / games,
-                        'fta': player_data.get('ftAttempts', 0) / games,
-                        'ftm': player_data.get('freeThrows', 0) / games,
-                        'tpa': player_data.get('threeAttempts', 0) / games,
-                        'tpm': player_data.get('threeGoals', 0) / games
-                    }
-                    
-                    # Calculate metrics
-                    season_stats['tusg'] = calculate_tusg(season_stats, season_stats['team'], season)
-                    season_stats['pvr'] = calculate_pvr(season_stats)
-                    season_stats['fg_pct'] = (season_stats['fgm'] / season_stats['fga'] * 100) if season_stats['fga'] > 0 else 0
-                    season_stats['ft_pct'] = (season_stats['ftm'] / season_stats['fta'] * 100) if season_stats['fta'] > 0 else 0
-                    season_stats['tp_pct'] = (season_stats['tpm'] / season_stats['tpa'] * 100) if season_stats['tpa'] > 0 else 0
-                    
-                    all_seasons.append(season_stats)
-        except Exception as e:
-            print(f"Error fetching season {season}: {e}")
+    # 2015-2025 as reasonable range; one indexed lookup instead of 11 full-season downloads
+    try:
+        rows = get_warehouse().player(player_slug, seasons=range(2015, 2026))
+    except Exception as e:
+        print(f"Error fetching career stats for {player_slug}: {e}")
+        return all_seasons
+    
+    seen_seasons = set()
+    for player_data in rows:
+        season = player_data.get('season')
+        if season in seen_seasons:
             continue
+        seen_seasons.add(season)
+        
+        if player_data.get('games', 0) > 0:
+            games = player_data.get('games', 1)
+            
+            season_stats = {
+                'season': season,
+                'season_str': f"{season-1}-{str(season)[-2:]}",
+                'team': player_data.get('team', 'UNK'),
+                'games': games,
+                'min': player_data.get('minutes', 0),
+                'pts': player_data.get('points', 0) / games,
+                'ast': player_data.get('assists', 0) / games,
+                'reb': player_data.get('rebounds', 0) / games,
+                'tov': player_data.get('turnovers', 0) / games,
+                'fga': player_data.get('fieldAttempts', 0) / games,
+                'fgm': player_data.get('fieldGoals', 0) / games,
+                'fta': player_data.get('ftAttempts', 0) / games,
+                'ftm': player_data.get('freeThrows', 0) / games,
+                'tpa': player_data.get('threeAttempts', 0) / games,
+                'tpm': player_data.get('threeGoals', 0) / games
+            }
+            
+            # Calculate metrics
+            season_stats['tusg'] = calculate_tusg(season_stats, season_stats['team'], season)
+            season_stats['pvr'] = calculate_pvr(season_stats)
+            season_stats['fg_pct'] = (season_stats['fgm'] / season_stats['fga'] * 100) if season_stats['fga'] > 0 else 0
+            season_stats['ft_pct'] = (season_stats['ftm'] / season_stats['fta'] * 100) if season_stats['fta'] > 0 else 0
+            season_stats['tp_pct'] = (season_stats['tpm'] / season_stats['tpa'] * 100) if season_stats['tpa'] > 0 else 0
+            
+            all_seasons.append(season_stats)
     
     return all_seasons
 
 def get_available_players():
     """Get list of all available players from current season"""
     try:
-        url = "https://api.server.nbaapi.com/api/playertotals?season=2025&pageSize=1000"
-        response = requests.get(url, timeout=15)
+        players = get_warehouse().season(2025, min_games=1)
         
-        if response.status_code == 200:
-            data = response.json()
-            players = data.get('data', [])
-            
-            player_list = []
-            for player in players:
-                if player.get('games', 0) > 0:
-                    player_list.append({
-                        'slug': player.get('slug'),
-                        'name': player.get('playerName'),
-                        'team': player.get('team')
-                    })
-            
-            player_list.sort(key=lambda x: x['name'])
-            return player_list
+        player_list = []
+        for player in players:
+            player_list.append({
+                'slug': player.get('slug'),
+                'name': player.get('playerName'),
+                'team': player.get('team')
+            })
+        
+        player_list.sort(key=lambda x: x['name'])
+        return player_list
     except Exception as e:
         print(f"Error fetching players: {e}")
         return []
@@ -277,34 +268,29 @@ def analyze_strengths_weaknesses(career_stats):
 def fetch_position_peers(player_position, current_season=2025, min_games=10):
     """Fetch players in the same position for peer comparison"""
     try:
-        url = f"https://api.server.nbaapi.com/api/playertotals?season={current_season}&pageSize=1000"
-        response = requests.get(url, timeout=15)
+        position = None if player_position in (None, '', 'All') else player_position
+        players = get_warehouse().season(current_season, position=position, min_games=min_games)
         
-        if response.status_code == 200:
-            data = response.json()
-            players = data.get('data', [])
-            
-            peers = []
-            for player in players:
-                if player.get('games', 0) >= min_games:
-                    games = player.get('games', 1)
-                    stats = {
-                        'name': player.get('playerName'),
-                        'team': player.get('team', 'UNK'),
-                        'games': games,
-                        'min': player.get('minutesPg', 0),
-                        'pts': player.get('points', 0) / games,
-                        'ast': player.get('assists', 0) / games,
-                        'reb': player.get('rebounds', 0) / games,
-                        'tov': player.get('turnovers', 0) / games,
-                        'fga': player.get('fieldAttempts', 0) / games,
-                        'fta': player.get('ftAttempts', 0) / games
-                    }
-                    stats['tusg'] = calculate_tusg(stats, stats['team'], current_season)
-                    stats['pvr'] = calculate_pvr(stats)
-                    peers.append(stats)
-            
-            return peers
+        peers = []
+        for player in players:
+            games = player.get('games', 1)
+            stats = {
+                'name': player.get('playerName'),
+                'team': player.get('team', 'UNK'),
+                'games': games,
+                'min': player.get('minutes', 0),
+                'pts': player.get('points', 0) / games,
+                'ast': player.get('assists', 0) / games,
+                'reb': player.get('rebounds', 0) / games,
+                'tov': player.get('turnovers', 0) / games,
+                'fga': player.get('fieldAttempts', 0) / games,
+                'fta': player.get('ftAttempts', 0) / games
+            }
+            stats['tusg'] = calculate_tusg(stats, stats['team'], current_season)
+            stats['pvr'] = calculate_pvr(stats)
+            peers.append(stats)
+        
+        return peers
     except Exception as e:
         print(f"Error fetching position peers: {e}")
         return []
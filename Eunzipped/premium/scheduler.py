@@ -17,6 +17,7 @@ from premium.daily_edge_report import generate_pdf_report as generate_edge_repor
 from premium.daily_report import generate_pdf_report
 from premium.player_deepdive import get_featured_player_of_week, fetch_player_career_stats, generate_player_deepdive_pdf
 from premium.underrated_stars import generate_weekly_report
+from core.warehouse import FIRST_SEASON, CURRENT_SEASON, get_warehouse
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -114,6 +115,29 @@ def generate_weekly_underrated_stars_job():
         traceback.print_exc()
         return None
 
+def ingest_player_warehouse_job():
+    """
+    Job that runs nightly to bring the local player-season warehouse up to date
+    (completed seasons are only fetched once; unchanged pages are not rewritten)
+    """
+    try:
+        logger.info(f"🕐 Starting nightly player warehouse ingest")
+        
+        results = get_warehouse().ingest(range(FIRST_SEASON, CURRENT_SEASON + 1))
+        changed = sum(r.get('changed_pages', 0) for r in results)
+        failed = [r['season'] for r in results if 'error' in r]
+        
+        logger.info(f"✅ Player warehouse ingest complete: {changed} pages changed")
+        if failed:
+            logger.warning(f"⚠️ Player warehouse seasons failed: {failed}")
+        
+        return results
+    except Exception as e:
+        logger.error(f"❌ Error ingesting player warehouse: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
 def start_scheduler():
     """
     Start the APScheduler background scheduler
@@ -156,6 +180,15 @@ def start_scheduler():
         replace_existing=True
     )
     
+    # Refresh the player-season warehouse every night at 4:00 AM, before the reports run
+    scheduler.add_job(
+        ingest_player_warehouse_job,
+        trigger=CronTrigger(hour=4, minute=0),
+        id='player_warehouse_ingest_4am',
+        name='Player Warehouse Nightly Ingest',
+        replace_existing=True
+    )
+    
     scheduler.start()
     
     logger.info("⏰ Schedulers started:")
@@ -163,6 +196,7 @@ def start_scheduler():
     logger.info("   - Daily Report (Legacy): 6:00 AM daily")
     logger.info("   - Weekly Player Deep Dive: 9:00 AM every Monday")
     logger.info("   - Weekly Underrated Stars Report: 10:00 AM every Friday")
+    logger.info("   - Player Warehouse Ingest: 4:00 AM daily")
     
     return scheduler
 
@@ -3,12 +3,15 @@ TAYLOR VECTOR TERMINAL - Season Prediction Engine
 Predicts team wins, awards, and breakout players using TUSG% and PVR
 """
 
-import requests
+import sys
 import json
 import os
 from datetime import datetime
 from statistics import mean, stdev
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.warehouse import get_warehouse
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 TEAM_PACE = {
@@ -81,53 +84,29 @@ def calculate_player_pvr(player_stats):
 def fetch_all_players(season=2025):
     """Fetch all NBA players from API with their stats"""
     all_stats = []
-    page = 1
-    page_size = 100
     
     try:
-        while True:
-            url = f"https://api.server.nbaapi.com/api/playertotals?season={season}&pageSize={page_size}&page={page}"
-            response = requests.get(url, timeout=15)
+        for player in get_warehouse().season(season, min_games=1):
+            games = player.get('games', 0)
+            # API returns TOTAL stats, need to convert to per game
+            mpg = player.get('minutes', 0)  # minutesPg is already per game, parsed at ingestion
             
-            if response.status_code == 200:
-                data = response.json()
-                players = data.get('data', [])
-                
-                if not players:
-                    break
-                
-                for player in players:
-                    games = player.get('games', 0)
-                    if games == 0:
-                        continue
-                    
-                    # API returns TOTAL stats, need to convert to per game
-                    total_minutes = player.get('minutesPg', 0)  # Misleading name - it's actually total
-                    mpg = total_minutes / games if games > 0 else 0
-                    
-                    stats = {
-                        'player_id': player.get('slug'),
-                        'player_name': player.get('playerName'),
-                        'team': player.get('team'),
-                        'games_played': games,
-                        'min': mpg,  # Now correctly in minutes per game
-                        'pts': player.get('points', 0) / games,
-                        'ast': player.get('assists', 0) / games,
-                        'reb': player.get('rebounds', 0) / games,
-                        'stl': player.get('steals', 0) / games,
-                        'blk': player.get('blocks', 0) / games,
-                        'tov': player.get('turnovers', 0) / games,
-                        'fga': player.get('fieldAttempts', 0) / games,
-                        'fta': player.get('ftAttempts', 0) / games
-                    }
-                    all_stats.append(stats)
-                
-                if len(players) < page_size:
-                    break
-                
-                page += 1
-            else:
-                break
+            stats = {
+                'player_id': player.get('slug'),
+                'player_name': player.get('playerName'),
+                'team': player.get('team'),
+                'games_played': games,
+                'min': mpg,  # Now correctly in minutes per game
+                'pts': player.get('points', 0) / games,
+                'ast': player.get('assists', 0) / games,
+                'reb': player.get('rebounds', 0) / games,
+                'stl': player.get('steals', 0) / games,
+                'blk': player.get('blocks', 0) / games,
+                'tov': player.get('turnovers', 0) / games,
+                'fga': player.get('fieldAttempts', 0) / games,
+                'fta': player.get('ftAttempts', 0) / games
+            }
+            all_stats.append(stats)
         
         print(f"✅ Fetched {len(all_stats)} players for season {season}")
         return all_stats
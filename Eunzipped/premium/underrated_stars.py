@@ -11,13 +11,16 @@ Underrated Score = (PVR / TUSG%) × (Minutes Potential)
 Minutes Potential = (30 - MPG) → higher when player gets fewer minutes
 """
 
-import requests
+import sys
 import json
 import os
 import time
 import logging
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.warehouse import get_warehouse
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -36,53 +39,28 @@ TEAM_PACE = {
 def get_player_season_averages(season=2025):
     """Fetch current season averages from FREE nbaStats API (NO KEY REQUIRED)"""
     all_stats = []
-    page = 1
-    page_size = 100
     
     try:
         logger.info(f"Fetching player season averages for {season} season...")
         
-        while True:
-            url = f"https://api.server.nbaapi.com/api/playertotals?season={season}&pageSize={page_size}&page={page}"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                players = data.get('data', [])
-                
-                if not players:
-                    break
-                
-                for player in players:
-                    games = player.get('games', 0)
-                    if games == 0:
-                        continue
-                    
-                    stats = {
-                        'player_id': player.get('slug'),
-                        'player_name': player.get('playerName'),
-                        'team': player.get('team'),
-                        'games_played': games,
-                        'min': player.get('minutesPg', 0),
-                        'pts': player.get('points', 0) / games,
-                        'ast': player.get('assists', 0) / games,
-                        'tov': player.get('turnovers', 0) / games,
-                        'fga': player.get('fieldAttempts', 0) / games,
-                        'fta': player.get('ftAttempts', 0) / games,
-                        'reb': player.get('totalRb', 0) / games,
-                        'stl': player.get('steals', 0) / games,
-                        'blk': player.get('blocks', 0) / games
-                    }
-                    all_stats.append(stats)
-                
-                if len(players) < page_size:
-                    break
-                
-                page += 1
-                time.sleep(0.3)
-            else:
-                logger.error(f"❌ nbaStats API failed: {response.status_code}")
-                break
+        for player in get_warehouse().season(season, min_games=1):
+            games = player.get('games', 0)
+            stats = {
+                'player_id': player.get('slug'),
+                'player_name': player.get('playerName'),
+                'team': player.get('team'),
+                'games_played': games,
+                'min': player.get('minutes', 0),
+                'pts': player.get('points', 0) / games,
+                'ast': player.get('assists', 0) / games,
+                'tov': player.get('turnovers', 0) / games,
+                'fga': player.get('fieldAttempts', 0) / games,
+                'fta': player.get('ftAttempts', 0) / games,
+                'reb': player.get('totalRb', 0) / games,
+                'stl': player.get('steals', 0) / games,
+                'blk': player.get('blocks', 0) / games
+            }
+            all_stats.append(stats)
         
         logger.info(f"✅ Loaded {len(all_stats)} player season averages")
         return all_stats
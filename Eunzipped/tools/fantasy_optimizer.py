@@ -3,11 +3,14 @@ TAYLOR VECTOR TERMINAL - Fantasy Basketball Optimizer
 Fantasy advice tool using TUSG%/PVR for draft/trade decisions
 """
 
-import requests
+import sys
 import json
-import time
+import os
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.warehouse import get_warehouse
+
 TEAM_PACE = {
     'ATL': 101.8, 'BOS': 99.3, 'BKN': 100.5, 'CHA': 99.8, 'CHI': 98.5, 'CLE': 97.2,
     'DAL': 99.1, 'DEN': 98.8, 'DET': 100.2, 'GSW': 100.9, 'HOU': 101.2, 'IND': 100.6,
@@ -21,58 +24,33 @@ def fetch_current_players(season=2025):
     Fetch current season player stats from nbaStats API
     """
     all_stats = []
-    page = 1
-    page_size = 100
     
     print(f"🔄 Fetching 2024-25 season stats from nbaStats API...")
     
     try:
-        while True:
-            url = f"https://api.server.nbaapi.com/api/playertotals?season={season}&pageSize={page_size}&page={page}"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                players = data.get('data', [])
-                
-                if not players:
-                    break
-                
-                for player in players:
-                    games = player.get('games', 0)
-                    if games == 0:
-                        continue
-                    
-                    stats = {
-                        'player_id': player.get('slug'),
-                        'player_name': player.get('playerName'),
-                        'team': player.get('team'),
-                        'games_played': games,
-                        'mpg': player.get('minutesPg', 0),
-                        'ppg': player.get('points', 0) / games,
-                        'apg': player.get('assists', 0) / games,
-                        'rpg': player.get('rebounds', 0) / games,
-                        'spg': player.get('steals', 0) / games,
-                        'bpg': player.get('blocks', 0) / games,
-                        'tov': player.get('turnovers', 0) / games,
-                        'fga': player.get('fieldAttempts', 0) / games,
-                        'fgm': player.get('fieldGoals', 0) / games,
-                        'fg_pct': (player.get('fieldGoals', 0) / player.get('fieldAttempts', 1)) if player.get('fieldAttempts', 0) > 0 else 0,
-                        'fta': player.get('ftAttempts', 0) / games,
-                        'ftm': player.get('freeThrows', 0) / games,
-                        'ft_pct': (player.get('freeThrows', 0) / player.get('ftAttempts', 1)) if player.get('ftAttempts', 0) > 0 else 0,
-                        'tpm': player.get('threesMade', 0) / games
-                    }
-                    all_stats.append(stats)
-                
-                if len(players) < page_size:
-                    break
-                
-                page += 1
-                time.sleep(0.3)
-            else:
-                print(f"❌ nbaStats API failed: {response.status_code}")
-                break
+        for player in get_warehouse().season(season, min_games=1):
+            games = player.get('games', 0)
+            stats = {
+                'player_id': player.get('slug'),
+                'player_name': player.get('playerName'),
+                'team': player.get('team'),
+                'games_played': games,
+                'mpg': player.get('minutes', 0),
+                'ppg': player.get('points', 0) / games,
+                'apg': player.get('assists', 0) / games,
+                'rpg': player.get('rebounds', 0) / games,
+                'spg': player.get('steals', 0) / games,
+                'bpg': player.get('blocks', 0) / games,
+                'tov': player.get('turnovers', 0) / games,
+                'fga': player.get('fieldAttempts', 0) / games,
+                'fgm': player.get('fieldGoals', 0) / games,
+                'fg_pct': (player.get('fieldGoals', 0) / player.get('fieldAttempts', 1)) if player.get('fieldAttempts', 0) > 0 else 0,
+                'fta': player.get('ftAttempts', 0) / games,
+                'ftm': player.get('freeThrows', 0) / games,
+                'ft_pct': (player.get('freeThrows', 0) / player.get('ftAttempts', 1)) if player.get('ftAttempts', 0) > 0 else 0,
+                'tpm': player.get('threesMade', 0) / games
+            }
+            all_stats.append(stats)
         
         print(f"✅ Loaded {len(all_stats)} players from 2024-25 season")
         return all_stats
@@ -5,6 +5,10 @@ Custom ranking system combining TUSG%, PVR, and Longevity
 
 import json
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.leaderboard import get_leaderboard
 
 LONGEVITY_DATA = {
     'Michael Jordan': 15,
@@ -25,10 +29,8 @@ LONGEVITY_DATA = {
 }
 
 def load_player_data():
-    """Load TUSG% and PVR data from JSON"""
-    data_path = os.path.join(os.path.dirname(__file__), '..', 'leaderboard', 'data', 'all_time_tusg.json')
-    with open(data_path, 'r') as f:
-        return json.load(f)
+    """Load TUSG% and PVR data (copies, since scoring adds keys to each player)"""
+    return [dict(row) for row in get_leaderboard().rows()]
 
 def normalize_values(values):
     """Normalize values to 0-100 scale"""
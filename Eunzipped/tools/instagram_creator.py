@@ -12,22 +12,24 @@ import json
 import os
 from datetime import datetime
 import io
+import sys
 
 BRAND_CYAN = '#00d4ff'
 BRAND_GREEN = '#00ff88'
 WATERMARK = 'TAYLOR VECTOR TERMINAL'
 
 script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(script_dir))
+from core.leaderboard import get_leaderboard
+
 OUTPUT_DIR = os.path.join(script_dir, 'instagram_output')
-LEADERBOARD_FILE = os.path.join(os.path.dirname(script_dir), 'leaderboard', 'data', 'all_time_tusg.json')
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 def load_leaderboard_data():
-    """Load historical player data"""
+    """Load historical player data (the shared in-memory copy, do not mutate)"""
     try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            return json.load(f)
+        return get_leaderboard().rows()
     except Exception as e:
         print(f"Error loading leaderboard: {e}")
         return []
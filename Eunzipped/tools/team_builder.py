@@ -5,12 +5,15 @@ Fantasy team constructor using salary cap and metric optimization
 
 import json
 import os
+import sys
 from typing import List, Dict, Tuple
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.leaderboard import get_leaderboard
+
 # Constants
 SALARY_CAP = 120_000_000  # $120M NBA standard
 ROSTER_SIZE = 5  # 5 players (positionless)
-LEADERBOARD_FILE = '../leaderboard/data/all_time_tusg.json'
 
 def load_players_with_salaries() -> List[Dict]:
     """
@@ -22,11 +25,7 @@ def load_players_with_salaries() -> List[Dict]:
     - Era adjustment (modern players get slight premium)
     - Superstar premium for elite PVR
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    leaderboard_path = os.path.join(script_dir, LEADERBOARD_FILE)
-    
-    with open(leaderboard_path, 'r') as f:
-        leaderboard = json.load(f)
+    leaderboard = get_leaderboard().rows()
     
     players = []
     
@@ -3,11 +3,14 @@ TAYLOR VECTOR TERMINAL - Trade Impact Calculator
 Analyzes how trades affect team TUSG% and PVR metrics
 """
 
-import requests
+import sys
 import json
-import time
+import os
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.warehouse import get_warehouse
+
 TEAM_PACE = {
     'ATL': 101.8, 'BOS': 99.3, 'BKN': 100.5, 'CHA': 99.8, 'CHI': 98.5, 'CLE': 97.2,
     'DAL': 99.1, 'DEN': 98.8, 'DET': 100.2, 'GSW': 100.9, 'HOU': 101.2, 'IND': 100.6,
@@ -35,50 +38,25 @@ def fetch_current_rosters(season=2025):
     Returns dictionary of players by team
     """
     all_stats = []
-    page = 1
-    page_size = 100
     
     print(f"🔄 Fetching 2024-25 season rosters from nbaStats API...")
     
     try:
-        while True:
-            url = f"https://api.server.nbaapi.com/api/playertotals?season={season}&pageSize={page_size}&page={page}"
-            response = requests.get(url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                players = data.get('data', [])
-                
-                if not players:
-                    break
-                
-                for player in players:
-                    games = player.get('games', 0)
-                    if games == 0:
-                        continue
-                    
-                    stats = {
-                        'player_id': player.get('slug'),
-                        'player_name': player.get('playerName'),
-                        'team': player.get('team'),
-                        'games_played': games,
-                        'min': player.get('minutesPg', 0),
-                        'pts': player.get('points', 0) / games,
-                        'ast': player.get('assists', 0) / games,
-                        'tov': player.get('turnovers', 0) / games,
-                        'fga': player.get('fieldAttempts', 0) / games,
-                        'fta': player.get('ftAttempts', 0) / games
-                    }
-                    all_stats.append(stats)
-                
-                if len(players) < page_size:
-                    break
-                
-                page += 1
-                time.sleep(0.3)
-            else:
-                print(f"❌ nbaStats API failed: {response.status_code}")
-                break
+        for player in get_warehouse().season(season, min_games=1):
+            games = player.get('games', 0)
+            stats = {
+                'player_id': player.get('slug'),
+                'player_name': player.get('playerName'),
+                'team': player.get('team'),
+                'games_played': games,
+                'min': player.get('minutes', 0),
+                'pts': player.get('points', 0) / games,
+                'ast': player.get('assists', 0) / games,
+                'tov': player.get('turnovers', 0) / games,
+                'fga': player.get('fieldAttempts', 0) / games,
+                'fta': player.get('ftAttempts', 0) / games
+            }
+            all_stats.append(stats)
         
         print(f"✅ Loaded {len(all_stats)} players from 2024-25 season")
         
@@ -3,18 +3,35 @@ TAYLOR VECTOR TERMINAL - Live Web Dashboard
 Real-time betting edge monitoring and metrics visualization
 """
 
-from flask import Flask, render_template, jsonify, request, send_from_directory, session, redirect, url_for, make_response
+from flask import Flask, render_template, jsonify, request, send_from_directory, session, redirect, url_for, make_response, Response
 import sqlite3
 import os
 import sys
 import json
-import requests
 import time
 from datetime import datetime
 
-sys.path.append('..')
-sys.path.append('../api')
-sys.path.append('../premium')
+# Resolve the terminal's folder from this file, not the working directory: web/ ships inside
+# it (DEPLOYMENT_GUIDE) but sits beside it, next to Eunzipped/, in the exported tree
+WEB_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(WEB_DIR)
+if not os.path.isdir(os.path.join(PROJECT_ROOT, 'core')):
+    PROJECT_ROOT = os.path.join(PROJECT_ROOT, 'Eunzipped')
+sys.path.append(PROJECT_ROOT)
+sys.path.append(os.path.join(PROJECT_ROOT, 'api'))
+sys.path.append(os.path.join(PROJECT_ROOT, 'premium'))
+
+from core.db import get_connection
+from core.http_client import http_get
+from core.ingest import fetch_batches_concurrent
+from core.leaderboard import get_leaderboard
+from core.line_store import LineStore
+from core.minutes import malformed_summary, normalize_minutes
+from core.pick_stream import (HEARTBEAT_INTERVAL, MAX_STREAM_AGE, PickStream, is_live, read_pick_summary,
+                              recent_picks, sse_message, summary_stats)
+from core.rate_limiter import host_limiter
+from core.refresher import BackgroundRefresher
+from core.snapshot_cache import SnapshotCache
 
 # Commenting out premium_api import so the Flask app can start without premium package
 # from premium_api import api_bp, init_api_database
@@ -61,9 +78,19 @@ app.secret_key = os.urandom(24)
 # init_api_database()
 # app.register_blueprint(api_bp, url_prefix='/api')
 
-DB_FILE = '../taylor_62.db'
-LEADERBOARD_FILE = '../leaderboard/data/all_time_tusg.json'
+DB_FILE = os.path.join(PROJECT_ROOT, 'taylor_62.db')
+TERMINAL_CACHE_DIR = os.path.join(PROJECT_ROOT, os.getenv('TERMINAL_CACHE_DIR', 'cache'))
+SCHEDULER_STATUS_FILE = os.path.join(TERMINAL_CACHE_DIR, 'scheduler.json')
+CYCLE_METRICS_FILE = os.path.join(TERMINAL_CACHE_DIR, 'cycle_metrics.json')
 BALLDONTLIE_API_KEY = os.getenv('BALLDONTLIE_API_KEY', 'eada3064-5b46-4fe0-948c-1771738e4021')
+BALLDONTLIE_BASE_URL = os.getenv('BALLDONTLIE_BASE_URL', 'https://www.balldontlie.io/api/v1')
+NBA_STATS_URL = os.getenv('NBA_STATS_URL', 'https://api.server.nbaapi.com/api/playertotals')
+PLAYER_CATALOG_REFRESH = float(os.getenv('PLAYER_CATALOG_REFRESH', '1800'))  # seconds
+# balldontlie season_averages: ids per request, parallel requests, requests/second, retry rounds
+BDL_BATCH_SIZE = 100
+BDL_MAX_WORKERS = int(os.getenv('BDL_MAX_WORKERS', '4'))
+BDL_RATE_LIMIT = float(os.getenv('BDL_RATE_LIMIT', '5'))
+BDL_BATCH_RETRIES = int(os.getenv('BDL_BATCH_RETRIES', '2'))
 
 TEAM_PACE = {
     'ATL': 101.8, 'BOS': 99.3, 'BKN': 100.5, 'CHA': 99.8, 'CHI': 98.5, 'CLE': 97.2,
@@ -75,10 +102,13 @@ TEAM_PACE = {
 
 def get_db_connection():
     """Get database connection"""
-    conn = sqlite3.connect(DB_FILE)
+    conn = get_connection(DB_FILE)
     conn.row_factory = sqlite3.Row
     return conn
 
+# Tails the terminal's pick_events log once per worker and pushes changes to every open dashboard
+pick_stream = PickStream(DB_FILE)
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -101,76 +131,97 @@ def add_header(response):
 def get_picks():
     """Get recent picks"""
     conn = get_db_connection()
-    picks = conn.execute('''
-        SELECT * FROM picks 
-        ORDER BY timestamp DESC 
-        LIMIT 50
-    ''').fetchall()
+    picks = recent_picks(conn)
     conn.close()
     
-    return jsonify([dict(pick) for pick in picks])
+    return jsonify(picks)
 
 @app.route('/api/stats')
 def get_stats():
     """Get overall statistics"""
     conn = get_db_connection()
-    
-    total_picks = conn.execute('SELECT COUNT(*) as count FROM picks').fetchone()['count']
-    avg_edge = conn.execute('SELECT AVG(edge) as avg FROM picks').fetchone()['avg']
-    highest_edge = conn.execute('SELECT MAX(edge) as max FROM picks').fetchone()['max']
-    recent_pick = conn.execute('SELECT * FROM picks ORDER BY timestamp DESC LIMIT 1').fetchone()
-    
+    summary = read_pick_summary(conn)
     conn.close()
     
-    return jsonify({
-        'total_picks': total_picks,
-        'avg_edge': round(avg_edge, 2) if avg_edge else 0,
-        'highest_edge': round(highest_edge, 2) if highest_edge else 0,
-        'last_updated': recent_pick['timestamp'] if recent_pick else None,
-        'status': 'LIVE'
-    })
+    return jsonify(summary_stats(summary))
 
 @app.route('/api/live')
 def get_live_status():
     """Check if terminal is running"""
     conn = get_db_connection()
-    recent = conn.execute('''
-        SELECT timestamp FROM picks 
-        ORDER BY timestamp DESC 
-        LIMIT 1
-    ''').fetchone()
+    summary = read_pick_summary(conn)
     conn.close()
     
-    is_live = False
-    if recent:
-        last_update = datetime.strptime(recent['timestamp'], '%Y-%m-%d %H:%M:%S')
-        time_diff = (datetime.now() - last_update).total_seconds()
-        is_live = time_diff < 120
+    return jsonify({'live': is_live(summary)})
+
+@app.route('/api/stream')
+def stream_updates():
+    """
+    Server-Sent Events: a snapshot on first connect, then 'pick', 'delete' and 'stats'
+    events as the terminal writes, plus a 'live' heartbeat. Reconnects resume from
+    Last-Event-ID; streams end after MAX_STREAM_AGE so workers are recycled. Past
+    STREAM_MAX_SUBSCRIBERS open streams new ones get a 503 and the dashboard polls instead.
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    last_event_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    subscription = pick_stream.subscribe(last_event_id)
+    if subscription is None:
+        return jsonify({
+            'error': 'Stream capacity reached',
+            'message': 'Too many open live streams, poll /api/picks and /api/stats instead',
+            'subscribers': pick_stream.subscriber_count()
+        }), 503, {'Retry-After': '60'}
+    
+    def events():
+        try:
+            yield 'retry: 3000\n\n'
+            deadline = time.monotonic() + MAX_STREAM_AGE
+            while time.monotonic() < deadline and not subscription.dropped:
+                message = subscription.get(timeout=HEARTBEAT_INTERVAL)
+                yield message if message is not None else sse_message('live', {'live': pick_stream.live()})
+        finally:
+            subscription.close()
     
-    return jsonify({'live': is_live})
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # nginx/Heroku routers must not buffer the stream
+    })
+
+@app.route('/api/line-movement/recent')
+def get_recent_line_movement():
+    """Latest line movements across the league"""
+    limit = min(request.args.get('limit', 100, type=int), 1000)
+    since = request.args.get('since', type=float)
+    return jsonify(LineStore(DB_FILE).latest_snapshots(limit, since))
+
+@app.route('/api/line-movement/<event_id>')
+def get_event_line_movement(event_id):
+    """Every stored line movement for one game"""
+    market = request.args.get('market', 'spreads')
+    return jsonify(LineStore(DB_FILE).movements_for_event(event_id, market))
+
+@app.route('/api/terminal/schedule')
+def get_terminal_schedule():
+    """Next planned odds poll and remaining request quota"""
+    try:
+        with open(SCHEDULER_STATUS_FILE, 'r') as f:
+            return jsonify(json.load(f))
+    except FileNotFoundError:
+        return jsonify({'error': 'Terminal has not planned a poll yet'}), 404
+
+@app.route('/api/terminal/metrics')
+def get_terminal_metrics():
+    """Per-stage cycle timings (p50/p95/p99) and recent cycle history for charting"""
+    try:
+        with open(CYCLE_METRICS_FILE, 'r') as f:
+            return jsonify(json.load(f))
+    except FileNotFoundError:
+        return jsonify({'error': 'Terminal has not completed a cycle yet'}), 404
 
 def calculate_player_tusg(player_stats, team_pace):
     """Calculate TUSG% for a player"""
     mp = player_stats.get('min', 0) or player_stats.get('mpg', 0)
-    
-    # Handle various minute formats from NBA API (MM:SS, MM:SS:hundredths, HH:MM:SS, or numeric)
-    try:
-        if isinstance(mp, str) and ':' in mp:
-            parts = mp.split(':')
-            if len(parts) == 3:
-                first = float(parts[0])
-                if first > 59:  # True HH:MM:SS format (hours exceed 59)
-                    mp = first * 60 + float(parts[1]) + float(parts[2]) / 60
-                else:  # MM:SS:hundredths format (e.g., "28:43:00" = 28 min, 43 sec)
-                    mp = first + float(parts[1]) / 60 + float(parts[2]) / 3600
-            elif len(parts) == 2:  # MM:SS format
-                mp = float(parts[0]) + float(parts[1]) / 60
-            else:
-                mp = 0.0
-        else:
-            mp = float(mp) if mp else 0.0
-    except (ValueError, AttributeError):
-        mp = 0.0  # Gracefully handle bad inputs
+    mp = float(mp) if mp else 0.0  # minutes strings are parsed once in get_current_players
     
     fga = player_stats.get('fga', 0)
     tov = player_stats.get('tov', 0)
@@ -224,11 +275,10 @@ def get_current_players():
         per_page = 100
         page = 1
         fetched = 0
-        bdl_player_ids = []
 
         while True:
-            url = f"https://www.balldontlie.io/api/v1/players?per_page={per_page}&page={page}"
-            resp = requests.get(url, timeout=10)
+            url = f"{BALLDONTLIE_BASE_URL}/players?per_page={per_page}&page={page}"
+            resp = http_get(url, timeout=10)
             if resp.status_code != 200:
                 break
             data = resp.json()
@@ -255,7 +305,6 @@ def get_current_players():
                     'tusg': 0,
                     'pvr': 0
                 })
-                bdl_player_ids.append(pid)
                 fetched += 1
                 if fetched >= 500:
                     break
@@ -268,7 +317,7 @@ def get_current_players():
 
         # Fetch internal season averages first (preferred), fall back to balldontlie season_averages
         season = int(os.getenv('SEASON_YEAR', datetime.now().year))
-        internal_url = os.getenv('INTERNAL_STATS_URL', 'https://api.server.nbaapi.com/api/playertotals')
+        internal_url = os.getenv('INTERNAL_STATS_URL', NBA_STATS_URL)
         internal_map = {}
 
         try:
@@ -276,7 +325,7 @@ def get_current_players():
             page = 1
             page_size = 200
             while True:
-                resp = requests.get(f"{internal_url}?season={season}&pageSize={page_size}&page={page}", timeout=12)
+                resp = http_get(f"{internal_url}?season={season}&pageSize={page_size}&page={page}", timeout=12)
                 if resp.status_code != 200:
                     break
                 data = resp.json()
@@ -300,26 +349,43 @@ def get_current_players():
             # ignore internal API failures and fallback to balldontlie-only
             internal_map = {}
 
+        # Parse every internal minutes string in one pass ('minutes' is float minutes per game)
+        internal_rows = list(internal_map.values())
+        malformed = normalize_minutes(internal_rows)
+        if malformed.any():
+            app.logger.warning(f"get_current_players: malformed minutes counted as 0: "
+                               f"{malformed_summary(internal_rows, malformed)}")
+
         # Now fetch balldontlie season averages in batches to fill any remaining players
         bdl_stats_map = {}
-        if bdl_player_ids:
-            batch_size = 100
-            for i in range(0, len(bdl_player_ids), batch_size):
-                batch_ids = bdl_player_ids[i:i+batch_size]
-                params = [('season', season)] + [(f'player_ids[]', str(x)) for x in batch_ids]
-                stats_url = 'https://www.balldontlie.io/api/v1/season_averages'
-                try:
-                    resp = requests.get(stats_url, params=params, timeout=10)
-                    if resp.status_code != 200:
-                        continue
-                    data = resp.json().get('data', [])
-                    for s in data:
-                        pid = s.get('player_id')
-                        bdl_stats_map[pid] = s
-                except Exception:
-                    continue
+        # Only players the internal stats didn't cover need balldontlie averages
+        missing_ids = [p['bdl_id'] for p in players if p['name'].strip().lower() not in internal_map]
+        batches = [missing_ids[i:i + BDL_BATCH_SIZE] for i in range(0, len(missing_ids), BDL_BATCH_SIZE)]
+        failed_batches = []
+        if batches:
+            stats_url = f'{BALLDONTLIE_BASE_URL}/season_averages'
+
+            def fetch_season_averages(batch_ids):
+                params = [('season', season)] + [('player_ids[]', str(x)) for x in batch_ids]
+                resp = http_get(stats_url, params=params, timeout=10)
+                if resp.status_code != 200:
+                    raise RuntimeError(f"season_averages failed: {resp.status_code}")
+                return resp.json().get('data', [])
+
+            # All batches in flight at once (bounded by the pool and the host's rate limit)
+            averages, failed_batches = fetch_batches_concurrent(
+                fetch_season_averages, batches,
+                max_workers=BDL_MAX_WORKERS,
+                limiter=host_limiter(stats_url, BDL_RATE_LIMIT, burst=BDL_MAX_WORKERS),
+                retries=BDL_BATCH_RETRIES
+            )
+            for s in averages:
+                bdl_stats_map[s.get('player_id')] = s
+        # balldontlie 'min' is an "MM:SS" string too
+        normalize_minutes(list(bdl_stats_map.values()), source='min', target='min')
 
         enriched = 0
+        from_internal = 0
         # Merge stats into player objects, preferring internal API by player name, else balldontlie
         for p in players:
             name = p.get('name', '').strip().lower()
@@ -327,8 +393,9 @@ def get_current_players():
             # prefer internal mapping by name
             if name and name in internal_map:
                 used_stats = internal_map[name]
+                from_internal += 1
                 # internal API uses different keys; normalize
-                mpg = used_stats.get('minutesPg') or used_stats.get('min') or 0
+                mpg = used_stats.get('minutes', 0)
                 pts = (used_stats.get('points') or 0)
                 ast = (used_stats.get('assists') or 0)
                 tov = (used_stats.get('turnovers') or 0)
@@ -381,10 +448,14 @@ def get_current_players():
                 p['pvr'] = pvr_val
                 enriched += 1
 
+        summary = (f"get_current_players: fetched {len(players)} players, enriched {enriched} with season stats "
+                   f"({from_internal} internal, {enriched - from_internal} balldontlie), "
+                   f"{len(players) - enriched} missing; "
+                   f"{len(failed_batches)}/{len(batches)} season_averages batches failed")
         try:
-            app.logger.info(f"get_current_players: fetched {len(players)} players, enriched {enriched} with season stats")
+            app.logger.info(summary)
         except Exception:
-            print(f"get_current_players: fetched {len(players)} players, enriched {enriched} with season stats")
+            print(summary)
 
     except Exception as e:
         print(f"Error fetching current players: {e}")
@@ -396,10 +467,7 @@ def get_historical_players():
     players = []
     
     try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            leaderboard = json.load(f)
-        
-        for player in leaderboard:
+        for player in get_leaderboard().rows():
             players.append({
                 'id': f"historical_{player['player'].replace(' ', '_')}_{player['season']}",
                 'name': player['player'],
@@ -435,8 +503,7 @@ def cross_era_page():
 def get_cross_era_players():
     """Get all historical players with full stats for cross-era comparison"""
     try:
-        with open(LEADERBOARD_FILE, 'r') as f:
-            leaderboard = json.load(f)
+        leaderboard = get_leaderboard().rows()
         
         return jsonify({
             'players': leaderboard,
@@ -445,22 +512,61 @@ def get_cross_era_players():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def build_player_catalog():
+    """Current + historical players sorted by name (slow: pages every upstream)"""
+    all_players = get_current_players() + get_historical_players()
+    all_players.sort(key=lambda x: x['name'])
+    return all_players
+
+# Refreshed in the background and shared by all gunicorn workers through the cache dir,
+# so comparison requests never wait on the upstream APIs
+player_catalog = BackgroundRefresher(
+    SnapshotCache('player_catalog', build_player_catalog, cache_dir=TERMINAL_CACHE_DIR),
+    interval=PLAYER_CATALOG_REFRESH
+).start()
+
+# (catalog version, {player id: player}) rebuilt only when a refresh changes the catalog
+_catalog_index = (None, {})
+
+def catalog_index():
+    """O(1) id lookup over the current catalog snapshot"""
+    global _catalog_index
+    snapshot = player_catalog.snapshot()
+    version, by_id = _catalog_index
+    if version != snapshot['version']:
+        # Reversed so a duplicated id resolves to its first catalog entry, as the old scan did
+        by_id = {player['id']: player for player in reversed(snapshot['data'] or [])}
+        _catalog_index = (snapshot['version'], by_id)
+    return by_id
+
+def catalog_status(snapshot):
+    """Freshness fields returned alongside catalog data"""
+    return {key: snapshot[key] for key in ('refreshed_at', 'stale_at', 'stale', 'refreshing')}
+
 @app.route('/api/comparison/players')
 def get_all_players():
     """Get all players (current + historical) for comparison"""
-    try:
-        current = get_current_players()
-        historical = get_historical_players()
-        
-        all_players = current + historical
-        all_players.sort(key=lambda x: x['name'])
-        
+    snapshot = player_catalog.snapshot()
+    all_players = snapshot['data'] or []
+    
+    return jsonify({
+        'players': all_players,
+        'count': len(all_players),
+        **catalog_status(snapshot)
+    })
+
+@app.route('/api/comparison/players/refresh', methods=['POST'])
+def refresh_player_catalog():
+    """Rebuild the player catalog now instead of at the next interval (rate limited)"""
+    if not player_catalog.request_refresh():
+        retry_after = int(player_catalog.cooldown_remaining()) + 1
         return jsonify({
-            'players': all_players,
-            'count': len(all_players)
-        })
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+            'error': 'Refresh cooldown',
+            'message': f'The player catalog was refreshed recently, retry in {retry_after}s',
+            'retry_after': retry_after,
+            **catalog_status(player_catalog.snapshot())
+        }), 429, {'Retry-After': str(retry_after)}
+    return jsonify(catalog_status(player_catalog.snapshot())), 202
 
 @app.route('/api/comparison/compare', methods=['POST'])
 def compare_players():
@@ -473,10 +579,9 @@ def compare_players():
         if not player1_id or not player2_id:
             return jsonify({'error': 'Both player IDs required'}), 400
         
-        all_players = get_current_players() + get_historical_players()
-        
-        player1 = next((p for p in all_players if p['id'] == player1_id), None)
-        player2 = next((p for p in all_players if p['id'] == player2_id), None)
+        by_id = catalog_index()
+        player1 = by_id.get(player1_id)
+        player2 = by_id.get(player2_id)
         
         if not player1 or not player2:
             return jsonify({'error': 'One or both players not found'}), 404
@@ -1598,7 +1703,7 @@ def portal_dashboard(slug):
     
     member_id = session['member_id']
     
-    conn = sqlite3.connect('../premium/consulting_groups.db')
+    conn = get_connection('../premium/consulting_groups.db')
     conn.row_factory = sqlite3.Row
     member = conn.execute('SELECT * FROM members WHERE id = ?', (member_id,)).fetchone()
     conn.close()
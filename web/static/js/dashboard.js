@@ -1,74 +1,103 @@
 // TAYLOR VECTOR TERMINAL - Dashboard JavaScript
 
+const POLL_INTERVAL = 10000;       // polling fallback when the event stream is unavailable
+const STREAM_RETRY_DELAY = 60000;  // how long to poll before trying the stream again
+const MAX_PICKS = 50;
+
 let updateInterval;
+let eventSource;
+let picks = [];
+
+function renderStats(stats) {
+    document.getElementById('total-picks').textContent = stats.total_picks || 0;
+    document.getElementById('avg-edge').textContent = stats.avg_edge ? `${stats.avg_edge}%` : '--';
+    document.getElementById('highest-edge').textContent = stats.highest_edge ? `${stats.highest_edge}%` : '--';
+    
+    if (stats.last_updated) {
+        const date = new Date(stats.last_updated);
+        document.getElementById('last-update').textContent = `Last Update: ${date.toLocaleString()}`;
+    }
+}
 
 // Fetch and update stats
 async function updateStats() {
     try {
         const response = await fetch('/api/stats');
-        const stats = await response.json();
-        
-        document.getElementById('total-picks').textContent = stats.total_picks || 0;
-        document.getElementById('avg-edge').textContent = stats.avg_edge ? `${stats.avg_edge}%` : '--';
-        document.getElementById('highest-edge').textContent = stats.highest_edge ? `${stats.highest_edge}%` : '--';
-        
-        if (stats.last_updated) {
-            const date = new Date(stats.last_updated);
-            document.getElementById('last-update').textContent = `Last Update: ${date.toLocaleString()}`;
-        }
+        renderStats(await response.json());
     } catch (error) {
         console.error('Error fetching stats:', error);
     }
 }
 
+function signed(value) {
+    return `${value > 0 ? '+' : ''}${value}`;
+}
+
+// The number a pick was made at: the spread, the total, or the moneyline price
+function pickLine(pick) {
+    if (pick.market === 'h2h') {
+        return { label: 'Price', value: pick.price != null ? signed(pick.price) : '--' };
+    }
+    if (pick.market === 'totals') {
+        return { label: 'Total', value: pick.spread != null ? pick.spread : '--' };
+    }
+    return { label: 'Spread', value: pick.spread != null ? signed(pick.spread) : '--' };
+}
+
+function renderPicks() {
+    const container = document.getElementById('picks-container');
+    
+    if (picks.length === 0) {
+        container.innerHTML = '<div class="no-picks">No edges found yet. System is monitoring...</div>';
+        return;
+    }
+    
+    container.innerHTML = picks.map(pick => {
+        const line = pickLine(pick);
+        return `
+        <div class="pick-card">
+            <div class="pick-header">
+                <div class="game-matchup">🔥 ${pick.game}</div>
+                <div class="edge-badge">${pick.edge.toFixed(1)}% EDGE</div>
+            </div>
+            <div class="pick-details">
+                <div class="detail-item">
+                    <div class="detail-label">Pick</div>
+                    <div class="detail-value">${pick.pick}</div>
+                </div>
+                <div class="detail-item">
+                    <div class="detail-label">Home TUSG%</div>
+                    <div class="detail-value">${pick.home_tusg.toFixed(1)}</div>
+                </div>
+                <div class="detail-item">
+                    <div class="detail-label">Away TUSG%</div>
+                    <div class="detail-value">${pick.away_tusg.toFixed(1)}</div>
+                </div>
+                <div class="detail-item">
+                    <div class="detail-label">Home PVR</div>
+                    <div class="detail-value">${pick.home_pvr.toFixed(1)}</div>
+                </div>
+                <div class="detail-item">
+                    <div class="detail-label">Away PVR</div>
+                    <div class="detail-value">${pick.away_pvr.toFixed(1)}</div>
+                </div>
+                <div class="detail-item">
+                    <div class="detail-label">${line.label}</div>
+                    <div class="detail-value">${line.value}</div>
+                </div>
+            </div>
+            <div class="pick-timestamp">${new Date(pick.timestamp).toLocaleString()}</div>
+        </div>
+    `;
+    }).join('');
+}
+
 // Fetch and display picks
 async function updatePicks() {
     try {
         const response = await fetch('/api/picks');
-        const picks = await response.json();
-        
-        const container = document.getElementById('picks-container');
-        
-        if (picks.length === 0) {
-            container.innerHTML = '<div class="no-picks">No edges found yet. System is monitoring...</div>';
-            return;
-        }
-        
-        container.innerHTML = picks.map(pick => `
-            <div class="pick-card">
-                <div class="pick-header">
-                    <div class="game-matchup">🔥 ${pick.game}</div>
-                    <div class="edge-badge">${pick.edge.toFixed(1)}% EDGE</div>
-                </div>
-                <div class="pick-details">
-                    <div class="detail-item">
-                        <div class="detail-label">Pick</div>
-                        <div class="detail-value">${pick.pick}</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="detail-label">Home TUSG%</div>
-                        <div class="detail-value">${pick.home_tusg.toFixed(1)}</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="detail-label">Away TUSG%</div>
-                        <div class="detail-value">${pick.away_tusg.toFixed(1)}</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="detail-label">Home PVR</div>
-                        <div class="detail-value">${pick.home_pvr.toFixed(1)}</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="detail-label">Away PVR</div>
-                        <div class="detail-value">${pick.away_pvr.toFixed(1)}</div>
-                    </div>
-                    <div class="detail-item">
-                        <div class="detail-label">Spread</div>
-                        <div class="detail-value">${pick.spread > 0 ? '+' : ''}${pick.spread}</div>
-                    </div>
-                </div>
-                <div class="pick-timestamp">${new Date(pick.timestamp).toLocaleString()}</div>
-            </div>
-        `).join('');
+        picks = await response.json();
+        renderPicks();
     } catch (error) {
         console.error('Error fetching picks:', error);
         document.getElementById('picks-container').innerHTML = 
@@ -76,37 +105,111 @@ async function updatePicks() {
     }
 }
 
+// Insert or replace a pick pushed by the stream, keeping the newest MAX_PICKS
+function upsertPick(pick) {
+    picks = picks.filter(existing => existing.id !== pick.id);
+    picks.push(pick);
+    picks.sort((a, b) => (b.timestamp || '').localeCompare(a.timestamp || ''));
+    picks = picks.slice(0, MAX_PICKS);
+}
+
+function renderLiveStatus(live) {
+    const statusBadge = document.getElementById('live-status');
+    if (live) {
+        statusBadge.textContent = '● LIVE';
+        statusBadge.className = 'status-badge live';
+    } else {
+        statusBadge.textContent = '● OFFLINE';
+        statusBadge.className = 'status-badge offline';
+    }
+}
+
 // Check live status
 async function updateLiveStatus() {
     try {
         const response = await fetch('/api/live');
         const data = await response.json();
-        
-        const statusBadge = document.getElementById('live-status');
-        if (data.live) {
-            statusBadge.textContent = '● LIVE';
-            statusBadge.className = 'status-badge live';
-        } else {
-            statusBadge.textContent = '● OFFLINE';
-            statusBadge.className = 'status-badge offline';
-        }
+        renderLiveStatus(data.live);
     } catch (error) {
         console.error('Error checking live status:', error);
     }
 }
 
-// Initialize dashboard
-function init() {
+function refreshAll() {
     updateStats();
     updatePicks();
     updateLiveStatus();
+}
+
+function startPolling() {
+    if (updateInterval) return;
+    refreshAll();
+    updateInterval = setInterval(refreshAll, POLL_INTERVAL);
+}
+
+function stopPolling() {
+    clearInterval(updateInterval);
+    updateInterval = null;
+}
+
+// Push updates over Server-Sent Events; the browser reconnects with Last-Event-ID on its own
+function connectStream() {
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    
+    let opened = false;
+    eventSource = new EventSource('/api/stream');
+    
+    eventSource.onopen = () => {
+        opened = true;
+        stopPolling();
+    };
+    
+    eventSource.addEventListener('snapshot', event => {
+        const data = JSON.parse(event.data);
+        picks = data.picks;
+        renderPicks();
+        renderStats(data.stats);
+        renderLiveStatus(data.live);
+    });
+    
+    eventSource.addEventListener('pick', event => {
+        upsertPick(JSON.parse(event.data));
+        renderPicks();
+    });
+    
+    eventSource.addEventListener('delete', event => {
+        const { id } = JSON.parse(event.data);
+        picks = picks.filter(pick => pick.id !== id);
+        renderPicks();
+    });
     
-    // Auto-refresh every 10 seconds
-    updateInterval = setInterval(() => {
-        updateStats();
-        updatePicks();
-        updateLiveStatus();
-    }, 10000);
+    eventSource.addEventListener('stats', event => {
+        const stats = JSON.parse(event.data);
+        renderStats(stats);
+        renderLiveStatus(stats.live);
+    });
+    
+    eventSource.addEventListener('live', event => {
+        renderLiveStatus(JSON.parse(event.data).live);
+    });
+    
+    eventSource.onerror = () => {
+        // A dropped stream reconnects by itself; one that never opened (proxy, old server, or a
+        // 503 because the server is at its stream limit) falls back to polling
+        if (!opened || eventSource.readyState === EventSource.CLOSED) {
+            eventSource.close();
+            startPolling();
+            setTimeout(connectStream, STREAM_RETRY_DELAY);
+        }
+    };
+}
+
+// Initialize dashboard
+function init() {
+    connectStream();
 }
 
 // Run on page load